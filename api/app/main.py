@@ -19,7 +19,9 @@ from starlette.staticfiles import StaticFiles
 from starlette_prometheus import PrometheusMiddleware, metrics
 
 # Local
+import bel.belspec.compiled
 import bel.core.settings as settings
+import bel.resources.normalization
 from bel.__version__ import __version__ as version
 from bel.api.core.middleware import StatsMiddleware
 from bel.api.endpoints.bel import router as bel_router
@@ -113,6 +115,31 @@ app.add_route("/metrics/", metrics)
 app.add_middleware(StatsMiddleware)
 
 
+###############################################################################
+# Startup
+###############################################################################
+@app.on_event("startup")
+def load_compiled_belspecs():
+    """Load compiled BEL Specifications instead of building them from ArangoDB"""
+
+    if settings.BEL_COMPILED_SPEC_DIR:
+        bel.belspec.compiled.load_compiled_belspecs(settings.BEL_COMPILED_SPEC_DIR)
+
+
+@app.on_event("startup")
+def check_normalized_terms():
+    """Warn if the normalized terms were computed for other canonicalization targets"""
+
+    try:
+        if bel.resources.normalization.normalized_terms_stale():
+            logger.warning(
+                "Normalized terms are for other canonicalization targets - normalizing terms at "
+                "request time until recomputed (see bel.resources.manage.update_normalized_terms)"
+            )
+    except Exception as e:
+        logger.error(f"Could not check normalized terms - error: {e}")
+
+
 if __name__ == "__main__":
     # Third Party
     import dotenv
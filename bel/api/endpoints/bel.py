@@ -32,7 +32,7 @@ def get_bel_canonicalize(bel_assertion: str, version: str = "latest"):
 
     ast = bel.lang.ast.BELAst(assertion=assertion)
 
-    canonicalized = ast.canonicalize().to_string()
+    canonicalized = ast.canonical_string()
     return {"canonicalized": canonicalized, "original": bel_assertion}
 
 
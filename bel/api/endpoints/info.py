@@ -12,6 +12,8 @@ from loguru import logger
 
 # Local
 import bel.core.settings as settings
+import bel.core.singleflight
+import bel.lang.parse
 import bel.terms.terms
 from bel.__version__ import __version__ as bel_lib_version
 from bel.schemas.info import Status, Version
@@ -53,6 +55,16 @@ def get_version():
 #     return settings.show_settings()
 
 
+@router.get("/cache_stats", tags=["Info"], response_model=dict)
+def get_cache_stats():
+    """Cache hit/miss and single-flight (duplicate cache miss) statistics"""
+
+    return {
+        "parse_info": bel.lang.parse.get_parse_info_cache_stats(),
+        "singleflight": bel.core.singleflight.get_singleflight_stats(),
+    }
+
+
 @router.get("/ping", tags=["Info"])
 def ping() -> dict:
     """Check service - no authentication/token required"""
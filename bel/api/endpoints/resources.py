@@ -40,6 +40,19 @@ def post_update_resources(
     bel.resources.manage.update_resources(urls=urls, force=force, email=email)
 
 
+@router.post("/resources/normalized_terms")
+def post_update_normalized_terms(force: bool = False):
+    """Recompute the normalized terms
+
+    Run after changing the BEL_CANONICALIZE/BEL_DECANONICALIZE canonicalization targets - only
+    recomputed if the targets have changed unless forced.
+    """
+
+    count = bel.resources.manage.update_normalized_terms(force=force)
+
+    return {"normalized_terms": count}
+
+
 @router.delete("/resources/{source}")
 def delete_resource(
     source: str = Query(
@@ -11,7 +11,14 @@ from loguru import logger
 # Local
 import bel.terms.terms
 from bel.api.core.exceptions import HTTPException
-from bel.schemas.terms import Term, TermCompletionResponse
+from bel.schemas.terms import (
+    Term,
+    TermCompletionResponse,
+    TermCompletionsBatchRequest,
+    TermCompletionsBatchResponse,
+    TermsBatchRequest,
+    TermsBatchResponse,
+)
 
 router = APIRouter()
 
@@ -23,8 +30,7 @@ def get_term_types():
     return bel.terms.terms.term_types()
 
 
-# TODO add response_model=TermCompletionResponse to improve API docs
-@router.get("/terms/completions/{completion_str}")
+@router.get("/terms/completions/{completion_str}", response_model=TermCompletionResponse)
 def get_term_completions(
     completion_str: str = Query(..., description="String to use for completion"),
     size: int = Query(21, description="Number of completions to return"),
@@ -59,6 +65,51 @@ def get_term_completions(
     return {"completion_text": completion_str, "completions": completions}
 
 
+@router.post("/terms/completions/batch", response_model=TermCompletionsBatchResponse)
+def post_term_completions_batch(request: TermCompletionsBatchRequest):
+    """Get Term Completions for many completion requests
+
+    The completion requests are searched together - results are in the order of the requests
+    """
+
+    completions = bel.terms.terms.get_term_completions_many(
+        [
+            {
+                "completion_text": item.completion_text,
+                "size": item.size,
+                "entity_types": item.entity_types,
+                "annotation_types": item.annotation_types,
+                "species_keys": item.species,
+                "namespaces": item.namespaces,
+            }
+            for item in request.completions
+        ]
+    )
+
+    return {
+        "completions": [
+            {"completion_text": item.completion_text, "completions": item_completions}
+            for item, item_completions in zip(request.completions, completions)
+        ]
+    }
+
+
+@router.post("/terms/batch", response_model=TermsBatchResponse)
+def post_terms_batch(request: TermsBatchRequest):
+    """Get Terms for many term keys
+
+    Optionally adds the normalized term keys (see /terms/{term_key}/normalized)
+    """
+
+    terms = bel.terms.terms.get_terms_many(request.term_keys)
+
+    normalized = None
+    if request.normalize:
+        normalized = bel.terms.terms.get_normalized_terms_many(request.term_keys)
+
+    return {"terms": terms, "normalized": normalized}
+
+
 @router.get("/terms/{term_id}", response_model=List[Term])
 def get_terms(term_id: str):
     """Get Term"""
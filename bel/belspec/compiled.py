@@ -0,0 +1,327 @@
+"""Compiled BEL Specification
+
+The enhanced BEL Specification compiled once per version into the lookups that the
+Assertion parser and AST need: precompiled relation and function regexes, name sets
+and long/short name maps, signature decision tables for match_signatures and compiled
+function signatures for validate_function and sort_function_args.
+
+Compiled specifications can be dumped to disk and loaded by API workers at startup
+(settings.BEL_COMPILED_SPEC_DIR) instead of being rebuilt from ArangoDB.
+"""
+
+# Standard Library
+import glob
+import json
+import os
+import re
+from typing import Any, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple
+
+# Third Party
+from loguru import logger
+
+# Local
+import bel.belspec.crud
+import bel.belspec.specifications
+import bel.core.settings as settings
+from bel.schemas.constants import strarg_validation_lists
+
+# Compiled BEL Specifications by requested version (e.g. latest, 2.1.2)
+compiled_belspecs: Mapping[str, "CompiledBelSpec"] = {}
+
+
+class SignatureArgument(NamedTuple):
+    """Function signature argument compiled for validation and argument sorting"""
+
+    position: Optional[int]
+    optional: bool
+    type: str
+    values: Tuple[str, ...]
+
+    # Function names allowed for Function arguments
+    functions: FrozenSet[str]
+    # NSArg/StrArg argument types allowed (a StrArgNSArg argument allows both)
+    arg_types: FrozenSet[str]
+    # Check entity types of NSArg arguments - values plus All
+    check_entity_types: bool
+    entity_types: FrozenSet[str]
+    # Check StrArg arguments against the StrArg vocabulary unless a format (/regex/) is given
+    check_strarg: bool
+    strarg_format: bool
+    strarg_values: FrozenSet[str]
+
+
+class CompiledSignature(NamedTuple):
+    """Function signature compiled for validate_function and sort_function_args"""
+
+    arguments: Tuple[SignatureArgument, ...]
+    # Positional arguments in signature order
+    positional: Tuple[SignatureArgument, ...]
+    required: Tuple[SignatureArgument, ...]
+    optional_positional: Tuple[SignatureArgument, ...]
+    # Indexes of signature arguments that are positional
+    positional_indexes: FrozenSet[int]
+    opt_args: FrozenSet[str]
+    opt_and_mult_args: FrozenSet[str]
+
+
+def compile_signature_argument(argument: Mapping[str, Any]) -> SignatureArgument:
+    """Compile function signature argument"""
+
+    arg_type = argument["type"]
+    if arg_type == ["StrArgNSArg"]:
+        arg_type = "StrArgNSArg"
+
+    values = tuple(argument.get("values", []))
+
+    strarg_values = set()
+    for value in values:
+        strarg_values.update(strarg_validation_lists.get(value, []))
+
+    return SignatureArgument(
+        position=argument.get("position"),
+        optional=argument.get("optional", False),
+        type=arg_type,
+        values=values,
+        functions=frozenset(values),
+        arg_types=frozenset([t for t in ["NSArg", "StrArg"] if t in arg_type]),
+        check_entity_types=arg_type in ["NSArg", "StrArgNSArg"],
+        entity_types=frozenset(values + ("All",)),
+        check_strarg=arg_type in ["StrArg", "StrArgNSArg"],
+        strarg_format=any(value.startswith("/") for value in values),
+        strarg_values=frozenset(strarg_values),
+    )
+
+
+def compile_signature(signature: Mapping[str, Any]) -> CompiledSignature:
+    """Compile function signature"""
+
+    arguments = tuple(compile_signature_argument(argument) for argument in signature["arguments"])
+    positional = tuple(argument for argument in arguments if argument.position is not None)
+
+    return CompiledSignature(
+        arguments=arguments,
+        positional=positional,
+        required=tuple(argument for argument in positional if argument.optional == False),
+        optional_positional=tuple(argument for argument in positional if argument.optional == True),
+        positional_indexes=frozenset(
+            idx for idx, argument in enumerate(arguments) if argument.position is not None
+        ),
+        opt_args=frozenset(signature["opt_args"]),
+        opt_and_mult_args=frozenset(signature["opt_args"] + signature["mult_args"]),
+    )
+
+
+class CompiledBelSpec(object):
+    """BEL Specification compiled for parsing and validating BEL Assertions"""
+
+    def __init__(self, enhanced_belspec: dict, version: str = None):
+
+        self.enhanced_belspec = enhanced_belspec
+        self.version = version or enhanced_belspec["version"]
+
+        relations = enhanced_belspec["relations"]
+        functions = enhanced_belspec["functions"]
+
+        # Relations
+        self.relations = frozenset(
+            relations["list"] + bel.belspec.specifications.additional_computed_relations
+        )
+        self.relation_to_long = relations["to_long"]
+        self.relation_to_short = relations["to_short"]
+
+        relations_regex = "|".join(
+            [re.escape(relation) for relation in sorted(self.relations, key=lambda r: (len(r), r))]
+        )
+        self.relations_regex = relations_regex
+        self.relations_pattern = re.compile(rf"\s({relations_regex})\s")
+
+        # Functions
+        self.functions = frozenset(functions["list"])
+        self.function_to_long = functions["to_long"]
+        self.function_to_short = functions["to_short"]
+        self.function_signatures = functions["signatures"]
+        self.function_types = {name: info["type"] for name, info in functions["info"].items()}
+
+        # Function and modifier function names (and abbreviations) of the BEL grammar
+        #     - see bel.belspec.enhance.create_ebnf_parser
+        self.primary_functions = frozenset(
+            [
+                name
+                for name in self.functions
+                if self.function_types.get(self.function_to_long.get(name), "").lower() == "primary"
+            ]
+        )
+        self.modifier_functions = frozenset(
+            [
+                name
+                for name in self.functions
+                if self.function_types.get(self.function_to_long.get(name), "").lower()
+                == "modifier"
+            ]
+        )
+
+        # Longest names first so that the alternation matches the whole function name
+        functions_regex = "|".join(
+            [re.escape(function) for function in sorted(self.functions, key=lambda f: (-len(f), f))]
+        )
+        self.functions_pattern = re.compile(rf"(?<![a-zA-Z])({functions_regex})\(")
+
+        # Function help by function name - see bel.belspec.specifications.get_function_help
+        self.function_help = {}
+
+        # Signature decision tables - first argument type -> index of first matching signature
+        self.signature_tables = {}
+        for function_name, function_signature in self.function_signatures.items():
+            table = {}
+            for idx, signature in enumerate(function_signature["signatures"]):
+                if not signature["arguments"]:
+                    continue
+                arg_type = signature["arguments"][0]["type"]
+                if isinstance(arg_type, str) and arg_type not in table:
+                    table[arg_type] = idx
+            self.signature_tables[function_name] = table
+
+        # Compiled signatures by function name in BEL Specification signature order
+        self.compiled_signatures = {
+            function_name: tuple(
+                compile_signature(signature) for signature in function_signature["signatures"]
+            )
+            for function_name, function_signature in self.function_signatures.items()
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        """Enhanced BEL Specification sections, e.g. belspec['functions']"""
+
+        return self.enhanced_belspec[key]
+
+    def __deepcopy__(self, memo) -> "CompiledBelSpec":
+        """Copied AST nodes keep sharing the compiled BEL Specification"""
+
+        return self
+
+    def __reduce__(self):
+        """Unpickled AST nodes use the compiled BEL Specification of the worker"""
+
+        return (get_compiled_belspec, (self.version,))
+
+    def match_signature_index(self, function_name: str, arg) -> Optional[int]:
+        """Index of signature of function given the first function argument"""
+
+        table = self.signature_tables[function_name]
+
+        if arg.type == "Function":
+            indexes = [table.get(arg.function_type), table.get(arg.type)]
+        else:
+            indexes = [table.get(arg.type)]
+
+        indexes = [idx for idx in indexes if idx is not None]
+        if indexes:
+            return min(indexes)
+
+        return None
+
+    def match_signature(self, function_name: str, arg) -> Optional[dict]:
+        """Select signature of function given the first function argument
+
+        Same result as bel.lang.ast.match_signatures without scanning the signatures
+        """
+
+        idx = self.match_signature_index(function_name, arg)
+        if idx is not None:
+            return self.function_signatures[function_name]["signatures"][idx]
+
+        return None
+
+    def select_signature(self, function_name: str, args: List[Any]) -> Optional[CompiledSignature]:
+        """Select compiled signature of function given the function arguments"""
+
+        compiled_signatures = self.compiled_signatures[function_name]
+        if len(compiled_signatures) == 1:
+            return compiled_signatures[0]
+
+        idx = self.match_signature_index(function_name, args[0])
+        if idx is not None:
+            return compiled_signatures[idx]
+
+        return None
+
+    def dump(self, filename: str):
+        """Dump compiled BEL Specification to file"""
+
+        with open(filename, "w") as f:
+            json.dump({"version": self.version, "enhanced_belspec": self.enhanced_belspec}, f)
+
+    @classmethod
+    def load(cls, filename: str) -> "CompiledBelSpec":
+        """Load compiled BEL Specification from file"""
+
+        with open(filename, "r") as f:
+            doc = json.load(f)
+
+        return cls(doc["enhanced_belspec"], version=doc["version"])
+
+
+def get_compiled_belspec(version: str = "latest") -> CompiledBelSpec:
+    """Get compiled BEL Specification for version
+
+    Version aliases (latest) share the compiled BEL Specification of the version they resolve to
+    """
+
+    if version not in compiled_belspecs:
+        enhanced_belspec = bel.belspec.crud.get_enhanced_belspec(version)
+        compiled_belspec = compiled_belspecs.get(enhanced_belspec["version"])
+        if compiled_belspec is None:
+            compiled_belspec = CompiledBelSpec(enhanced_belspec)
+            compiled_belspecs[compiled_belspec.version] = compiled_belspec
+
+        compiled_belspecs[version] = compiled_belspec
+
+    return compiled_belspecs[version]
+
+
+def clear_compiled_belspecs():
+    """Clear compiled BEL Specifications - e.g. after BEL Specifications are updated"""
+
+    compiled_belspecs.clear()
+
+
+def dump_compiled_belspecs(directory: str = None, versions: list = None):
+    """Dump compiled BEL Specifications to directory for workers to load at startup"""
+
+    if directory is None:
+        directory = settings.BEL_COMPILED_SPEC_DIR
+
+    if versions is None:
+        versions = bel.belspec.crud.get_belspec_versions()["versions"]
+
+    os.makedirs(directory, exist_ok=True)
+
+    for version in versions:
+        if version == "latest":
+            continue
+
+        filename = os.path.join(directory, f"belspec_{version}.json")
+        get_compiled_belspec(version).dump(filename)
+        logger.info(f"Dumped compiled BEL Specification {version} to {filename}")
+
+
+def load_compiled_belspecs(directory: str = None):
+    """Load compiled BEL Specifications from directory
+
+    The latest version is set to the maximum semantic version loaded.
+    """
+
+    if directory is None:
+        directory = settings.BEL_COMPILED_SPEC_DIR
+
+    versions = []
+    for filename in sorted(glob.glob(os.path.join(directory, "belspec_*.json"))):
+        compiled_belspec = CompiledBelSpec.load(filename)
+        compiled_belspecs[compiled_belspec.version] = compiled_belspec
+        versions.append(compiled_belspec.version)
+
+    if versions:
+        latest = bel.belspec.crud.max_semantic_version(versions)
+        compiled_belspecs["latest"] = compiled_belspecs[latest]
+
+    logger.info(f"Loaded compiled BEL Specifications {versions} from {directory}")
@@ -8,8 +8,10 @@ from loguru import logger
 
 # Local
 import bel.core.settings as settings
+import bel.core.singleflight as singleflight
 import bel.db.arangodb as arangodb
 from bel.belspec.enhance import create_ebnf_parser, create_enhanced_specification
+from bel.core.utils import _generate_id
 from bel.schemas.belspec import BelSpec, BelSpecVersions
 
 # ArangoDB handles
@@ -28,6 +30,27 @@ belhelp_{version} = {doc_type: belhelp, belhelp: <belhelp>}
 
 """
 
+# BEL Specification registry - holds all requested versions and version resolutions
+#     until cleared by update_belspec() or delete_belspec() or by a BEL Specification update
+#     in another process (see check_belspec_revision)
+belspec_versions_cache = cachetools.Cache(maxsize=1)
+enhanced_belspec_cache = cachetools.LRUCache(maxsize=32)
+check_version_cache = cachetools.LRUCache(maxsize=1024)
+best_match_cache = cachetools.LRUCache(maxsize=1024)
+
+# Revision of the belspec_versions record the registry was filled from - re-read after the ttl
+belspec_revision = {}
+belspec_revision_cache = cachetools.TTLCache(maxsize=1, ttl=30)
+
+
+def versions_key(belspec_versions: BelSpecVersions) -> tuple:
+    """Hashable cache key for belspec_versions"""
+
+    if belspec_versions is None:
+        return None
+
+    return (belspec_versions["latest"], tuple(belspec_versions["versions"]))
+
 
 def get_latest_version() -> str:
     """Get latest version of BEL installed"""
@@ -82,13 +105,51 @@ def update_belspec_versions():
         "latest": latest,
         "default": settings.BEL_DEFAULT_VERSION,
         "versions": version_strings,
+        "revision": _generate_id(),
     }
 
     bel_config_coll.insert(doc, overwrite=True)
 
 
-@cachetools.cached(cachetools.TTLCache(maxsize=1, ttl=600))
+def check_belspec_revision():
+    """Clear the BEL Specification registry if the BEL Specifications were updated
+
+    The belspec_versions record revision changes with every BEL Specification update (see
+    update_belspec_versions) - it is re-read at most every belspec_revision_cache ttl seconds.
+    Called at the request/AST entry points (check_version) - the loaded registry is kept if the
+    database is not available, e.g. BEL Specifications loaded from settings.BEL_COMPILED_SPEC_DIR.
+    """
+
+    if "revision" in belspec_revision_cache:
+        return
+
+    try:
+        doc = bel_config_coll.get("belspec_versions") or {}
+    except Exception as e:
+        logger.error(f"Could not check BEL Specifications revision - error: {e}")
+        belspec_revision_cache["revision"] = belspec_revision.get("revision")
+        return
+
+    revision = doc.get("revision")
+
+    if "revision" in belspec_revision and belspec_revision["revision"] != revision:
+        logger.info(f"BEL Specifications updated - revision {revision}")
+        clear_belspec_cache()
+
+    belspec_revision["revision"] = revision
+    belspec_revision_cache["revision"] = revision
+
+
 def get_belspec_versions() -> dict:
+    """Get BEL Specification versions record"""
+
+    check_belspec_revision()
+
+    return get_cached_belspec_versions()
+
+
+@singleflight.cached(belspec_versions_cache, name="belspec_versions")
+def get_cached_belspec_versions() -> dict:
 
     doc = bel_config_coll.get(f"belspec_versions")
 
@@ -101,6 +162,13 @@ def get_belspec_versions() -> dict:
         return {}
 
 
+@singleflight.cached(
+    best_match_cache,
+    name="best_match",
+    key=lambda query_str, belspec_versions: cachetools.keys.hashkey(
+        query_str, versions_key(belspec_versions)
+    ),
+)
 def get_best_match(query_str, belspec_versions: BelSpecVersions):
     """Get best match to query version in versions or return latest"""
 
@@ -150,7 +218,22 @@ def get_best_match(query_str, belspec_versions: BelSpecVersions):
 
 
 def check_version(version: str = "latest", versions: BelSpecVersions = None) -> str:
-    """ Check if version is valid and if not return default or latest """
+    """Check if version is valid and if not return default or latest"""
+
+    check_belspec_revision()
+
+    return resolve_version(version, versions)
+
+
+@singleflight.cached(
+    check_version_cache,
+    name="check_version",
+    key=lambda version="latest", versions=None: cachetools.keys.hashkey(
+        version, versions_key(versions)
+    ),
+)
+def resolve_version(version: str = "latest", versions: BelSpecVersions = None) -> str:
+    """Resolve version to a BEL Specification version - see check_version"""
 
     if not version:
         version = settings.BEL_DEFAULT_VERSION
@@ -183,10 +266,18 @@ def get_belspec(version: str = "latest") -> dict:
         return {}
 
 
-@cachetools.cached(cachetools.TTLCache(maxsize=10, ttl=600))
 def get_enhanced_belspec(version: str = "latest") -> dict:
     """Get enhanced belspec"""
 
+    check_belspec_revision()
+
+    return get_cached_enhanced_belspec(version)
+
+
+@singleflight.cached(enhanced_belspec_cache, name="enhanced_belspec")
+def get_cached_enhanced_belspec(version: str = "latest") -> dict:
+    """Get enhanced belspec from the BEL Specification registry"""
+
     if version == "latest":
         version = get_latest_version()
 
@@ -234,6 +325,8 @@ def update_belspec(belspec: BelSpec):
 
     update_belspec_versions()
 
+    clear_belspec_cache()
+
 
 def delete_belspec(version: str):
     """Delete BEL specification"""
@@ -245,6 +338,29 @@ def delete_belspec(version: str):
 
     update_belspec_versions()
 
+    clear_belspec_cache()
+
+
+def clear_belspec_cache():
+    """Clear the BEL Specification registry
+
+    Called when BEL Specifications are added, updated or removed
+    """
+
+    # Local
+    from bel.belspec.compiled import clear_compiled_belspecs
+    from bel.lang.parse import clear_parse_info_cache
+
+    belspec_versions_cache.clear()
+    enhanced_belspec_cache.clear()
+    check_version_cache.clear()
+    best_match_cache.clear()
+    belspec_revision.clear()
+    belspec_revision_cache.clear()
+
+    clear_compiled_belspecs()
+    clear_parse_info_cache()
+
 
 def get_belhelp(version: str = "latest") -> dict:
     """Get BELspec Help
@@ -3,10 +3,10 @@ import copy
 from typing import Any, List, Mapping
 
 # Third Party
-import cachetools
 import yaml
 
 # Local
+import bel.belspec.compiled
 import bel.belspec.crud
 from bel.core.utils import http_client
 
@@ -25,24 +25,22 @@ additional_computed_relations = [
 ]
 
 
-@cachetools.cached(cachetools.TTLCache(maxsize=1, ttl=600))
 def get_all_relations(version: str):
     """Get all relations - long and short"""
 
-    belspec = bel.belspec.crud.get_enhanced_belspec(version)
+    belspec = bel.belspec.compiled.get_compiled_belspec(version)
 
     return belspec["relations"]["list"]
 
 
-@cachetools.cached(cachetools.TTLCache(maxsize=1, ttl=600))
 def get_all_functions(version: str):
     """Get all functions - long and short"""
 
-    belspec = bel.belspec.crud.get_enhanced_belspec(version)
+    belspec = bel.belspec.compiled.get_compiled_belspec(version)
+
     return belspec["functions"]["list"]
 
 
-@cachetools.cached(cachetools.TTLCache(maxsize=1, ttl=600))
 def get_function_help(function: str, version: str):
     """Get function_help given function name
 
@@ -50,23 +48,27 @@ def get_function_help(function: str, version: str):
     and the argument help listing.
     """
 
-    enhanced_belspec = bel.belspec.crud.get_enhanced_belspec(version)
+    belspec = bel.belspec.compiled.get_compiled_belspec(version)
+
+    if function in belspec.function_help:
+        return belspec.function_help[function]
 
-    function_long = enhanced_belspec["functions"]["to_long"].get(function)
+    function_long = belspec["functions"]["to_long"].get(function)
     function_help = []
 
     if function_long:
-        for signature in enhanced_belspec["functions"]["signatures"][function_long]["signatures"]:
+        for signature in belspec["functions"]["signatures"][function_long]["signatures"]:
             function_help.append(
                 {
                     "function_summary": signature["argument_summary"],
                     "argument_help": signature["argument_help_listing"],
-                    "description": enhanced_belspec["functions"]["info"][function_long][
-                        "description"
-                    ],
+                    "description": belspec["functions"]["info"][function_long]["description"],
                 }
             )
 
+        # Only known function names are kept so the registry stays bounded
+        belspec.function_help[function] = function_help
+
     return function_help
 
 
@@ -74,6 +74,13 @@ REDIS_HOST = os.getenv("REDIS_HOST", default="localhost")
 REDIS_PORT = os.getenv("REDIS_PORT", default=6379)
 REDIS_QUEUE = os.getenv("NANOPUBSTORE_TYPE", default="belservice")
 
+# Shared Redis tier behind the per-process term and equivalence caches (see
+#     bel.db.redis.RedisTieredCache) - entries are kept for the TTL in seconds, unknown term
+#     keys for the negative TTL
+REDIS_TERM_CACHE = getenv_boolean("REDIS_TERM_CACHE", default=False)
+REDIS_TERM_CACHE_TTL = int(os.getenv("REDIS_TERM_CACHE_TTL", default=86400))
+REDIS_TERM_CACHE_NEGATIVE_TTL = int(os.getenv("REDIS_TERM_CACHE_NEGATIVE_TTL", default=600))
+
 # Elasticsearch Info
 ELASTICSEARCH_URL = os.getenv("ELASTICSEARCH_URL", default="http://localhost:9200")
 TERMS_INDEX = os.getenv("TERMS_INDEX", default="terms")  # Elasticsearch terms index
@@ -93,6 +100,27 @@ species_entity_types = ["Gene", "Protein", "RNA", "Micro_RNA"]
 
 BEL_DEFAULT_VERSION = os.getenv("BEL_DEFAULT_VERSION", default="latest")
 
+# Assertion parser backend - lexer (single-pass tokenizer) or regex (original multi-regex parser)
+BEL_PARSER = os.getenv("BEL_PARSER", default="lexer")
+
+# Try the strict BEL grammar parser first - falls back to BEL_PARSER for malformed Assertions
+BEL_STRICT_PARSER = getenv_boolean("BEL_STRICT_PARSER", default=True)
+
+# Number of Assertion parse results to cache - 0 to disable
+BEL_PARSE_CACHE_SIZE = int(os.getenv("BEL_PARSE_CACHE_SIZE", default=10000))
+
+# Directory of compiled BEL Specifications to load at startup (see bel.belspec.compiled)
+BEL_COMPILED_SPEC_DIR = os.getenv("BEL_COMPILED_SPEC_DIR", default=None)
+
+# Directory of memory-mapped namespace term snapshots written when loading namespaces and used
+# for term lookups (see bel.terms.snapshot)
+BEL_TERMS_SNAPSHOT_DIR = os.getenv("BEL_TERMS_SNAPSHOT_DIR", default=None)
+
+# Term completion backend - elasticsearch or local (memory-mapped completion indexes written with
+# the term snapshots, see bel.terms.completions) - falls back to elasticsearch if the completion
+# indexes are not available
+BEL_TERM_COMPLETIONS = os.getenv("BEL_TERM_COMPLETIONS", default="elasticsearch")
+
 BEL_SPECIFICATION_URLS = json.loads(os.getenv("BEL_SPECIFICATION_URLS", default="[]"))
 if not BEL_SPECIFICATION_URLS:
     BEL_SPECIFICATION_URLS = [
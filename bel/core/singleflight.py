@@ -0,0 +1,151 @@
+"""Single-flight de-duplication of concurrent calls
+
+Concurrent calls with the same key (e.g. cache misses for the same term when a cache entry
+expires) wait for the call in flight and get its result instead of running the same query.
+"""
+
+# Standard Library
+import functools
+import threading
+from typing import Any, Callable, Hashable, MutableMapping
+
+# Third Party
+import cachetools
+
+# Single-flight groups by name - see get_singleflight_stats
+groups = {}
+
+
+class Call(object):
+    """Call in flight"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Single-flight group - one call in flight per key, the other callers wait for its result"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.stats = {"calls": 0, "duplicates": 0}
+
+        groups[name] = self
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """Run func(*args, **kwargs) or wait for the call in flight with the same key"""
+
+        with self.lock:
+            self.stats["calls"] += 1
+            call = self.calls.get(key)
+            if call is not None:
+                self.stats["duplicates"] += 1
+                leader = False
+            else:
+                call = self.calls[key] = Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Number of calls in flight"""
+
+        return len(self.calls)
+
+
+def singleflight(name: str, key: Callable[..., Hashable] = cachetools.keys.hashkey):
+    """Decorator to de-duplicate concurrent calls of a function with the same key"""
+
+    group = SingleFlight(name)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return group.do(key(*args, **kwargs), func, *args, **kwargs)
+
+        wrapper.singleflight = group
+
+        return wrapper
+
+    return decorator
+
+
+def cached(
+    cache: MutableMapping,
+    name: str,
+    key: Callable[..., Hashable] = cachetools.keys.hashkey,
+):
+    """cachetools.cached with single-flight cache misses
+
+    Concurrent callers missing the cache for the same key wait for the first caller to compute
+    and cache the value.
+    """
+
+    group = SingleFlight(name)
+
+    def decorator(func):
+        def load(k, *args, **kwargs):
+            # Cached by a call that finished after this caller missed the cache - checks the
+            #   local cache only (no second shared tier lookup, see bel.db.redis.RedisTieredCache)
+            if k in cache:
+                try:
+                    return cache[k]
+                except KeyError:
+                    pass
+
+            value = func(*args, **kwargs)
+            try:
+                cache[k] = value
+            except ValueError:
+                pass  # value too large
+
+            return value
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs)
+            try:
+                return cache[k]
+            except KeyError:
+                pass
+
+            return group.do(k, load, k, *args, **kwargs)
+
+        wrapper.cache = cache
+        wrapper.singleflight = group
+
+        return wrapper
+
+    return decorator
+
+
+def get_singleflight_stats() -> dict:
+    """Calls, duplicate calls (waited for a call in flight) and calls in flight by group"""
+
+    return {
+        name: {
+            "calls": group.stats["calls"],
+            "duplicates": group.stats["duplicates"],
+            "in_flight": group.in_flight(),
+        }
+        for name, group in groups.items()
+    }
@@ -22,10 +22,13 @@ bel_db_name = settings.BEL_DB  # Misc BEL
 # BEL Resources
 equiv_nodes_name = "equivalence_nodes"  # equivalence node collection name
 equiv_edges_name = "equivalence_edges"  # equivalence edge collection name
+equiv_clusters_name = "equivalence_clusters"  # equivalence connected components
 ortholog_nodes_name = "ortholog_nodes"  # ortholog node collection name
 ortholog_edges_name = "ortholog_edges"  # ortholog edge collection name
 resources_metadata_name = "resources_metadata"  # BEL Resources metadata
 terms_coll_name = "terms"  # BEL Namespaces/Terms collection name
+term_aliases_name = "term_aliases"  # term keys, alt_keys, obsolete_keys, synonyms -> term _key
+normalized_terms_name = "normalized_terms"  # term _key -> normalized/canonical/decanonical keys
 
 # BEL database collections
 bel_config_name = "bel_config"  # BEL settings and configuration
@@ -183,6 +186,11 @@ def get_resources_handles(client, username=None, password=None):
     else:
         equiv_edges_coll = resources_db.create_collection(equiv_edges_name, edge=True)
 
+    if resources_db.has_collection(equiv_clusters_name):
+        equiv_clusters_coll = resources_db.collection(equiv_clusters_name)
+    else:
+        equiv_clusters_coll = resources_db.create_collection(equiv_clusters_name)
+
     if resources_db.has_collection(ortholog_nodes_name):
         ortholog_nodes_coll = resources_db.collection(ortholog_nodes_name)
     else:
@@ -198,6 +206,16 @@ def get_resources_handles(client, username=None, password=None):
     else:
         terms_coll = resources_db.create_collection(terms_coll_name)
 
+    if resources_db.has_collection(term_aliases_name):
+        term_aliases_coll = resources_db.collection(term_aliases_name)
+    else:
+        term_aliases_coll = resources_db.create_collection(term_aliases_name)
+
+    if resources_db.has_collection(normalized_terms_name):
+        normalized_terms_coll = resources_db.collection(normalized_terms_name)
+    else:
+        normalized_terms_coll = resources_db.create_collection(normalized_terms_name)
+
     # Update indexes
     update_index_state(
         terms_coll,
@@ -214,11 +232,26 @@ def get_resources_handles(client, username=None, password=None):
             IndexDefinition(type="persistent", fields=["synonyms[*]"], unique=False, sparse=True),
         ],
     )
+    update_index_state(
+        term_aliases_coll,
+        [
+            IndexDefinition(type="persistent", fields=["alias", "type"], unique=False),
+            IndexDefinition(type="persistent", fields=["source"], unique=False),
+        ],
+    )
+    update_index_state(
+        normalized_terms_coll,
+        [
+            IndexDefinition(type="persistent", fields=["source"], unique=False),
+            IndexDefinition(type="persistent", fields=["targets_hash"], unique=False),
+        ],
+    )
     update_index_state(
         equiv_nodes_coll,
         [
             IndexDefinition(type="persistent", fields=["key"], unique=True),
             IndexDefinition(type="persistent", fields=["source"], unique=False),
+            IndexDefinition(type="persistent", fields=["cluster_id"], unique=False, sparse=True),
         ],
     )
     update_index_state(
@@ -234,9 +267,12 @@ def get_resources_handles(client, username=None, password=None):
         "resources_metadata_coll": resources_metadata_coll,
         "equiv_nodes_coll": equiv_nodes_coll,
         "equiv_edges_coll": equiv_edges_coll,
+        "equiv_clusters_coll": equiv_clusters_coll,
         "ortholog_nodes_coll": ortholog_nodes_coll,
         "ortholog_edges_coll": ortholog_edges_coll,
         "terms_coll": terms_coll,
+        "term_aliases_coll": term_aliases_coll,
+        "normalized_terms_coll": normalized_terms_coll,
     }
 
 
@@ -293,9 +329,12 @@ resources_db = resources_handles["resources_db"]
 resources_metadata_coll = resources_handles["resources_metadata_coll"]
 equiv_nodes_coll = resources_handles["equiv_nodes_coll"]
 equiv_edges_coll = resources_handles["equiv_edges_coll"]
+equiv_clusters_coll = resources_handles["equiv_clusters_coll"]
 ortholog_nodes_coll = resources_handles["ortholog_nodes_coll"]
 ortholog_edges_coll = resources_handles["ortholog_edges_coll"]
 terms_coll = resources_handles["terms_coll"]
+term_aliases_coll = resources_handles["term_aliases_coll"]
+normalized_terms_coll = resources_handles["normalized_terms_coll"]
 
 # BEL db
 bel_handles = get_bel_handles(client)
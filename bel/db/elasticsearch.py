@@ -1,5 +1,6 @@
 # Standard Library
 import os
+from typing import List
 
 # Third Party
 import elasticsearch.helpers
@@ -25,6 +26,15 @@ def get_all_index_names():
     return indices
 
 
+def get_alias_index_names(alias_name: str) -> List[str]:
+    """Get the names of the indexes of the index alias"""
+
+    if not es.indices.exists_alias(name=alias_name):
+        return []
+
+    return sorted(es.indices.get_alias(name=alias_name))
+
+
 def add_index_alias(index_name, alias_name):
     """Add index alias to index_name"""
 
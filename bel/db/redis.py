@@ -1,8 +1,11 @@
 # Standard Library
 import json
-from typing import List, Tuple
+import time
+from typing import Any, Callable, Hashable, Iterable, List, Mapping, Tuple
 
 # Third Party
+import cachetools
+import msgpack
 import redis
 from loguru import logger
 
@@ -47,3 +50,149 @@ def reset_queues(stores: List[str] = [settings.REDIS_QUEUE]):
     for store in stores:
         for key in redis_db.keys(f"mq:{store}:*"):
             redis_db.ltrim(key, 1, 0)  # Clear all elements by setting start>end
+
+
+class RedisTieredCache(cachetools.TTLCache):
+    """Per-process TTL (LRU evicting) cache in front of a shared Redis cache tier
+
+    Misses of the per-process cache are looked up in Redis and cached values are written to both
+    tiers so all worker processes share the values cached by any of them. The Redis keys are
+    namespaced by the cache name and the version returned by the version function (e.g. the
+    loaded resources version) so entries of prior versions are never used.
+
+    Values are msgpack encoded (see encode/decode). Negative values (e.g. no terms for an unknown
+    term key) are cached in Redis for settings.REDIS_TERM_CACHE_NEGATIVE_TTL.
+
+    The Redis tier is used if settings.REDIS_TERM_CACHE is set and is skipped for a minute after
+    a Redis error.
+    """
+
+    retry_seconds = 60
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        name: str,
+        version: Callable[[], str] = lambda: "",
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda value: value,
+        negative: Callable[[Any], bool] = lambda value: not value,
+    ):
+        super().__init__(maxsize, ttl)
+
+        self.name = name
+        self.version = version
+        self.encode = encode
+        self.decode = decode
+        self.negative = negative
+
+        self.redis_retry = 0.0  # time.monotonic() after which the Redis tier is retried
+
+    def redis_enabled(self) -> bool:
+        return settings.REDIS_TERM_CACHE and time.monotonic() >= self.redis_retry
+
+    def redis_error(self, e: Exception):
+        logger.warning(f"Redis cache tier {self.name} unavailable - error: {e}")
+        self.redis_retry = time.monotonic() + self.retry_seconds
+
+    def redis_key(self, key: Hashable) -> str:
+        """Redis key for cache key - e.g. cachetools.keys.hashkey(term_key)"""
+
+        if isinstance(key, tuple):
+            key = "|".join([str(part) for part in key])
+
+        return f"cache:{self.name}:{self.version()}:{key}"
+
+    def __missing__(self, key: Hashable):
+
+        if not self.redis_enabled():
+            raise KeyError(key)
+
+        try:
+            encoded = redis_db.get(self.redis_key(key))
+        except redis.RedisError as e:
+            self.redis_error(e)
+            raise KeyError(key)
+
+        if encoded is None:
+            raise KeyError(key)
+
+        value = self.decode(msgpack.unpackb(encoded, raw=False))
+        cachetools.TTLCache.__setitem__(self, key, value)
+
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any):
+
+        cachetools.TTLCache.__setitem__(self, key, value)
+
+        self.set_many({key: value}, local=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get value from the per-process cache or the Redis tier"""
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def get_many(self, keys: Iterable[Hashable]) -> Mapping[Hashable, Any]:
+        """Get cached values of many keys - one Redis round trip for the per-process misses"""
+
+        values = {}
+        missing = []
+        for key in keys:
+            # __contains__ skips the per-key Redis lookup of __missing__ for the per-process misses
+            #   - entries expired or evicted since are looked up by __missing__ or below
+            if cachetools.TTLCache.__contains__(self, key):
+                try:
+                    values[key] = cachetools.TTLCache.__getitem__(self, key)
+                    continue
+                except KeyError:
+                    pass
+
+            missing.append(key)
+
+        if not missing or not self.redis_enabled():
+            return values
+
+        try:
+            encoded_values = redis_db.mget([self.redis_key(key) for key in missing])
+        except redis.RedisError as e:
+            self.redis_error(e)
+            return values
+
+        for key, encoded in zip(missing, encoded_values):
+            if encoded is not None:
+                values[key] = self.decode(msgpack.unpackb(encoded, raw=False))
+                cachetools.TTLCache.__setitem__(self, key, values[key])
+
+        return values
+
+    def set_many(self, values: Mapping[Hashable, Any], local: bool = True):
+        """Cache many values - one Redis round trip"""
+
+        if local:
+            for key, value in values.items():
+                cachetools.TTLCache.__setitem__(self, key, value)
+
+        if not values or not self.redis_enabled():
+            return
+
+        try:
+            pipeline = redis_db.pipeline(transaction=False)
+            for key, value in values.items():
+                ttl = (
+                    settings.REDIS_TERM_CACHE_NEGATIVE_TTL
+                    if self.negative(value)
+                    else settings.REDIS_TERM_CACHE_TTL
+                )
+                pipeline.set(
+                    self.redis_key(key),
+                    msgpack.packb(self.encode(value), use_bin_type=True),
+                    ex=ttl,
+                )
+            pipeline.execute()
+        except redis.RedisError as e:
+            self.redis_error(e)
@@ -4,13 +4,16 @@
 
 # Standard Library
 import copy
+import hashlib
 import json
 import re
 import sys
 import traceback
-from typing import Any, List, Mapping, Optional, Tuple, Union
+import weakref
+from typing import Any, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 # Third Party
+import cachetools
 import yaml
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -18,22 +21,37 @@ from pydantic import BaseModel, Field
 # Local
 import bel.core.settings as settings
 import bel.db.arangodb
+import bel.resources.namespace
 import bel.terms.orthologs
 import bel.terms.terms
-from bel.belspec.crud import get_enhanced_belspec
+from bel.belspec.compiled import SignatureArgument, get_compiled_belspec
 from bel.core.utils import html_wrap_span, http_client, url_path_param_quoting
+from bel.lang.spans import FunctionSpan, NsArgSpan, Span
 from bel.schemas.bel import (
     AssertionStr,
     BelEntity,
-    FunctionSpan,
     Key,
-    NsArgSpan,
     NsVal,
     Pair,
-    Span,
     ValidationError,
+    resolve_labels,
 )
-from bel.schemas.constants import strarg_validation_lists
+
+# AST nodes use __slots__ and share the compiled BEL Specification of their version - the node
+# names and signatures are looked up in it instead of being copied onto every node.
+#
+# Per-node memory budget in bytes (64-bit CPython) for the node object and its own lists,
+# excluding argument references, spans and BEL Entities - see profiling/ast_memory_benchmark.py
+# (Function and Arg nodes include a weak reference slot for interning and a subtree hash slot)
+node_memory_budget = {"String": 64, "Relation": 64, "Function": 240, "NSArg": 168, "StrArg": 168}
+
+# Interned Function, NSArg and StrArg subtrees by subtree hash - see BELAst(intern=True)
+interned_nodes: MutableMapping[bytes, Any] = weakref.WeakValueDictionary()
+
+# Memoized validation errors and canonical/orthologized strings of Function subtrees keyed by
+# subtree hash, BEL version and resources version - see hash_subtree
+validation_cache = cachetools.TTLCache(maxsize=10000, ttl=600)
+subtree_strings_cache = cachetools.TTLCache(maxsize=10000, ttl=600)
 
 
 #########################
@@ -42,11 +60,14 @@ from bel.schemas.constants import strarg_validation_lists
 class String(object):
     """Used for unknown strings"""
 
+    __slots__ = ("value", "span", "parent")
+
+    type = "String"
+
     def __init__(self, value: str, span: Span = None):
 
         self.value = value
         self.span = span
-        self.type: str = "String"
         self.parent = None
 
     def update(self, value):
@@ -67,17 +88,23 @@ class String(object):
 # Relation object #
 ###################
 class Relation(object):
+
+    __slots__ = ("version", "belspec", "name", "span")
+
+    type = "Relation"
+
     def __init__(self, name, version: str = "latest", span: Span = None):
 
         self.version = version
-        self.belspec = get_enhanced_belspec(self.version)
+        self.belspec = get_compiled_belspec(self.version)
 
-        self.name = self.belspec["relations"]["to_long"].get(name, name)
-        self.name_short = self.belspec["relations"]["to_short"].get(name, name)
+        self.name = self.belspec.relation_to_long.get(name, name)
 
         self.span = span
 
-        self.type = "Relation"
+    @property
+    def name_short(self) -> str:
+        return self.belspec.relation_to_short.get(self.name, self.name)
 
     def to_string(self, fmt: str = "medium"):
         if fmt == "short":
@@ -95,19 +122,30 @@ class Relation(object):
 # Function object #
 ###################
 class Function(object):
+
+    __slots__ = (
+        "version",
+        "belspec",
+        "name",
+        "function_type",
+        "parent",
+        "span",
+        "sort_tuple",
+        "position_dependent",
+        "args",
+        "siblings",
+        "subtree_hash",
+        "__weakref__",
+    )
+
+    type = "Function"
+
     def __init__(self, name, version: str = "latest", parent=None, span: FunctionSpan = None):
 
         self.version = version
-        self.belspec = get_enhanced_belspec(self.version)
-        self.name = self.belspec["functions"]["to_long"].get(name, name)
-        self.function_signature = self.belspec["functions"]["signatures"][self.name]
-        self.name_short = self.belspec["functions"]["to_short"].get(name, name)
-        if self.name in self.belspec["functions"]["info"]:
-            self.function_type = self.belspec["functions"]["info"][self.name]["type"]
-        else:
-            self.function_type = ""
-
-        self.type = "Function"
+        self.belspec = get_compiled_belspec(self.version)
+        self.name = self.belspec.function_to_long.get(name, name)
+        self.function_type = self.belspec.function_types.get(self.name, "")
 
         self.parent = parent
 
@@ -119,17 +157,22 @@ class Function(object):
         self.args = []
         self.siblings = []
 
+        self.subtree_hash: Optional[bytes] = None  # see hash_subtree
+
     def update(self, name: str):
         """Update function"""
 
-        self.name = self.belspec["functions"]["to_long"].get(name, name)
-        self.name_short = self.belspec["functions"]["to_short"].get(name, name)
-        self.function_signature = self.belspec["functions"]["signatures"][self.name]
+        self.name = self.belspec.function_to_long.get(name, name)
         self.span = None
-        if self.name in self.belspec["functions"]["info"]:
-            self.function_type = self.belspec["functions"]["info"][self.name]["type"]
-        else:
-            self.function_type = ""
+        self.function_type = self.belspec.function_types.get(self.name, "")
+
+    @property
+    def name_short(self) -> str:
+        return self.belspec.function_to_short.get(self.name, self.name)
+
+    @property
+    def function_signature(self) -> dict:
+        return self.belspec.function_signatures[self.name]
 
     def is_primary(self):
         if self.function_type == "Primary":
@@ -144,6 +187,17 @@ class Function(object):
     def add_argument(self, arg):
         self.args.append(arg)
 
+    def get_ns_args(self, ns_args: List["NSArg"]) -> List["NSArg"]:
+        """Collect NSArgs of function and its function arguments"""
+
+        for arg in self.args:
+            if arg.type == "NSArg":
+                ns_args.append(arg)
+            elif arg.type == "Function":
+                arg.get_ns_args(ns_args)
+
+        return ns_args
+
     def add_sibling(self, sibling):
         self.siblings.append(sibling)
 
@@ -259,37 +313,17 @@ class Function(object):
         return orthologs
 
     def validate(self, errors: List[ValidationError] = None):
-        """Validate BEL Function"""
+        """Validate BEL Function
+
+        The validation errors of the function subtrees are memoized - see validate_subtree
+        """
 
         if errors is None:
             errors = []
 
-        # Collect term info for NSArgs before validation
-        if hasattr(self, "args"):
-            for arg in self.args:
-                if arg and arg.type == "NSArg":
-                    arg.entity.add_term()
-
-        # Validate function (or top-level args)
-        try:
-            errors.extend(validate_function(self))
-        except Exception as e:
-            logger.error(f"Could not validate function {self.to_string()} -- error: {str(e)}")
-            errors.append(
-                ValidationError(
-                    type="Assertion",
-                    severity="Error",
-                    msg=f"Could not validate function {self.to_string()} - unknown error",
-                )
-            )
+        hash_subtree(self)
 
-        # Recursively validate args that are functions
-        if hasattr(self, "args"):
-            for arg in self.args:
-                if arg and arg.type == "Function":
-                    arg.validate(errors=errors)
-
-        return errors
+        return validate_subtree(self, errors=errors)
 
     def to_string(
         self,
@@ -365,16 +399,30 @@ class Function(object):
 # Argument objects #
 #####################
 class Arg(object):
+
+    __slots__ = (
+        "optional",
+        "version",
+        "parent",
+        "siblings",
+        "belspec",
+        "sort_tuple",
+        "span",
+        "subtree_hash",
+        "__weakref__",
+    )
+
+    type = "Arg"
+
     def __init__(self, version: str = "latest", parent=None, span: Union[Span, NsArgSpan] = None):
 
         self.optional = False
-        self.type = "Arg"
         self.version = version
 
         self.parent = parent
         self.siblings = []
 
-        self.belspec = get_enhanced_belspec(self.version)
+        self.belspec = get_compiled_belspec(self.version)
 
         # https://github.com/belbio/bel/issues/13
 
@@ -389,6 +437,8 @@ class Arg(object):
 
         self.span: Span = span
 
+        self.subtree_hash: Optional[bytes] = None  # see hash_subtree
+
     def add_sibling(self, sibling):
 
         self.siblings.append(sibling)
@@ -414,13 +464,16 @@ class Arg(object):
 class NSArg(Arg):
     """Parsed NSArg value"""
 
+    __slots__ = ("entity",)
+
+    type = "NSArg"
+
     def __init__(self, entity: BelEntity, parent=None, span: NsArgSpan = None):
-        Arg.__init__(self, parent)
+        Arg.__init__(self, parent=parent, span=span)
 
         self.entity = entity
         self.span: NsArgSpan = span
         self.parent = parent
-        self.type = "NSArg"
 
     def canonicalize(
         self,
@@ -495,10 +548,14 @@ class NSArg(Arg):
 
 
 class StrArg(Arg):
+
+    __slots__ = ("value",)
+
+    type = "StrArg"
+
     def __init__(self, value, span: Span = None, parent=None):
-        Arg.__init__(self, parent, span)
+        Arg.__init__(self, parent=parent, span=span)
         self.value = value
-        self.type = "StrArg"
         self.span: Span = span
         self.parent = parent
 
@@ -537,10 +594,11 @@ class ParseInfo:
     Matching quotes need to be gathered first
     """
 
-    def __init__(self, assertion: AssertionStr = None, version: str = "latest"):
+    def __init__(self, assertion: AssertionStr = None, version: str = "latest", parser: str = None):
 
         self.assertion = assertion
         self.version = version
+        self.parser = parser  # parse_info backend - defaults to settings.BEL_PARSER
 
         self.matched_quotes: List[Pair] = []
         self.matched_parens: List[Pair] = []
@@ -556,13 +614,15 @@ class ParseInfo:
 
     def get_parse_info(self, assertion: str = "", version: str = "latest"):
         # Local
-        from bel.lang.parse import parse_info
+        from bel.lang.parse import get_cached_parse_info
 
         if assertion:
             self.assertion = assertion
 
         # Pass just the entire assertion string to parse_info
-        result = parse_info(self.assertion.entire, version=self.version)
+        result = get_cached_parse_info(
+            self.assertion.entire, version=self.version, parser=self.parser
+        )
 
         self.matched_quotes = result["matched_quotes"]
         self.matched_parens = result["matched_parens"]
@@ -602,9 +662,23 @@ class BELAst(object):
         object: Optional[Union[Function, "BELAst"]] = None,
         is_computed: bool = False,
         version: str = "latest",
+        parser: str = None,
+        intern: bool = False,
     ):
+        """BEL Assertion AST
+
+        Args:
+            intern: share structurally identical Function, NSArg and StrArg subtrees (and their
+                BEL Entities) with other interned ASTs - see intern_subtree. Only parsed,
+                read-only ASTs stay shared: canonicalize, decanonicalize, orthologize, validate
+                and bel.lang.incremental.reparse rebuild the shared subtrees first (see unshare),
+                so interning saves memory only for ASTs that are parsed and not modified
+        """
+
         self.version = bel.belspec.crud.check_version(version)
         self.assertion = assertion
+        self.parser = parser
+        self.interned = intern
 
         self.subject, self.relation, self.object = subject, relation, object
         self.args = []
@@ -615,7 +689,7 @@ class BELAst(object):
         if isinstance(self.relation, str):
             self.relation = Relation(self.relation, version=self.version)
 
-        self.belspec = get_enhanced_belspec(version)
+        self.belspec = get_compiled_belspec(version)
 
         self.type = "BELAst"
 
@@ -632,7 +706,7 @@ class BELAst(object):
                 msg = "Missing Assertion Subject or Relation"
                 self.errors.append(ValidationError(type="Assertion", severity="Error", msg=msg))
 
-        elif assertion and assertion.subject or assertion.relation or assertion.object:
+        elif assertion and (assertion.subject or assertion.relation or assertion.object):
             if assertion.relation and not assertion.object:
                 msg = "Missing Assertion Object"
                 self.errors.append(ValidationError(type="Assertion", severity="Error", msg=msg))
@@ -643,19 +717,44 @@ class BELAst(object):
         if not self.errors and self.assertion is not None and not self.args:
             self.parse()  # parse assertion into BEL AST
 
-    def parse(self):
-        """Assemble parsed component from Assertion string into AST"""
+    def parse(
+        self,
+        parse_info: ParseInfo = None,
+        functions: Mapping[int, Function] = None,
+        entities: Mapping[tuple, List[BelEntity]] = None,
+    ):
+        """Assemble parsed component from Assertion string into AST
 
-        self.parse_info = ParseInfo(self.assertion)
+        Args:
+            parse_info: parse info for the Assertion - created if not provided
+            functions: Function subtrees to reuse by span start instead of rebuilding them
+            entities: BEL Entities to reuse by NSArg (namespace, id, label) span strings
+
+        See bel.lang.incremental.reparse for the reuse of a prior AST's nodes
+        """
+
+        if parse_info is None:
+            parse_info = ParseInfo(self.assertion, version=self.version, parser=self.parser)
+
+        self.parse_info = parse_info
 
         self.errors.extend(self.parse_info.errors)
 
         function_stack = []
 
+        new_ns_args = []  # NSArgs without a reused BEL Entity
+
         parent_fn = None
 
+        reused_end = None  # end of reused Function subtree - its components are skipped
+
         for span in self.parse_info.components:
 
+            if reused_end is not None:
+                if span.start < reused_end:
+                    continue
+                reused_end = None
+
             if span.type == "end_paren":
                 if len(function_stack) > 0:
                     function_stack.pop()  # Pop parent_fn off stack
@@ -680,6 +779,17 @@ class BELAst(object):
 
             elif span.type == "function":
 
+                if functions and span.start in functions:
+                    fn = functions[span.start]
+                    fn.parent = parent_fn
+                    if parent_fn:
+                        parent_fn.args.append(fn)
+                    else:
+                        self.args.append(fn)
+
+                    reused_end = span.end
+                    continue
+
                 fn = Function(span.name.span_str, self.version, span=span)
 
                 if parent_fn:
@@ -693,18 +803,19 @@ class BELAst(object):
 
             elif span.type == "ns_arg":
 
-                if span.label:
-                    nsval = NsVal(
-                        namespace=span.namespace.span_str,
-                        id=span.id.span_str,
-                        label=span.label.span_str,
-                    )
-                else:
-                    nsval = NsVal(namespace=span.namespace.span_str, id=span.id.span_str)
+                key = (
+                    span.namespace.span_str,
+                    span.id.span_str,
+                    span.label.span_str if span.label else None,
+                )
 
-                entity = BelEntity(nsval=nsval)
+                entity = None
+                if entities and entities.get(key):
+                    entity = entities[key].pop()
 
                 ns_arg = NSArg(entity, span=span)
+                if entity is None:
+                    new_ns_args.append(ns_arg)
 
                 # Add parent Function
                 if parent_fn:
@@ -737,6 +848,27 @@ class BELAst(object):
             else:
                 logger.error(f"Unknown span type {span}")
 
+        if self.interned:
+            for idx, arg in enumerate(self.args):
+                self.args[idx], _ = intern_subtree(arg)
+
+            # Interned NSArgs already have BEL Entities
+            ns_args = {id(ns_arg): ns_arg for ns_arg in self.get_ns_args()}
+            new_ns_args = [ns_arg for ns_arg in new_ns_args if id(ns_arg) in ns_args]
+
+        for ns_arg in new_ns_args:
+            span = ns_arg.span
+            if span.label:
+                nsval = NsVal(
+                    namespace=span.namespace.span_str,
+                    id=span.id.span_str,
+                    label=span.label.span_str,
+                )
+            else:
+                nsval = NsVal(namespace=span.namespace.span_str, id=span.id.span_str)
+
+            ns_arg.entity = BelEntity(nsval=nsval)
+
         # Subject only assertion
         if len(self.args) == 1 and self.args[0].type == "Function":
             self.subject = self.args[0]
@@ -781,6 +913,42 @@ class BELAst(object):
 
         return self
 
+    def unshare(self):
+        """Replace interned subtrees by subtrees of this AST
+
+        Interned subtrees are shared with other ASTs (their spans and parents are those of the
+        first occurrence) - they are rebuilt from the parse info before the AST is validated or
+        modified. The BEL Entities are copied so their resolved term info is kept.
+        """
+
+        if not self.interned:
+            return self
+
+        self.interned = False
+        if getattr(self, "parse_info", None) is None:  # only parsed ASTs are interned
+            return self
+
+        entities = {}
+        for ns_arg in self.get_ns_args():
+            span = ns_arg.span
+            if span is None:
+                continue
+
+            key = (
+                span.namespace.span_str,
+                span.id.span_str,
+                span.label.span_str if span.label else None,
+            )
+            entity = copy.copy(ns_arg.entity)
+            entity.orthologs = dict(entity.orthologs)
+            entities.setdefault(key, []).append(entity)
+
+        self.subject, self.relation, self.object = None, None, None
+        self.args = []
+        self.errors = []
+
+        return self.parse(parse_info=self.parse_info, entities=entities)
+
     def canonicalize(
         self,
         canonical_targets: Mapping[str, List[str]] = settings.BEL_CANONICALIZE,
@@ -792,6 +960,9 @@ class BELAst(object):
         both canonical and decanonical forms in the same query
         """
 
+        self.resolve_terms(labels=False)
+        self.unshare()
+
         # Process AST top-level args or Function args
         if hasattr(self, "args"):
             for arg in self.args:
@@ -809,6 +980,15 @@ class BELAst(object):
 
         return self
 
+    def canonical_string(self, fmt: str = "medium") -> str:
+        """Canonicalized BEL Assertion string - same as canonicalize().to_string()
+
+        The AST is not modified - the canonical strings of the Function subtrees are memoized
+        and only the subtrees not seen before are canonicalized (as copies) - see subtree_strings
+        """
+
+        return self.to_string(fmt=fmt, function_strings=subtree_strings(self, fmt=fmt))
+
     def decanonicalize(
         self,
         canonical_targets: Mapping[str, List[str]] = settings.BEL_CANONICALIZE,
@@ -820,6 +1000,9 @@ class BELAst(object):
         both canonical and decanonical forms in the same query
         """
 
+        self.resolve_terms()
+        self.unshare()
+
         # Process AST top-level args or Function args
         if hasattr(self, "args"):
             for arg in self.args:
@@ -837,12 +1020,46 @@ class BELAst(object):
 
         return self
 
+    def resolve_terms(self, labels: bool = True):
+        """Resolve terms and (de)canonical forms of all BEL Entities in bulk - see resolve_terms"""
+
+        resolve_terms([self], labels=labels)
+
+        return self
+
+    def get_ns_args(self, ns_args: List[NSArg] = None) -> List[NSArg]:
+        """Collect NSArgs of the Assertion"""
+
+        if ns_args is None:
+            ns_args = []
+
+        for arg in self.args:
+            if arg is None:
+                continue
+            elif arg.type == "NSArg":
+                ns_args.append(arg)
+            elif arg.type == "Function":
+                arg.get_ns_args(ns_args)
+
+        return ns_args
+
+    def resolve_orthologs(self, species_keys: List[Key] = settings.BEL_ORTHOLOGIZE_TARGETS):
+        """Collect orthologs of all BEL Entities in bulk - see resolve_orthologs"""
+
+        resolve_orthologs([self], species_keys=species_keys)
+
+        return self
+
     def orthologize(self, species_key: Key):
         """Orthologize any orthologizable element
 
         Run orthologizable() method first to confirm that entire Assertion is
         orthologizable.
         """
+
+        self.resolve_orthologs(species_keys=[species_key])
+        self.unshare()
+
         if hasattr(self, "args"):
             for arg in self.args:
                 if arg and arg.type in ["NSArg", "Function"]:
@@ -850,6 +1067,17 @@ class BELAst(object):
 
         return self
 
+    def orthologized_string(self, species_key: Key, fmt: str = "medium") -> str:
+        """Orthologized BEL Assertion string - same as orthologize(species_key).to_string()
+
+        The AST is not modified - the orthologized strings of the Function subtrees are memoized
+        and only the subtrees not seen before are orthologized (as copies) - see subtree_strings
+        """
+
+        return self.to_string(
+            fmt=fmt, function_strings=subtree_strings(self, fmt=fmt, species_key=species_key)
+        )
+
     def orthologizable(self, species_key: Key):
         """Is this Assertion fully orthologizable?
 
@@ -857,6 +1085,8 @@ class BELAst(object):
         in a partially orthologized Assertion.
         """
 
+        self.resolve_orthologs()
+
         true_response = None
         if hasattr(self, "args"):
             for arg in self.args:
@@ -882,6 +1112,11 @@ class BELAst(object):
         if orthologs is None:
             orthologs = []
 
+        if orthologize_targets_keys is None:
+            self.resolve_orthologs()
+        else:
+            self.resolve_orthologs(species_keys=orthologize_targets_keys)
+
         if hasattr(self, "args"):
             for arg in self.args:
                 if arg and arg.type in ["NSArg", "Function"]:
@@ -908,6 +1143,17 @@ class BELAst(object):
     def validate(self):
         """Validate BEL Assertion"""
 
+        self.unshare()
+
+        # Get the terms of the BEL Entities in bulk instead of a query per BEL Entity
+        bel.terms.terms.prefetch_terms(
+            [
+                ns_arg.entity.nsval.key
+                for ns_arg in self.get_ns_args()
+                if ns_arg.entity is not None and not ns_arg.entity.has_term()
+            ]
+        )
+
         # Process AST top-level args or Function args
         if hasattr(self, "args"):
             for arg in self.args:
@@ -939,7 +1185,7 @@ class BELAst(object):
 
         return subcomponents
 
-    def to_string(self, fmt: str = "medium") -> str:
+    def to_string(self, fmt: str = "medium", function_strings: Mapping[int, str] = None) -> str:
         """Convert AST object to string
 
         Args:
@@ -947,7 +1193,8 @@ class BELAst(object):
                 short = short function and short relation format
                 medium = short function and long relation format
                 long = long function and long relation format
-            canonicalize
+            function_strings: strings to use for the top-level Functions by id(), e.g. their
+                canonical strings - see canonical_string
 
         Returns:
             str: string version of BEL AST
@@ -955,22 +1202,30 @@ class BELAst(object):
 
         # TODO - add handling for nested BEL Assertions
 
+        def node_string(node) -> str:
+            if function_strings and id(node) in function_strings:
+                return function_strings[id(node)]
+            elif isinstance(node, BELAst):
+                return node.to_string(fmt=fmt, function_strings=function_strings)
+
+            return node.to_string(fmt=fmt)
+
         if self.subject and self.relation and self.object:
             if isinstance(self.object, BELAst):
                 return "{} {} ({})".format(
-                    self.subject.to_string(fmt=fmt),
+                    node_string(self.subject),
                     self.relation.to_string(fmt=fmt),
-                    self.object.to_string(fmt=fmt),
+                    node_string(self.object),
                 )
             else:
                 return "{} {} {}".format(
-                    self.subject.to_string(fmt=fmt),
+                    node_string(self.subject),
                     self.relation.to_string(fmt=fmt),
-                    self.object.to_string(fmt=fmt),
+                    node_string(self.object),
                 )
 
         elif self.subject:
-            return "{}".format(self.subject.to_string(fmt=fmt))
+            return "{}".format(node_string(self.subject))
 
         else:
             return ""
@@ -1049,6 +1304,421 @@ class BELAst(object):
 #########################################################################################################
 
 
+def resolve_terms(
+    asts: List[BELAst],
+    canonical_targets: Mapping[str, List[str]] = settings.BEL_CANONICALIZE,
+    decanonical_targets: Mapping[str, List[str]] = settings.BEL_DECANONICALIZE,
+    labels: bool = True,
+) -> List[BELAst]:
+    """Resolve terms, labels and (de)canonical forms of the BEL Entities of many ASTs in bulk
+
+    The terms and equivalents of the NSArgs are retrieved in a fixed number of bulk queries per
+    chunk of BEL Entities (chunks fit into the term caches) and the BEL Entities are normalized
+    so that canonicalize() and decanonicalize() use the resolved BEL Entities.
+
+    Args:
+        labels: look up the labels of the normalized and decanonical forms in bulk - canonical
+            forms don't have labels
+    """
+
+    entities = {}  # interned ASTs share BEL Entities
+    for ast in asts:
+        for ns_arg in ast.get_ns_args():
+            entity = ns_arg.entity
+            if (entity.canonical is None or entity.decanonical is None) and not entity.orthologized:
+                entities[id(entity)] = entity
+    entities = list(entities.values())
+
+    # Each BEL Entity adds terms for its normalized, canonical and decanonical keys
+    chunk_size = max(1, bel.terms.terms.terms_cache.maxsize // 4)
+
+    for idx in range(0, len(entities), chunk_size):
+        chunk = entities[idx : idx + chunk_size]
+
+        # The terms can replace the NsVals of the BEL Entities, e.g. with the current term keys
+        bel.terms.terms.prefetch_terms(
+            [entity.nsval.key for entity in chunk if not entity.has_term()]
+        )
+        for entity in chunk:
+            if not entity.has_term():
+                entity.add_term()
+
+        keys = [entity.nsval.key for entity in chunk]
+        bel.terms.terms.prefetch_terms(keys)
+        equivalents = bel.terms.terms.prefetch_equivalents(
+            [
+                key
+                for key in keys
+                if key.split(":", 1)[0] in canonical_targets
+                or key.split(":", 1)[0] in decanonical_targets
+            ]
+        )
+
+        normalized_terms = []
+        for entity in chunk:
+            if entity.namespace_metadata and entity.namespace_metadata.namespace_type != "complete":
+                normalized_terms.append(None)  # no normalization for virtual namespaces
+                continue
+
+            normalized_terms.append(
+                bel.terms.terms.get_normalized_terms(
+                    entity.nsval.key,
+                    canonical_targets=canonical_targets,
+                    decanonical_targets=decanonical_targets,
+                    term=entity.term,
+                    equivalents=equivalents.get(entity.nsval.key),
+                )
+            )
+
+        for entity, normalized in zip(chunk, normalized_terms):
+            entity.normalize(
+                canonical_targets=canonical_targets,
+                decanonical_targets=decanonical_targets,
+                normalized=normalized,
+            )
+
+        if labels:
+            resolve_labels(
+                [nsval for entity in chunk for nsval in [entity.nsval, entity.decanonical]]
+            )
+
+    return asts
+
+
+def resolve_orthologs(
+    asts: List[BELAst], species_keys: List[Key] = settings.BEL_ORTHOLOGIZE_TARGETS
+) -> List[BELAst]:
+    """Collect the orthologs of the BEL Entities of many ASTs in bulk
+
+    The orthologs of the orthologizable BEL Entities (gene, RNA and protein entities with a
+    species) are retrieved in one query per chunk of BEL Entities and normalized in bulk
+    so that orthologizable() and orthologize() use the collected orthologs.
+    """
+
+    resolve_terms(asts, labels=False)
+
+    entities = {}  # interned ASTs share BEL Entities
+    for ast in asts:
+        for ns_arg in ast.get_ns_args():
+            entity = ns_arg.entity
+            entity.add_entity_types()
+            entity.add_species()
+            if (
+                entity.species_key
+                and not entity.orthologs
+                and not entity.orthologized
+                and intersect(entity.entity_types, ["Gene", "RNA", "Micro_RNA", "Protein", "all"])
+            ):
+                entities[id(entity)] = entity
+    entities = list(entities.values())
+
+    # Each BEL Entity adds terms for its orthologs and their canonical and decanonical keys
+    chunk_size = max(1, bel.terms.terms.terms_cache.maxsize // (3 * (len(species_keys) + 1)))
+
+    for idx in range(0, len(entities), chunk_size):
+        chunk = entities[idx : idx + chunk_size]
+
+        orthologs = bel.terms.orthologs.get_orthologs_many(
+            [entity.canonical.key for entity in chunk], species_keys=species_keys
+        )
+
+        ortholog_keys = list(
+            dict.fromkeys(
+                [
+                    ortholog_key
+                    for entity_orthologs in orthologs.values()
+                    for ortholog_key in entity_orthologs.values()
+                ]
+            )
+        )
+        bel.terms.terms.prefetch_terms(ortholog_keys)
+        bel.terms.terms.prefetch_equivalents(
+            [
+                key
+                for key in ortholog_keys
+                if key.split(":", 1)[0] in settings.BEL_CANONICALIZE
+                or key.split(":", 1)[0] in settings.BEL_DECANONICALIZE
+            ]
+        )
+
+        for entity in chunk:
+            entity.collect_orthologs(
+                species_keys=species_keys, orthologs=orthologs[entity.canonical.key]
+            )
+
+    return asts
+
+
+def nsval_content(nsval: Optional[NsVal]) -> str:
+    """NsVal namespace, id and label (if provided or already looked up) for subtree hashes"""
+
+    if nsval is None:
+        return "\x00"
+
+    return f"{nsval.namespace}\x1f{nsval.id}\x1f{nsval.label if nsval.has_label() else chr(0)}"
+
+
+def hash_node(node) -> Optional[bytes]:
+    """Set the subtree hash of a Function, NSArg or StrArg from its content and args
+
+    The subtree hash is a stable (blake2b) Merkle hash of the function names, NSArg BEL
+    Entities (original and current NsVals) and StrArg values and of the span layout relative to
+    the subtree start - so memoized validation errors can be moved to other positions. The args
+    must be hashed first - see hash_subtree.
+
+    Returns:
+        Optional[bytes]: subtree hash - None if the subtree can't be hashed (e.g. it contains
+            unknown strings or nodes without spans)
+    """
+
+    if node.type not in ["Function", "NSArg", "StrArg"]:
+        return None
+
+    node.subtree_hash = None
+    if node.span is None:
+        return None
+
+    if node.type == "Function":
+        content = f"Function\x1f{node.version}\x1f{node.name}\x1f{node.span.end - node.span.start}"
+        digest = hashlib.blake2b(content.encode(), digest_size=16)
+        for arg in node.args:
+            if getattr(arg, "subtree_hash", None) is None or arg.span is None:
+                return None
+            digest.update(b"\x1f%d\x1f" % (arg.span.start - node.span.start))
+            digest.update(arg.subtree_hash)
+
+        node.subtree_hash = digest.digest()
+        return node.subtree_hash
+
+    if node.type == "StrArg":
+        content = f"StrArg\x1f{node.value}\x1f{node.span.span_str}"
+    elif node.entity is None:  # BEL Entities are added after parsing - see BELAst.parse
+        content = f"NSArg\x1f{node.span.span_str}"
+    else:
+        content = (
+            f"NSArg\x1f{node.span.span_str}\x1f{nsval_content(node.entity.original_nsval)}"
+            f"\x1f{nsval_content(node.entity.nsval)}\x1f{node.entity.orthologized}"
+        )
+
+    node.subtree_hash = hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+    return node.subtree_hash
+
+
+def hash_subtree(node) -> Optional[bytes]:
+    """Set the subtree hashes of node and its args bottom-up - see hash_node
+
+    Subtree hashes reflect the subtree when hashed - they are recomputed before use as
+    canonicalize(), orthologize(), etc. modify the subtree.
+    """
+
+    if node.type == "Function":
+        for arg in node.args:
+            hash_subtree(arg)
+
+    return hash_node(node)
+
+
+def intern_subtree(node, hashed: bool = False) -> Tuple[Any, Optional[bytes]]:
+    """Share structurally identical Function, NSArg and StrArg subtrees via interned_nodes
+
+    The subtrees are keyed by their subtree hash (see hash_node) - the args of Functions not
+    seen before are interned as well. Interned subtrees must not be modified - ASTs rebuild
+    them before validating or modifying them (see BELAst.unshare).
+
+    Args:
+        hashed: the subtree hashes are already set
+
+    Returns:
+        Tuple[Any, Optional[bytes]]: interned node (node if not seen before) and its subtree
+            hash - None if the subtree can't be interned (e.g. it contains unknown strings)
+    """
+
+    if not hashed:
+        hash_subtree(node)
+
+    key = getattr(node, "subtree_hash", None)
+    if key is not None:
+        interned = interned_nodes.get(key)
+        if interned is not None:
+            return interned, key
+
+        interned_nodes[key] = node
+
+    if node.type == "Function":
+        for idx, arg in enumerate(node.args):
+            node.args[idx], _ = intern_subtree(arg, hashed=True)
+
+    return node, key
+
+
+def validate_subtree(fn: Function, errors: List[ValidationError] = None) -> List[ValidationError]:
+    """Validate function and its function args - memoized by subtree hash
+
+    The validation errors of a subtree only depend on the subtree (incl. its span layout), the
+    name of its parent function and the resources version. Memoized errors are moved to the position of the subtree.
+    The subtree hashes must be set - see hash_subtree.
+    """
+
+    if errors is None:
+        errors = []
+
+    key = None
+    if fn.subtree_hash is not None:
+        key = (
+            fn.subtree_hash,
+            getattr(fn.parent, "name", None),
+            fn.version,
+            bel.resources.namespace.get_resources_version(),
+        )
+        memoized = validation_cache.get(key)
+        if memoized is not None:
+            # The BEL Entities get their term info as with validation
+            add_subtree_terms(fn)
+
+            start, memoized_errors = memoized
+            errors.extend([shift_error(error, fn.span.start - start) for error in memoized_errors])
+            return errors
+
+    subtree_errors = []
+
+    # Collect term info for NSArgs before validation
+    for arg in fn.args:
+        if arg and arg.type == "NSArg":
+            arg.entity.add_term()
+
+    # Validate function (or top-level args)
+    try:
+        subtree_errors.extend(validate_function(fn))
+    except Exception as e:
+        logger.error(f"Could not validate function {fn.to_string()} -- error: {str(e)}")
+        subtree_errors.append(
+            ValidationError(
+                type="Assertion",
+                severity="Error",
+                msg=f"Could not validate function {fn.to_string()} - unknown error",
+            )
+        )
+
+    # Recursively validate args that are functions
+    for arg in fn.args:
+        if arg and arg.type == "Function":
+            validate_subtree(arg, errors=subtree_errors)
+
+    if key is not None:
+        validation_cache[key] = (fn.span.start, [error.copy() for error in subtree_errors])
+
+    errors.extend(subtree_errors)
+
+    return errors
+
+
+def add_subtree_terms(fn: Function):
+    """Collect term info for the NSArgs of the function subtree"""
+
+    for arg in fn.args:
+        if arg and arg.type == "NSArg":
+            if arg.entity.term is None:
+                arg.entity.add_term()
+        elif arg and arg.type == "Function":
+            add_subtree_terms(arg)
+
+
+def shift_error(error: ValidationError, offset: int) -> ValidationError:
+    """Copy of validation error moved by offset in the Assertion string"""
+
+    if error.visual_pairs is None or offset == 0:
+        return error.copy()
+
+    # Unknown BEL Entity warnings include their position - see validate_function
+    msg = error.msg
+    suffix = f" at position {error.index}"
+    if msg.endswith(suffix):
+        msg = f"{msg[:-len(suffix)]} at position {error.index + offset}"
+
+    return error.copy(
+        update={
+            "msg": msg,
+            "index": error.index + offset,
+            "visual_pairs": [(start + offset, end + offset) for start, end in error.visual_pairs],
+        }
+    )
+
+
+def copy_subtree(node, parent=None):
+    """Copy Function, NSArg or StrArg subtree - BEL Entities are copied as well"""
+
+    node_copy = copy.copy(node)
+    node_copy.parent = node.parent if parent is None else parent
+    node_copy.siblings = list(node.siblings)
+
+    if node.type == "Function":
+        node_copy.args = [copy_subtree(arg, parent=node_copy) for arg in node.args]
+
+    elif node.type == "NSArg":
+        node_copy.entity = copy.copy(node.entity)
+        node_copy.entity.orthologs = dict(node.entity.orthologs)
+
+    return node_copy
+
+
+def subtree_strings(ast: BELAst, fmt: str = "medium", species_key: Key = None) -> Mapping[int, str]:
+    """Canonical strings of the top-level Functions of the AST by id()
+
+    The strings are memoized by subtree hash, BEL version and resources version. The Functions not
+    seen before are copied and canonicalized in bulk so that the AST is not modified.
+
+    Args:
+        species_key: orthologized to species_key instead of canonical strings
+    """
+
+    operation = ("orthologized", species_key) if species_key else ("canonical",)
+    resources_version = bel.resources.namespace.get_resources_version()
+
+    strings = {}
+    missing = []
+    for fn in ast.args:
+        if fn is None or fn.type != "Function":
+            continue
+
+        key = hash_subtree(fn)
+        if key is not None:
+            key = (key, operation, fmt, fn.version, resources_version)
+            if key in subtree_strings_cache:
+                strings[id(fn)] = subtree_strings_cache[key]
+                continue
+
+        missing.append((fn, key))
+
+    if not missing:
+        return strings
+
+    copies = [BELAst(subject=copy_subtree(fn), version=ast.version) for fn, _ in missing]
+    if species_key:
+        resolve_orthologs(copies, species_keys=[species_key])
+    else:
+        resolve_terms(copies, labels=False)
+
+    for (fn, key), ast_copy in zip(missing, copies):
+        if species_key:
+            ast_copy.orthologize(species_key)
+        else:
+            ast_copy.canonicalize()
+
+        strings[id(fn)] = ast_copy.subject.to_string(fmt=fmt)
+        if key is not None:
+            subtree_strings_cache[key] = strings[id(fn)]
+
+    return strings
+
+
+def clear_subtree_caches():
+    """Clear the memoized validation errors and strings of subtrees"""
+
+    validation_cache.clear()
+    subtree_strings_cache.clear()
+
+
 def match_signatures(args, signatures):
     """Which signature to use"""
 
@@ -1071,33 +1741,14 @@ def intersect(list1, list2) -> bool:
     return True
 
 
-def check_str_arg(value: str, check_values: List[str]) -> Optional[str]:
-    """Check StrArg value"""
-
-    regex_flag = False
-    for check_value in check_values:
-        if re.match("/", check_value):
-            # TODO - figure out how to make this work
-            # regex_flag = True
-            # print("Check value", check_value)
-            # match = re.match(r""+check_value, value)
-            # if match:
-            #     break
-            regex_flag = True
-            break
-
-        elif (
-            check_value in strarg_validation_lists and value in strarg_validation_lists[check_value]
-        ):
-            break
+def check_str_arg(value: str, argument: SignatureArgument) -> Optional[str]:
+    """Check StrArg value against the compiled signature argument"""
 
-    else:
-        if regex_flag:
-            return f"String Argument {value} doesn't match required format: {repr(check_values)}"
-        else:
-            return f"String Argument {value} not found in {check_values} default BEL namespaces"
+    # TODO - check StrArg format (/regex/) values
+    if argument.strarg_format or value in argument.strarg_values:
+        return None
 
-    return None
+    return f"String Argument {value} not found in {list(argument.values)} default BEL namespaces"
 
 
 def validate_function(fn: Function, errors: List[ValidationError] = None) -> List[ValidationError]:
@@ -1121,13 +1772,7 @@ def validate_function(fn: Function, errors: List[ValidationError] = None) -> Lis
         )
         return errors
 
-    signatures = fn.function_signature["signatures"]
-
-    # Select signature from signatures
-    if len(signatures) > 1:
-        signature = match_signatures(fn.args, signatures)
-    else:
-        signature = signatures[0]
+    signature = fn.belspec.select_signature(fn.name, fn.args)
 
     if not signature:
         errors.append(
@@ -1146,93 +1791,71 @@ def validate_function(fn: Function, errors: List[ValidationError] = None) -> Lis
 
     # First pass - check required positional arguments
     fn_max_args = len(fn.args) - 1
-    for argument in signature["arguments"]:
-        if argument["position"] is not None and argument["optional"] == False:
-            position = argument["position"]
+    for argument in signature.required:
+        position = argument.position
 
-            # Arg type mis-match
-            if position > fn_max_args:
-                errors.append(
-                    ValidationError(
-                        type="Assertion",
-                        severity="Error",
-                        msg=f"Missing required argument - type: {argument['type']}",
-                        visual_pairs=[(fn.span.start, fn.span.end)],
-                        index=fn.span.start,
-                    )
+        # Arg type mis-match
+        if position > fn_max_args:
+            errors.append(
+                ValidationError(
+                    type="Assertion",
+                    severity="Error",
+                    msg=f"Missing required argument - type: {argument.type}",
+                    visual_pairs=[(fn.span.start, fn.span.end)],
+                    index=fn.span.start,
                 )
+            )
 
-            # elif (
-            #     fn.args[position]
-            #     and fn.args[position].type == "Function"
-            #     and fn.args[position].function_type not in argument["type"]
-            # ):
-            #     errors.append(
-            #         ValidationError(
-            #             type="Assertion",
-            #             severity="Error",
-            #             msg=f"Incorrect function type '{fn.args[position].type}' at position: {position} for function: {fn.name}, should be one of {argument['type']}",
-            #             visual_pairs=[(fn.args[position].span.start, fn.args[position].span.end)],
-            #             index=fn.args[position].span.start,
-            #         )
-            #     )
-
-            # Function name mis-match
-            elif (
-                fn.args[position]
-                and fn.args[position].type == "Function"
-                and not (fn.args[position].name in argument["values"])
-            ):
-                errors.append(
-                    ValidationError(
-                        type="Assertion",
-                        severity="Error",
-                        msg=f"Incorrect function for argument '{fn.args[position].name}' at position: {position} for function: {fn.name}",
-                        visual_pairs=[(fn.args[position].span.start, fn.args[position].span.end)],
-                        index=fn.args[position].span.start,
-                    )
+        # Function name mis-match
+        elif (
+            fn.args[position]
+            and fn.args[position].type == "Function"
+            and fn.args[position].name not in argument.functions
+        ):
+            errors.append(
+                ValidationError(
+                    type="Assertion",
+                    severity="Error",
+                    msg=f"Incorrect function for argument '{fn.args[position].name}' at position: {position} for function: {fn.name}",
+                    visual_pairs=[(fn.args[position].span.start, fn.args[position].span.end)],
+                    index=fn.args[position].span.start,
                 )
+            )
 
-            # Wrong [non-function] argument type
-            elif (
-                fn.args[position]
-                and fn.args[position].type != "Function"
-                and fn.args[position].type not in argument["type"]
-            ):
-                errors.append(
-                    ValidationError(
-                        type="Assertion",
-                        severity="Error",
-                        msg=f"Incorrect argument type '{fn.args[position].type}' at position: {position} for function: {fn.name}, should be one of {argument['type']}",
-                        visual_pairs=[(fn.args[position].span.start, fn.args[position].span.end)],
-                        index=fn.args[position].span.start,
-                    )
+        # Wrong [non-function] argument type
+        elif (
+            fn.args[position]
+            and fn.args[position].type != "Function"
+            and fn.args[position].type not in argument.arg_types
+        ):
+            errors.append(
+                ValidationError(
+                    type="Assertion",
+                    severity="Error",
+                    msg=f"Incorrect argument type '{fn.args[position].type}' at position: {position} for function: {fn.name}, should be one of {argument.type}",
+                    visual_pairs=[(fn.args[position].span.start, fn.args[position].span.end)],
+                    index=fn.args[position].span.start,
                 )
+            )
 
-            post_positional = position + 1
+        post_positional = position + 1
 
     # Checking optional positional arguments - really just adjusting post_positional value
-    for argument in signature["arguments"]:
-        if argument["position"] is not None and argument["optional"] == True:
-            position = argument["position"]
+    for argument in signature.optional_positional:
+        position = argument.position
 
-            if position > fn_max_args:
-                break
-
-            if argument["type"] == ["StrArgNSArg"]:
-                argument["type"].extend(["NSArg", "StrArg"])
+        if position > fn_max_args:
+            break
 
-            if (  # Function match
-                fn.args[position].type == "Function"
-                and fn.args[position].name in argument["values"]
-            ) or (  # NSArg/StrArg type match
-                fn.args[position].type in ["NSArg", "StrArg"]
-                and fn.args[position].type in argument["type"]
-            ):
-                post_positional = position + 1
+        if (  # Function match
+            fn.args[position].type == "Function" and fn.args[position].name in argument.functions
+        ) or (  # NSArg/StrArg type match
+            fn.args[position].type in argument.arg_types
+        ):
+            post_positional = position + 1
 
     # Second pass optional, single arguments (e.g. loc(), ma())
-    opt_args = signature["opt_args"]
+    opt_args = signature.opt_args
     check_opt_args = {}
     problem_opt_args = set()
     for fn_arg in fn.args[post_positional:]:
@@ -1255,7 +1878,7 @@ def validate_function(fn: Function, errors: List[ValidationError] = None) -> Lis
         )
 
     # Third pass - non-positional (primary/modifier) args that don't show up in opt_args or mult_args
-    opt_and_mult_args = opt_args + signature["mult_args"]
+    opt_and_mult_args = signature.opt_and_mult_args
     for fn_arg in fn.args[post_positional:]:
         if fn_arg.type == "Function" and fn_arg.name not in opt_and_mult_args:
             errors.append(
@@ -1298,86 +1921,71 @@ def validate_function(fn: Function, errors: List[ValidationError] = None) -> Lis
             )
 
     # Fourth pass - positional NSArg entity_types checks
-    for argument in signature["arguments"]:
-        if argument["position"] is not None:
-            position = argument["position"]
+    for argument in signature.positional:
+        position = argument.position
 
-            if position > fn_max_args:
-                break
+        if position > fn_max_args:
+            break
 
-            if (
-                fn.args[position].type == "NSArg"
-                and argument["type"] in ["NSArg", "StrArgNSArg"]
-                and not fn.args[position].entity.namespace_metadata
-            ):
-                errors.append(
-                    ValidationError(
-                        type="Assertion",
-                        severity="Warning",
-                        msg=f"Unknown BEL Entity '{fn.args[position].entity.nsval.key_label}' for the {fn.name} function at position {fn.args[position].span.namespace.start}",
-                        visual_pairs=[
-                            (
-                                fn.args[position].span.namespace.start,
-                                fn.args[position].span.namespace.end,
-                            )
-                        ],
-                        index=fn.args[position].span.namespace.start,
-                    )
+        if not (argument.check_entity_types and fn.args[position].type == "NSArg"):
+            continue
+
+        if not fn.args[position].entity.namespace_metadata:
+            errors.append(
+                ValidationError(
+                    type="Assertion",
+                    severity="Warning",
+                    msg=f"Unknown BEL Entity '{fn.args[position].entity.nsval.key_label}' for the {fn.name} function at position {fn.args[position].span.namespace.start}",
+                    visual_pairs=[
+                        (
+                            fn.args[position].span.namespace.start,
+                            fn.args[position].span.namespace.end,
+                        )
+                    ],
+                    index=fn.args[position].span.namespace.start,
                 )
+            )
 
-            elif (
-                fn.args[position].type == "NSArg"
-                and argument["type"] in ["NSArg", "StrArgNSArg"]
-                and not (
-                    intersect(
-                        fn.args[position].entity.get_entity_types(), argument["values"] + ["All"]
-                    )
+        elif not intersect(fn.args[position].entity.get_entity_types(), argument.entity_types):
+
+            if fn.args[position].entity.term:
+                error_msg = f"Wrong entity type for BEL Entity at argument position {position} for function {fn.name} - expected {list(argument.values)}, actual: entity_types: {fn.args[position].entity.entity_types}"
+            else:
+                error_msg = f"Unknown BEL Entity at argument position {position} for function {fn.name} - cannot determine if correct entity type."
+
+            errors.append(
+                ValidationError(
+                    type="Assertion",
+                    severity="Warning",
+                    msg=error_msg,
+                    visual_pairs=[(fn.args[position].span.start, fn.args[position].span.end)],
+                    index=fn.args[position].span.start,
                 )
-            ):
+            )
 
-                if fn.args[position].entity.term:
-                    error_msg = f"Wrong entity type for BEL Entity at argument position {position} for function {fn.name} - expected {argument['values']}, actual: entity_types: {fn.args[position].entity.entity_types}"
-                else:
-                    error_msg = f"Unknown BEL Entity at argument position {position} for function {fn.name} - cannot determine if correct entity type."
+    # Fifth pass - positional StrArg checks
+    for argument in signature.positional:
+        position = argument.position
+
+        if position > fn_max_args:
+            break
+
+        if argument.check_strarg and fn.args[position].type == "StrArg":
+            str_error = check_str_arg(fn.args[position].value, argument)
 
+            if str_error is not None:
                 errors.append(
                     ValidationError(
                         type="Assertion",
-                        severity="Warning",
-                        msg=error_msg,
+                        severity="Error",
+                        msg=str_error,
                         visual_pairs=[(fn.args[position].span.start, fn.args[position].span.end)],
                         index=fn.args[position].span.start,
                     )
                 )
-
-    # Fifth pass - positional StrArg checks
-    for argument in signature["arguments"]:
-        if argument["position"] is not None:
-            position = argument["position"]
-
-            if position > fn_max_args:
-                break
-
-            if fn.args[position].type == "StrArg" and argument["type"] in ["StrArg", "StrArgNSArg"]:
-                str_error = check_str_arg(fn.args[position].value, argument["values"])
-
-                if str_error is not None:
-                    errors.append(
-                        ValidationError(
-                            type="Assertion",
-                            severity="Error",
-                            msg=str_error,
-                            visual_pairs=[
-                                (fn.args[position].span.start, fn.args[position].span.end)
-                            ],
-                            index=fn.args[position].span.start,
-                        )
-                    )
     # Sixth pass - non-positional StrArgs are errors
     for idx, arg in enumerate(fn.args):
-        if arg.type == "StrArg" and (
-            idx > len(signature["arguments"]) - 1 or signature["arguments"][idx]["position"] is None
-        ):
+        if arg.type == "StrArg" and idx not in signature.positional_indexes:
             errors.append(
                 ValidationError(
                     type="Assertion",
@@ -1427,37 +2035,27 @@ def validate_function(fn: Function, errors: List[ValidationError] = None) -> Lis
 def sort_function_args(fn: Function):
     """Add sort tuple values to function arguments for canonicalization and sort function arguments"""
 
-    signatures = fn.function_signature["signatures"]
-
-    # Select signature from signatures
-    if len(signatures) > 1:
-        signature = match_signatures(fn.args, signatures)
-    else:
-        signature = signatures[0]
+    signature = fn.belspec.select_signature(fn.name, fn.args)
 
     fn_max_args = len(fn.args) - 1
 
     post_positional = 0
-    for arg in signature["arguments"]:
-        if arg["position"]:
-            position = arg["position"]
+    for arg in signature.positional:
+        if arg.position:
+            position = arg.position
             if position > fn_max_args:
                 return None
 
-            if arg["optional"] == False:
+            if arg.optional == False:
                 fn.args[position].sort_tuple = (position,)
                 post_positional = position + 1
 
-            elif arg["optional"] == True:
-
-                if arg["type"] == ["StrArgNSArg"]:
-                    arg["type"].extend(["NSArg", "StrArg"])
+            elif arg.optional == True:
 
                 if (  # Function match
-                    fn.args[position].type == "Function" and fn.args[position].name in arg["values"]
+                    fn.args[position].type == "Function" and fn.args[position].name in arg.functions
                 ) or (  # NSArg/StrArg type match
-                    fn.args[position].type in ["NSArg", "StrArg"]
-                    and fn.args[position].type in arg["type"]
+                    fn.args[position].type in arg.arg_types
                 ):
                     fn.args[position].sort_tuple = (position,)
                     post_positional = position + 1
@@ -13,6 +13,7 @@ import bel.belspec.crud
 import bel.core.settings as settings
 import bel.terms.terms
 from bel.lang.ast import BELAst
+from bel.lang.computed_edges import compute_edges
 from bel.schemas.bel import AssertionStr, Key
 
 sys.path.append("../")
@@ -164,6 +165,21 @@ class BEL(object):
         else:
             return {}
 
+    def compute_edges(self, fmt: str = "medium") -> List[dict]:
+        """Computed edges of the BEL Assertion - see bel.lang.computed_edges
+
+        Args:
+            fmt (str): short, medium or long formatted BEL Edges
+
+        Returns:
+            List[dict]: BEL triples of the computed edges
+        """
+
+        if self.ast:
+            return [edge.to_triple(fmt=fmt) for edge in compute_edges([self.ast])]
+        else:
+            return []
+
     def print_tree(self) -> str:
         """Convert AST object to tree view of BEL AST
 
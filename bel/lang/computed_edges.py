@@ -0,0 +1,164 @@
+"""Computed edges
+
+Computed edges use the bel.belspec.specifications.additional_computed_relations and are derived
+from the Functions of the parsed BEL Assertions, e.g.
+
+    complex(p(HGNC:AKT1), p(HGNC:EGF)) hasComponent p(HGNC:AKT1)
+    p(HGNC:AKT1) hasModification p(HGNC:AKT1, pmod(Ph))
+"""
+
+# Standard Library
+from typing import Iterable, Iterator, List, MutableSet, Optional, Tuple
+
+# Local
+from bel.lang.ast import BELAst, Function, hash_subtree
+
+# Function -> relation from the Function to each of its args
+component_relations = {"complexAbundance": "hasComponent", "compositeAbundance": "hasAssociation"}
+
+# Modifier function -> relation from the unmodified abundance to the modified abundance
+modifier_relations = {
+    "proteinModification": "hasModification",
+    "variant": "hasVariant",
+    "fragment": "hasFragment",
+    "location": "hasLocation",
+}
+
+# reactants/products function -> relation from the reaction to each of its args
+reaction_relations = {"reactants": "hasReactant", "products": "hasProduct"}
+
+# Assertion relation with a list() object -> relation from the subject to each list member
+list_relations = {"hasMembers": "hasMember", "hasComponents": "hasComponent"}
+
+
+def function_edges(fn: Function) -> List[Tuple]:
+    """Computed edges (subject, relation, object) of the Function and its modifier args
+
+    The edges only depend on the Function subtree - modifier, fusion and reactants/products
+    args are handled by their parent Function.
+    """
+
+    edges = []
+
+    if fn.name in component_relations:
+        # Named complexes, e.g. complex(SCOMP:"AP-1 Complex"), have no listed components
+        relation = component_relations[fn.name]
+        edges.extend([(fn, relation, arg) for arg in fn.args if arg.type == "Function"])
+
+    elif fn.name == "activity" and fn.args:
+        edges.append((fn.args[0], "hasActivity", fn))
+
+    for arg in fn.args:
+        if arg.type != "Function":
+            continue
+
+        if arg.name in modifier_relations:
+            abundance = Function(fn.name, version=fn.version)
+            abundance.args = [fn.args[0]]
+            edges.append((abundance, modifier_relations[arg.name], fn))
+
+        elif arg.name == "fusion":
+            for partner in arg.args[0:3:2]:  # 5' and 3' fusion partners
+                abundance = Function(fn.name, version=fn.version)
+                abundance.args = [partner]
+                edges.append((abundance, "hasFusion", fn))
+
+        elif arg.name in reaction_relations:
+            relation = reaction_relations[arg.name]
+            edges.extend([(fn, relation, reactant) for reactant in arg.args])
+
+    return edges
+
+
+def assertion_edges(ast: BELAst) -> List[Tuple]:
+    """Computed edges (subject, relation, object) of Assertions with list() objects"""
+
+    edges = []
+    while isinstance(ast, BELAst):
+        if (
+            ast.relation
+            and ast.relation.name in list_relations
+            and isinstance(ast.object, Function)
+            and ast.object.name == "list"
+        ):
+            relation = list_relations[ast.relation.name]
+            edges.extend([(ast.subject, relation, arg) for arg in ast.object.args])
+
+        ast = ast.object  # nested Assertion
+
+    return edges
+
+
+def compute_edges(
+    asts: Iterable[BELAst],
+    expanded: Optional[MutableSet[bytes]] = None,
+    emitted: Optional[MutableSet[str]] = None,
+) -> Iterator[BELAst]:
+    """Generate the deduplicated computed edges of a stream of ASTs
+
+    The Function subtrees of each AST are walked once - subtrees with the subtree hash of an
+    already expanded subtree (see bel.lang.ast.hash_subtree) are skipped together with their
+    args, so the computed edges are only derived once per distinct subtree.
+
+    Args:
+        asts: parsed BEL Assertions
+        expanded: subtree hashes of expanded Functions - pass the same set to continue
+            deduplicating across batches
+        emitted: computed edge strings already generated - pass the same set to continue
+            deduplicating across batches
+
+    Yields:
+        BELAst: computed edge (is_computed=True)
+    """
+
+    if expanded is None:
+        expanded = set()
+    if emitted is None:
+        emitted = set()
+
+    node_strings = {}  # by subtree hash
+
+    def node_string(node) -> str:
+        subtree_hash = getattr(node, "subtree_hash", None)
+        if subtree_hash is None:
+            return node.to_string()
+
+        if subtree_hash not in node_strings:
+            node_strings[subtree_hash] = node.to_string()
+
+        return node_strings[subtree_hash]
+
+    for ast in asts:
+        edges = assertion_edges(ast)
+
+        stack = []
+        for arg in reversed(ast.args):
+            if arg is not None and arg.type == "Function":
+                hash_subtree(arg)
+                stack.append(arg)
+
+        while stack:
+            fn = stack.pop()
+
+            if fn.subtree_hash is not None:
+                if fn.subtree_hash in expanded:
+                    continue
+                expanded.add(fn.subtree_hash)
+
+            edges.extend(function_edges(fn))
+
+            stack.extend([arg for arg in reversed(fn.args) if arg.type == "Function"])
+
+        for subject, relation, object_ in edges:
+            key = f"{node_string(subject)} {relation} {node_string(object_)}"
+            if key in emitted:
+                continue
+            emitted.add(key)
+
+            yield BELAst(
+                subject=subject,
+                relation=relation,
+                object=object_,
+                is_computed=True,
+                version=ast.version,
+            )
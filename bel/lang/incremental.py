@@ -0,0 +1,349 @@
+"""Incremental re-parsing of BEL Assertions
+
+Editors re-parse the Assertion on every keystroke. reparse() applies an edit (offset, deleted
+length, inserted text) to a parsed BELAst: only the innermost function enclosing the edit is
+re-lexed and spliced into the prior parse info, and the Function subtrees and BEL Entities (with
+their resolved term info) outside of the edit are moved from the prior AST into the new AST
+instead of being rebuilt.
+"""
+
+# Standard Library
+from bisect import bisect_left
+from typing import List, Mapping, Optional
+
+# Local
+from bel.lang.ast import BELAst, Function, ParseInfo
+from bel.lang.parse import check_relations_count, get_cached_parse_info, parse_info
+from bel.lang.spans import FunctionSpan
+from bel.schemas.bel import AssertionStr, BelEntity, Pair
+
+
+def reparse(ast: BELAst, offset: int, deleted: int, inserted: str) -> BELAst:
+    """Re-parse BEL Assertion AST after an edit of the Assertion string
+
+    Args:
+        ast: prior BEL AST - its unchanged Function subtrees and BEL Entities are moved into
+            the new AST so it should not be used after re-parsing
+        offset: index of the edit in the prior Assertion string
+        deleted: number of characters deleted at offset
+        inserted: string inserted at offset
+
+    Returns:
+        BELAst: same AST as parsing the edited Assertion string from scratch
+    """
+
+    if ast.assertion is None:
+        raise ValueError("Can only re-parse a BEL AST parsed from an Assertion string")
+
+    assertion_str = ast.assertion.entire
+    if offset < 0 or deleted < 0 or offset + deleted > len(assertion_str):
+        raise ValueError(
+            f"Edit offset: {offset} deleted: {deleted} is outside of the Assertion string"
+        )
+
+    # Interned subtrees are shared with other ASTs - only this AST's own nodes can be moved
+    ast.unshare()
+
+    new_assertion_str = assertion_str[:offset] + inserted + assertion_str[offset + deleted :]
+    delta = len(inserted) - deleted
+
+    new_ast = BELAst(version=ast.version, parser=ast.parser)
+    new_ast.assertion = AssertionStr(entire=new_assertion_str)
+
+    prior = getattr(ast, "parse_info", None)  # not set if the prior AST had Assertion errors
+    if prior is None:
+        return new_ast.parse()
+
+    # Re-lex just the edited function if possible - the components outside of it are unchanged
+    result = None
+    edited = edited_function(prior, offset, deleted)
+    if edited:
+        result = splice_parse_info(prior, edited, new_assertion_str, delta, ast.version)
+
+    if result is None:
+        result = get_cached_parse_info(new_assertion_str, version=ast.version, parser=ast.parser)
+        start, end, verify = offset, offset + deleted, True
+    else:
+        start, end, verify = edited.start, edited.end, False
+
+    new_parse_info = ParseInfo(version=ast.version, parser=ast.parser)
+    new_parse_info.assertion = new_ast.assertion
+    new_parse_info.matched_quotes = result["matched_quotes"]
+    new_parse_info.matched_parens = result["matched_parens"]
+    new_parse_info.commas = result["commas"]
+    new_parse_info.components = result["components"]
+    new_parse_info.errors = result["errors"]
+
+    functions = reusable_functions(ast, prior, new_parse_info, start, end, delta, verify)
+    entities = reusable_entities(ast, functions)
+
+    return new_ast.parse(parse_info=new_parse_info, functions=functions, entities=entities)
+
+
+def edited_function(prior: ParseInfo, offset: int, deleted: int) -> Optional[FunctionSpan]:
+    """Innermost function of an error-free prior parse whose arguments enclose the edit"""
+
+    if prior.errors:
+        return None
+
+    # find_strings doesn't end a string at index 0 at the next component - it depends on the
+    # whole Assertion
+    if prior.components and prior.components[0].start == 0 and "string" in prior.components[0].type:
+        return None
+
+    # Components are sorted by start so the last enclosing function is the innermost
+    edited = None
+    for span in prior.components:
+        if (
+            span.type == "function"
+            and span.args
+            and span.args.start < offset
+            and offset + deleted < span.end
+        ):
+            edited = span
+
+    return edited
+
+
+def splice_parse_info(
+    prior: ParseInfo, edited: FunctionSpan, assertion_str: str, delta: int, version: str
+) -> Optional[dict]:
+    """Re-lex the edited function and splice it into the prior parse info
+
+    Returns None if the edited function doesn't parse cleanly on its own - the whole Assertion
+    is then re-parsed.
+    """
+
+    start, end = edited.start, edited.end
+    function_str = assertion_str[start : end + delta]
+
+    # An unmatched quote in the edited function can pair with quotes outside of it
+    if function_str.count('"') % 2:
+        return None
+
+    result = parse_info(function_str, version=version, parser=prior.parser)
+    if result["errors"] or not result["components"]:
+        return None
+
+    function = result["components"][0]
+    if function.type != "function" or function.start != 0 or function.end != len(function_str):
+        return None
+
+    components = []
+    for span in prior.components:
+        if span.end <= start:
+            components.append(span)
+        elif span.start >= end:
+            components.append(span.shift(delta))
+        elif start <= span.start and span.end <= end:
+            continue  # replaced by re-lexed function
+        elif span.type == "function" and span.start < start and span.end > end:
+            args_end = span.args.end + delta
+            components.append(
+                span._replace(
+                    end=span.end + delta,
+                    span_str=assertion_str[span.start : span.end + delta],
+                    args=span.args._replace(
+                        end=args_end, span_str=assertion_str[span.args.start : args_end]
+                    ),
+                )
+            )
+        else:
+            return None
+
+    components.extend([span.shift(start) for span in result["components"]])
+    components.sort(key=lambda span: span.start)
+
+    matched_quotes = splice_pairs(prior.matched_quotes, result["matched_quotes"], start, end, delta)
+    matched_parens = splice_pairs(prior.matched_parens, result["matched_parens"], start, end, delta)
+    if matched_quotes is None or matched_parens is None:
+        return None
+
+    commas = (
+        [idx for idx in prior.commas if idx < start]
+        + [idx + start for idx in result["commas"]]
+        + [idx + delta for idx in prior.commas if idx >= end]
+    )
+
+    relations = [span for span in components if span.type == "relation"]
+    errors = check_relations_count(assertion_str, relations, [])
+
+    return {
+        "matched_quotes": matched_quotes,
+        "matched_parens": matched_parens,
+        "commas": commas,
+        "components": components,
+        "errors": errors,
+    }
+
+
+def splice_pairs(
+    prior_pairs: List[Pair], pairs: List[Pair], start: int, end: int, delta: int
+) -> Optional[List[Pair]]:
+    """Splice re-lexed function quote or parenthesis pairs into the prior pairs
+
+    Pairs are created without validation (Pair.construct) - the indexes are already checked
+    """
+
+    spliced = []
+    for pair in prior_pairs:
+        if pair.end < start:
+            spliced.append(pair)
+        elif pair.start >= end:
+            spliced.append(Pair.construct(start=pair.start + delta, end=pair.end + delta))
+        elif start <= pair.start and pair.end < end:
+            continue
+        elif pair.start < start and pair.end >= end:  # enclosing function parentheses
+            spliced.append(Pair.construct(start=pair.start, end=pair.end + delta))
+        else:
+            return None
+
+    spliced.extend(
+        [Pair.construct(start=pair.start + start, end=pair.end + start) for pair in pairs]
+    )
+    spliced.sort(key=lambda pair: pair.start)
+
+    return spliced
+
+
+def unchanged(node) -> bool:
+    """AST node is as parsed - not updated, (de)canonicalized, orthologized or sorted"""
+
+    if node.span is None:
+        return False
+
+    if node.type == "NSArg":
+        entity = node.entity
+        return not entity.orthologized and entity.canonical is None and entity.decanonical is None
+
+    if node.type == "Function":
+        arg_start = node.span.start
+        for arg in node.args:
+            if not unchanged(arg) or arg.span.start <= arg_start:
+                return False
+            arg_start = arg.span.start
+
+    return True
+
+
+def reusable_functions(
+    ast: BELAst,
+    prior: ParseInfo,
+    parse_info: ParseInfo,
+    start: int,
+    end: int,
+    delta: int,
+    verify: bool = True,
+) -> Mapping[int, Function]:
+    """Unchanged Function subtrees of the prior AST by their span start in the new AST
+
+    Subtrees outside of the edited range (start, end) are reused unless they were changed
+    after parsing. If verify is set (the whole Assertion was re-parsed) their components must
+    also be the same (shifted by delta) in the new parse info. Reused subtree spans are
+    shifted in place.
+    """
+
+    prior_starts = [span.start for span in prior.components]
+    if verify:
+        starts = [span.start for span in parse_info.components]
+
+    functions = {}
+    nodes = list(ast.args)
+    while nodes:
+        node = nodes.pop()
+        if node is None or node.type != "Function" or node.span is None:
+            continue
+
+        span = node.span
+        if span.end <= start:
+            shift = 0
+        elif span.start >= end:
+            shift = delta
+        else:  # enclosing or inside the edited range
+            nodes.extend(node.args)
+            continue
+
+        lo, hi = bisect_left(prior_starts, span.start), bisect_left(prior_starts, span.end)
+        components = prior.components[lo:hi]
+
+        reusable = unchanged(node) and well_formed(components)
+        if reusable and verify:
+            new_lo = bisect_left(starts, span.start + shift)
+            new_hi = bisect_left(starts, span.end + shift)
+            reusable = hi - lo == new_hi - new_lo and all(
+                prior_span.shift(shift) == new_span
+                for prior_span, new_span in zip(components, parse_info.components[new_lo:new_hi])
+            )
+
+        if reusable:
+            shift_spans(node, shift)
+            functions[span.start + shift] = node
+        else:
+            nodes.extend(node.args)
+
+    return functions
+
+
+def well_formed(components: list) -> bool:
+    """Function components build a self-contained subtree
+
+    BELAst.parse nests nodes using a stack of open functions - every parenthesis must belong
+    to a function and relations (which reset the stack) can't be inside the function.
+    """
+
+    function_parens = set()
+    start_parens, end_parens = set(), 0
+    for span in components:
+        if span.type == "function":
+            function_parens.add(span.args.start)
+        elif span.type == "start_paren":
+            start_parens.add(span.start)
+        elif span.type == "end_paren":
+            end_parens += 1
+        elif span.type == "relation":
+            return False
+
+    return start_parens == function_parens and end_parens == len(function_parens)
+
+
+def shift_spans(node, shift: int):
+    """Shift spans of AST node and its arguments"""
+
+    if shift == 0:
+        return
+
+    node.span = node.span.shift(shift)
+    for arg in getattr(node, "args", []):
+        shift_spans(arg, shift)
+
+
+def reusable_entities(
+    ast: BELAst, functions: Mapping[int, Function]
+) -> Mapping[tuple, List[BelEntity]]:
+    """Unchanged BEL Entities of the prior AST not in reused Function subtrees
+
+    Keyed by the NSArg (namespace, id, label) span strings
+    """
+
+    reused = set(id(fn) for fn in functions.values())
+
+    entities = {}
+    nodes = list(ast.args)
+    while nodes:
+        node = nodes.pop()
+        if node is None or id(node) in reused:
+            continue
+
+        if node.type == "Function":
+            nodes.extend(node.args)
+
+        elif node.type == "NSArg" and unchanged(node):
+            span = node.span
+            key = (
+                span.namespace.span_str,
+                span.id.span_str,
+                span.label.span_str if span.label else None,
+            )
+            entities.setdefault(key, []).append(node.entity)
+
+    return entities
@@ -0,0 +1,306 @@
+"""Single-pass BEL Assertion lexer
+
+Alternative backend for bel.lang.parse.parse_info. It returns the same parse info
+(matched_quotes, matched_parens, commas, components and errors) but collects every
+token candidate in one scan of the Assertion string. Quote pairs are resolved once
+after the scan and the candidates are then filtered against them with a merge walk, so
+the cost is linear in the length of the Assertion instead of length x number of quotes.
+"""
+
+# Standard Library
+import re
+import string
+from typing import List, Tuple
+
+# Local
+from bel.belspec.compiled import get_compiled_belspec
+from bel.core.utils import html_wrap_span, nsarg_pattern
+from bel.lang.parse import check_matched_quotes, check_relations_count, nsarg_span, ordered_pairs
+from bel.lang.spans import FunctionSpan, Span
+from bel.schemas.bel import Pair, ValidationError
+
+# Token types are the group index of the matching alternative
+WHITESPACE, QUOTE, START_PAREN, END_PAREN, COMMA, WORD = 1, 2, 3, 4, 5, 6
+token_pattern = re.compile(r'(\s+)|(")|(\()|(\))|(,)|([^\s"(),]+)')
+
+# Start of a potential NSArg namespace - see bel.core.utils.nsarg_pattern
+nsarg_run_pattern = re.compile(r"[\w\.]+")
+
+# Unmasked str_arg or floating string - see bel.lang.parse.find_strings
+string_pattern = re.compile(r"[^ ,()][^,()]*")
+
+left_quote_chars = ",:!("  # chars allowed before a left quote (ignoring whitespace)
+right_quote_chars = "!),"  # chars allowed after a right quote (ignoring whitespace)
+function_name_chars = frozenset(string.ascii_letters)
+
+
+def outside_quotes(positions: List[int], quoted: List[Tuple[int, int]]) -> List[int]:
+    """Filter sorted positions that are inside of the sorted quoted intervals"""
+
+    results = []
+    idx, quoted_len = 0, len(quoted)
+    for pos in positions:
+        while idx < quoted_len and quoted[idx][1] <= pos:
+            idx += 1
+        if idx < quoted_len and quoted[idx][0] < pos:
+            continue
+        results.append(pos)
+
+    return results
+
+
+def lex_info(assertion_str: str, version: str = "latest"):
+    """Create parse info for AST to use in parsing Assertion String"""
+
+    belspec = get_compiled_belspec(version)
+    (functions_set, relations_set) = (belspec.functions, belspec.relations)
+
+    left_quotes: List[int] = []
+    right_quotes: List[int] = []
+    parens: List[int] = []
+    commas: List[int] = []
+    relation_candidates: List[Tuple[int, int]] = []
+    function_candidates: List[Tuple[int, int]] = []
+    nsarg_matches = []
+
+    last_char = ""  # last non-whitespace character
+    pending_quote = None  # quote waiting to see if it is followed by a right quote char
+    nsarg_end = 0  # NSArg matches cannot overlap
+    relation_end = 0  # relation matches consume one trailing whitespace character
+    prev_type, prev_start, prev_end, word_after_whitespace = None, 0, 0, False
+
+    for match in token_pattern.finditer(assertion_str):
+        token_type = match.lastindex
+        start, end = match.span()
+
+        if token_type == WHITESPACE:
+            # Relations are whole words surrounded by whitespace
+            if (
+                prev_type == WORD
+                and word_after_whitespace
+                and prev_start - 1 >= relation_end
+                and assertion_str[prev_start:prev_end] in relations_set
+            ):
+                relation_candidates.append((prev_start, prev_end))
+                relation_end = prev_end + 1
+
+            prev_type = token_type
+            continue
+
+        if pending_quote is not None:
+            if assertion_str[start] in right_quote_chars:
+                right_quotes.append(pending_quote)
+            pending_quote = None
+
+        if token_type == WORD:
+            word_after_whitespace = prev_type == WHITESPACE
+
+            if end > nsarg_end:
+                for run in nsarg_run_pattern.finditer(assertion_str, max(start, nsarg_end), end):
+                    if run.start() < nsarg_end:
+                        continue
+                    nsarg_match = nsarg_pattern.match(assertion_str, run.start())
+                    if nsarg_match:
+                        nsarg_matches.append(nsarg_match)
+                        nsarg_end = nsarg_match.end()
+                        if nsarg_end >= end:
+                            break
+
+        elif token_type == QUOTE:
+            if last_char and last_char in left_quote_chars:
+                left_quotes.append(start)
+            pending_quote = start
+
+        elif token_type == START_PAREN:
+            parens.append(start)
+
+            # Function name is the run of ascii letters immediately before the paren
+            if prev_type == WORD and prev_end == start:
+                name_start = start
+                while (
+                    name_start > prev_start and assertion_str[name_start - 1] in function_name_chars
+                ):
+                    name_start -= 1
+                if name_start < start and assertion_str[name_start:start] in functions_set:
+                    function_candidates.append((name_start, start))
+
+        elif token_type == END_PAREN:
+            parens.append(start)
+
+        elif token_type == COMMA:
+            commas.append(start)
+
+        last_char = assertion_str[end - 1]
+        prev_type, prev_start, prev_end = token_type, start, end
+
+    # Quotes #################################################################################
+    errors: List[ValidationError] = []
+    matched_quotes = ordered_pairs(left_quotes, right_quotes)
+    errors = check_matched_quotes(assertion_str, matched_quotes, errors)
+
+    quoted = [(pair.start, pair.end) for pair in matched_quotes if pair.start and pair.end]
+
+    # Parens #################################################################################
+    stack: List[int] = []
+    matched_parens: List[Pair] = []
+    for idx in outside_quotes(parens, quoted):
+        if assertion_str[idx] == "(":
+            stack.append(idx)
+        elif stack:
+            matched_parens.append(Pair(start=stack.pop(), end=idx))
+        else:
+            errors.append(
+                ValidationError(
+                    type="Assertion",
+                    severity="Error",
+                    msg=f"Too many close parentheses at index {idx}",
+                    visual=html_wrap_span(assertion_str, [(idx, idx + 1)]),
+                    index=idx,
+                )
+            )
+
+    for idx in stack:
+        errors.append(
+            ValidationError(
+                type="Assertion",
+                severity="Error",
+                msg=f"No matching close parenthesis for open parenthesis at index {idx}",
+                visual=html_wrap_span(assertion_str, [(idx, idx + 1)]),
+                index=idx,
+            )
+        )
+
+    matched_parens.sort(key=lambda e: e.start)
+
+    # Commas #################################################################################
+    commas = outside_quotes(commas, quoted)
+
+    # Relations ##############################################################################
+    relation_starts = set(outside_quotes([start for (start, _) in relation_candidates], quoted))
+    relations = [
+        Span(start=start, end=end, span_str=assertion_str[start:end], type="relation")
+        for (start, end) in relation_candidates
+        if start in relation_starts
+    ]
+    errors = check_relations_count(assertion_str, relations, errors)
+
+    # Functions ##############################################################################
+    function_starts = set(outside_quotes([start for (start, _) in function_candidates], quoted))
+    paren_ends = {pair.start: pair.end for pair in matched_parens}
+    functions = []
+    for (name_start, name_end) in function_candidates:
+        if name_start not in function_starts:
+            continue
+
+        if name_end in paren_ends:
+            args_start, args_end = name_end, paren_ends[name_end] + 1
+        else:  # missing end parenthesis
+            args_start, args_end = name_end, len(assertion_str)
+
+        functions.append(
+            FunctionSpan(
+                start=name_start,
+                end=args_end,
+                span_str=assertion_str[name_start:args_end],
+                type="function",
+                name=Span(
+                    start=name_start,
+                    end=name_end,
+                    span_str=assertion_str[name_start:name_end],
+                    type="function_name",
+                ),
+                args=Span(
+                    start=args_start,
+                    end=args_end,
+                    span_str=assertion_str[args_start:args_end],
+                    type="function_args",
+                ),
+            )
+        )
+
+    # NSArgs #################################################################################
+    nsargs = [nsarg_span(nsarg_match) for nsarg_match in nsarg_matches]
+
+    components = relations + functions + nsargs
+
+    # Strings ################################################################################
+    masked = [(r.start, r.end) for r in relations]
+    masked += [(f.name.start, f.name.end) for f in functions]
+    masked += [(n.start, n.end) for n in nsargs]
+    components += lex_strings(assertion_str, masked)
+
+    # Add parens for function boundaries (AFTER processing string arguments)
+    for pair in matched_parens:
+        if pair.start:
+            components.append(
+                Span(start=pair.start, end=pair.start + 1, span_str="(", type="start_paren")
+            )
+        if pair.end:
+            components.append(
+                Span(start=pair.end, end=pair.end + 1, span_str=")", type="end_paren")
+            )
+
+    components.sort(key=lambda x: x.start)
+
+    return {
+        "matched_quotes": matched_quotes,
+        "matched_parens": matched_parens,
+        "commas": commas,
+        "components": components,
+        "errors": errors,
+    }
+
+
+def lex_strings(assertion_str: str, masked: List[Tuple[int, int]]) -> List[Span]:
+    """Find str_args and unknown strings in the unmasked gaps between components
+
+    Matches bel.lang.parse.find_strings without building the masked Assertion string.
+    A masked component ends a string the same way the replacement char does there.
+    """
+
+    str_spans: List[Span] = []
+
+    gaps = []
+    gap_start = 0
+    for (start, end) in sorted(masked):
+        if start > gap_start:
+            gaps.append((gap_start, start))
+        gap_start = max(gap_start, end)
+    if gap_start < len(assertion_str):
+        gaps.append((gap_start, len(assertion_str)))
+
+    # A string starting at index 0 is never closed by find_strings - it runs to the last
+    #    non-boundary character of the masked Assertion string
+    if gaps and gaps[0][0] == 0 and assertion_str[:1] not in ["", " ", ",", ")", "("]:
+        end = 0
+        for (gap_start, gap_end) in gaps:
+            for run in string_pattern.finditer(assertion_str, gap_start, gap_end):
+                end = run.start() + len(run.group().rstrip(" ")) - 1
+        chars = list(assertion_str[: end + 1])
+        for (start, stop) in masked:
+            for idx in range(start, min(stop, end + 1)):
+                chars[idx] = replacement_char(assertion_str)
+        str_spans.append(Span(start=0, end=end + 1, span_str="".join(chars), type="string"))
+
+        return str_spans
+
+    for (gap_start, gap_end) in gaps:
+        for run in string_pattern.finditer(assertion_str, gap_start, gap_end):
+            start = run.start()
+            end = start + len(run.group().rstrip(" "))
+            type_ = "string_arg" if run.end() < gap_end else "string"
+            str_spans.append(
+                Span(start=start, end=end, span_str=assertion_str[start:end], type=type_)
+            )
+
+    return str_spans
+
+
+def replacement_char(assertion_str: str) -> str:
+    """Masking char used by bel.lang.parse.find_strings"""
+
+    for char in ["#", "$", "=", "@", "&"]:
+        if char not in assertion_str:
+            return char
+
+    return "#"
@@ -2,10 +2,10 @@
 # -*- coding: utf-8 -*-
 
 # Standard Library
-import copy
 import itertools
 import json
 import re
+import threading
 from typing import Any, List, Mapping, Optional, Tuple, Union
 
 # Third Party
@@ -15,11 +15,15 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 # Local
+import bel.belspec.crud
 import bel.belspec.specifications
+import bel.core.settings as settings
+from bel.belspec.compiled import get_compiled_belspec
 from bel.belspec.specifications import additional_computed_relations
-from bel.core.utils import html_wrap_span, nsarg_pattern
+from bel.core.utils import _create_hash, html_wrap_span, nsarg_pattern
 from bel.lang.ast import Arg, BELAst, Function, NSArg, Relation, StrArg
-from bel.schemas.bel import FunctionSpan, NsArgSpan, Pair, Span, ValidationError
+from bel.lang.spans import FunctionSpan, NsArgSpan, Span
+from bel.schemas.bel import Pair, ValidationError
 
 
 def mask(string: str, start: int, end: int, replacement_char="#"):
@@ -28,8 +32,120 @@ def mask(string: str, start: int, end: int, replacement_char="#"):
     return string[:start] + replacement_char * (end - start) + string[end:]
 
 
-def parse_info(assertion_str: str, version: str = "latest"):
-    """Create parse info for AST to use in parsing Assertion String"""
+# Parse info by (assertion hash, resolved version, parser) - cleared with the BEL Specification registry
+parse_info_cache = cachetools.LRUCache(maxsize=settings.BEL_PARSE_CACHE_SIZE)
+parse_info_cache_stats = {"hits": 0, "misses": 0}
+# Guards parse_info_cache (LRUCache lookups reorder entries) and the statistics across threads
+parse_info_cache_lock = threading.Lock()
+
+
+def get_cached_parse_info(assertion_str: str, version: str = "latest", parser: str = None):
+    """Get parse info from parse_info_cache or parse the Assertion String
+
+    The cached parse info is shared by every caller (BEL, BELAst, validate_assertion) so each
+    call gets new lists and copies of the validation errors (validate_assertion updates them).
+    The spans are shared as they are not modified when building or transforming the AST.
+    """
+
+    if parser is None:
+        parser = settings.BEL_PARSER
+
+    strict = settings.BEL_STRICT_PARSER
+
+    if not settings.BEL_PARSE_CACHE_SIZE:
+        return parse_info(assertion_str, version=version, parser=parser, strict=strict)
+
+    version = bel.belspec.crud.check_version(version)
+    key = (_create_hash(assertion_str), version, parser)
+
+    with parse_info_cache_lock:
+        cached = parse_info_cache.get(key)
+
+        # Check the assertion string as well in case of a hash collision
+        hit = cached is not None and cached[0] == assertion_str
+        parse_info_cache_stats["hits" if hit else "misses"] += 1
+
+    if hit:
+        result = cached[1]
+
+    else:
+        result = parse_info(assertion_str, version=version, parser=parser, strict=strict)
+        result = {name: tuple(values) for name, values in result.items()}
+        with parse_info_cache_lock:
+            parse_info_cache[key] = (assertion_str, result)
+
+    return {
+        "matched_quotes": list(result["matched_quotes"]),
+        "matched_parens": list(result["matched_parens"]),
+        "commas": list(result["commas"]),
+        "components": list(result["components"]),
+        "errors": [error.copy() for error in result["errors"]],
+    }
+
+
+def get_parse_info_cache_stats() -> dict:
+    """Parse info cache hit/miss statistics"""
+
+    with parse_info_cache_lock:
+        (hits, misses, size) = (
+            parse_info_cache_stats["hits"],
+            parse_info_cache_stats["misses"],
+            len(parse_info_cache),
+        )
+
+    lookups = hits + misses
+
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": hits / lookups if lookups else 0.0,
+        "size": size,
+        "maxsize": parse_info_cache.maxsize,
+    }
+
+
+def clear_parse_info_cache():
+    """Clear parse info cache and statistics"""
+
+    with parse_info_cache_lock:
+        parse_info_cache.clear()
+        parse_info_cache_stats["hits"] = 0
+        parse_info_cache_stats["misses"] = 0
+
+
+def parse_info(
+    assertion_str: str, version: str = "latest", parser: str = None, strict: bool = False
+):
+    """Create parse info for AST to use in parsing Assertion String
+
+    Args:
+        assertion_str: BEL Assertion string
+        version: BEL Specification version
+        parser: parser backend - lexer (single-pass tokenizer) or regex (multiple regex passes),
+            defaults to settings.BEL_PARSER
+        strict: try the strict BEL grammar parser (bel.lang.strict) first - the parser backend
+            is only used if the Assertion isn't well-formed
+    """
+
+    if parser is None:
+        parser = settings.BEL_PARSER
+
+    if strict:
+        # Local
+        from bel.lang.strict import strict_info
+
+        result = strict_info(assertion_str, version=version)
+        if result is not None:
+            return result
+
+    if parser == "lexer":
+        # Local
+        from bel.lang.lexer import lex_info
+
+        return lex_info(assertion_str, version=version)
+
+    elif parser != "regex":
+        raise ValueError(f"Unknown parser backend: {parser}")
 
     errors = []
     (matched_quotes, errors) = find_matching_quotes(assertion_str, errors)
@@ -129,6 +245,16 @@ def find_matching_quotes(
 
     matched_quotes = ordered_pairs(left_quotes, right_quotes)
 
+    errors = check_matched_quotes(assertion_str, matched_quotes, errors)
+
+    return (matched_quotes, errors)
+
+
+def check_matched_quotes(
+    assertion_str: str, matched_quotes: List[Pair], errors: List[ValidationError]
+) -> List[ValidationError]:
+    """Add errors for quote pairs that are missing their left or right quote"""
+
     # TODO suggest where the missing quote should be placed
     for idx, pair in enumerate(matched_quotes):
         if pair.start is None and idx == 0:
@@ -181,7 +307,7 @@ def find_matching_quotes(
                 )
             )
 
-    return (matched_quotes, errors)
+    return errors
 
 
 def find_commas(
@@ -249,16 +375,9 @@ def find_matching_parens(
     return (sorted(matched_parens, key=lambda e: e.start), errors)
 
 
-@cachetools.cached(cachetools.TTLCache(maxsize=1, ttl=600))
 def get_relations_regex(version: str = "latest"):
 
-    relations_list = bel.belspec.specifications.get_all_relations(version)
-    relations_list += additional_computed_relations
-    relations_list = list(set(relations_list))
-    relations_list.sort(key=len)
-    relations_regex = "|".join(relations_list)
-
-    return relations_regex
+    return get_compiled_belspec(version).relations_regex
 
 
 def find_relations(
@@ -270,11 +389,9 @@ def find_relations(
         List[Tuple[int, int, str]] = e.g. [(2, 4, '->')]
     """
 
-    relations_regex = get_relations_regex(version=version)
-
     # Regex match all potential relations TODO make \S more specific to relation chars
-    potential_relations = re.compile(f"\\s({relations_regex})\\s")
-    iterator = re.finditer(potential_relations, assertion_str)
+    potential_relations = get_compiled_belspec(version).relations_pattern
+    iterator = potential_relations.finditer(assertion_str)
     pre_spans = [m.span(1) for m in iterator]
 
     # Filter quoted strings - can't have a relation in a quoted string
@@ -284,6 +401,16 @@ def find_relations(
         if not intersect(r[0], matched_quotes)
     ]
 
+    errors = check_relations_count(assertion_str, relations, errors)
+
+    return (sorted(relations, key=lambda e: e.start), errors)
+
+
+def check_relations_count(
+    assertion_str: str, relations: List[Span], errors: List[ValidationError]
+) -> List[ValidationError]:
+    """Add error if there are more relations than a nested Assertion can have"""
+
     if len(relations) > 2:
         intervals = [(r.start, r.end) for r in relations]
         idx = relations[0].start
@@ -299,7 +426,7 @@ def find_relations(
             )
         )
 
-    return (sorted(relations, key=lambda e: e.start), errors)
+    return errors
 
 
 def find_functions(
@@ -315,21 +442,15 @@ def find_functions(
         List[Tuple[int, int, str]] = e.g. [(2, 4, '->')]
     """
 
-    functions_list = bel.belspec.specifications.get_all_functions(version)
+    iterator = get_compiled_belspec(version).functions_pattern.finditer(assertion_str)
 
-    iterator = re.finditer("([a-zA-Z]+)\(", assertion_str)
-
-    name_spans = []
-    for m in iterator:
-        matched = m.group(1)
-        if matched not in functions_list:
-            continue
-
-        name_spans.append(m.span(1))
+    name_spans = [m.span(1) for m in iterator]
 
     # Filter quoted strings - can't have a relation in a quoted string
     name_spans = [r for r in name_spans if not intersect(r[0], matched_quotes)]
 
+    paren_ends = {parens.start: parens.end for parens in matched_parens}
+
     functions = []
     for span in name_spans:
 
@@ -337,43 +458,30 @@ def find_functions(
         name_end = span[1]
         name_str = assertion_str[name_start:name_end]
 
-        # Initialize FunctionSpan with just name span
-        function = FunctionSpan(
-            start=name_start,
-            end=name_end,
-            span_str=name_str,
-            type="function",
-            name=Span(start=name_start, end=name_end, span_str=name_str, type="function_name"),
-            args=None,
-        )
-
-        # then add the function full span and arguments span
-        for parens in matched_parens:
-            if name_end == parens.start:
-                args_end = parens.end + 1
-                function.end = args_end
-                function.span_str = assertion_str[name_start:args_end]
-                function.args = Span(
-                    start=parens.start,
-                    end=args_end,
-                    span_str=assertion_str[parens.start : args_end],
-                    type="function_args",
-                )
+        # Function full span and arguments span
+        if name_end in paren_ends:
+            args_end = paren_ends[name_end] + 1
 
         # TODO - check for relation after name_end and before end of Assertion string to bound the function
         # This covers function with missing end parenthesis
-        if function.args is None:
+        else:
             args_end = len(assertion_str)
-            function.end = args_end
-            function.span_str = assertion_str[name_start:args_end]
-            function.args = Span(
+
+        function = FunctionSpan(
+            start=name_start,
+            end=args_end,
+            span_str=assertion_str[name_start:args_end],
+            type="function",
+            name=Span(start=name_start, end=name_end, span_str=name_str, type="function_name"),
+            args=Span(
                 start=name_end,
                 end=args_end,
                 span_str=assertion_str[name_end:args_end],
                 type="function_args",
-            )
+            ),
+        )
 
-        functions.append(copy.deepcopy(function))
+        functions.append(function)
 
     return (sorted(functions, key=lambda e: e.start), errors)
 
@@ -391,39 +499,42 @@ def find_nsargs(assertion_str: str) -> List[Optional[NsArgSpan]]:
     nsarg_spans: List[NsArgSpan] = []
 
     for match in re.finditer(nsarg_pattern, assertion_str):
+        nsarg_spans.append(nsarg_span(match))
 
-        # print("Span", match.group("ns_arg"), match.start("ns_arg"), match.end("ns_arg"))
-
-        ns_arg_span = NsArgSpan(
-            span_str=match.group("ns_arg"),
-            start=match.start("ns_arg"),
-            end=match.end("ns_arg"),
-            type="ns_arg",
-            namespace=Span(
-                span_str=match.group("ns"),
-                start=match.start("ns"),
-                end=match.end("ns"),
-                type="namespace",
-            ),
-            id=Span(
-                span_str=match.group("id"),
-                start=match.start("id"),
-                end=match.end("id"),
-                type="ns_id",
-            ),
-        )
+    return nsarg_spans
 
-        if match.group("label"):
-            ns_arg_span.label = Span(
-                span_str=match.group("label"),
-                start=match.start("label"),
-                end=match.end("label"),
-                type="ns_label",
-            )
 
-        nsarg_spans.append(copy.deepcopy(ns_arg_span))
+def nsarg_span(match) -> NsArgSpan:
+    """Create NSArg span from bel.core.utils.nsarg_pattern match"""
 
-    return nsarg_spans
+    label = None
+    if match.group("label"):
+        label = Span(
+            span_str=match.group("label"),
+            start=match.start("label"),
+            end=match.end("label"),
+            type="ns_label",
+        )
+
+    return NsArgSpan(
+        span_str=match.group("ns_arg"),
+        start=match.start("ns_arg"),
+        end=match.end("ns_arg"),
+        type="ns_arg",
+        namespace=Span(
+            span_str=match.group("ns"),
+            start=match.start("ns"),
+            end=match.end("ns"),
+            type="namespace",
+        ),
+        id=Span(
+            span_str=match.group("id"),
+            start=match.start("id"),
+            end=match.end("id"),
+            type="ns_id",
+        ),
+        label=label,
+    )
 
 
 def find_strings(assertion_str, components):
@@ -0,0 +1,95 @@
+"""Parser spans
+
+Lightweight immutable versions of the bel.schemas.bel Span, NsArgSpan and FunctionSpan
+models used by the Assertion parser and AST builder. They are plain tuples - no
+validation on creation and no copying needed as they cannot be modified. Use to_schema()
+to get the pydantic models, e.g. to return spans from the API.
+"""
+
+# Standard Library
+from typing import NamedTuple, Optional
+
+# Local
+import bel.schemas.bel
+
+
+class Span(NamedTuple):
+    """Assertion string span - start index and non-inclusive end index"""
+
+    start: int
+    end: int
+    span_str: str = ""
+    type: Optional[str] = None
+
+    def to_schema(self) -> bel.schemas.bel.Span:
+        return bel.schemas.bel.Span(**self._asdict())
+
+    def shift(self, offset: int) -> "Span":
+        """Span moved by offset characters, e.g. after an edit earlier in the Assertion"""
+
+        return Span(self.start + offset, self.end + offset, self.span_str, self.type)
+
+
+class NsArgSpan(NamedTuple):
+    """Namespace Arg Span"""
+
+    start: int
+    end: int
+    span_str: str
+    type: str
+    namespace: Span
+    id: Span
+    label: Optional[Span] = None
+
+    def to_schema(self) -> bel.schemas.bel.NsArgSpan:
+        return bel.schemas.bel.NsArgSpan(
+            start=self.start,
+            end=self.end,
+            span_str=self.span_str,
+            type=self.type,
+            namespace=self.namespace.to_schema(),
+            id=self.id.to_schema(),
+            label=self.label.to_schema() if self.label else None,
+        )
+
+    def shift(self, offset: int) -> "NsArgSpan":
+        return NsArgSpan(
+            self.start + offset,
+            self.end + offset,
+            self.span_str,
+            self.type,
+            self.namespace.shift(offset),
+            self.id.shift(offset),
+            self.label.shift(offset) if self.label else None,
+        )
+
+
+class FunctionSpan(NamedTuple):
+    """Function Span"""
+
+    start: int
+    end: int
+    span_str: str
+    type: str
+    name: Span  # function name span
+    args: Optional[Span] = None  # parentheses span
+
+    def to_schema(self) -> bel.schemas.bel.FunctionSpan:
+        return bel.schemas.bel.FunctionSpan(
+            start=self.start,
+            end=self.end,
+            span_str=self.span_str,
+            type=self.type,
+            name=self.name.to_schema(),
+            args=self.args.to_schema() if self.args else None,
+        )
+
+    def shift(self, offset: int) -> "FunctionSpan":
+        return FunctionSpan(
+            self.start + offset,
+            self.end + offset,
+            self.span_str,
+            self.type,
+            self.name.shift(offset),
+            self.args.shift(offset) if self.args else None,
+        )
@@ -0,0 +1,259 @@
+"""Strict BEL Assertion parser
+
+Recursive descent parser for the BEL grammar in bel/belspec/bel.ebnf.j2 with the function,
+modifier function and relation names of each BEL Specification version (see
+CompiledBelSpec.primary_functions/modifier_functions). It only accepts well-formed Assertions
+and returns the same parse info as the error tolerant parsers in bel.lang.parse - anything it
+rejects is parsed by the tolerant parser instead.
+
+It is stricter than the grammar wherever the tolerant parser would read the Assertion
+differently: single spaces only, no spaces before commas or close parentheses and no quotes,
+colons, commas or parentheses in quoted string arguments.
+"""
+
+# Standard Library
+import re
+from typing import List, Optional
+
+# Local
+from bel.belspec.compiled import CompiledBelSpec, get_compiled_belspec
+from bel.lang.spans import FunctionSpan, NsArgSpan, Span
+from bel.schemas.bel import Pair
+
+# Grammar terminals
+function_name_pattern = re.compile(r"[A-Za-z]+(?=\()")
+ns_arg_pattern = re.compile(
+    r"""
+    (?P<ns>[A-Z0-9]+)                             # ns_string
+    :
+    (?P<id>"[^"\\]*"|[^\s,()!":\\]+)              # quoted_string | string
+    (?:!(?P<label>"[^"\\]*"|[^\s,()!":\\]+))?     # optional label
+    (?=[,)])
+""",
+    re.VERBOSE,
+)
+string_arg_pattern = re.compile(r'(?:"[^"\\,():]*"|[^\s,()!":\\]+)(?=[,)])')
+relation_pattern = re.compile(r" +(\S+) +")
+spaces_pattern = re.compile(r" *")
+
+# Quoted strings must not start with a right quote char or end with a left quote char
+#     - see bel.lang.parse.find_matching_quotes
+right_quote_chars = "!),"
+left_quote_chars = ",:!("
+
+
+class StrictParseError(Exception):
+    """Assertion does not match the strict BEL grammar"""
+
+
+class StrictParser(object):
+    """Parse Assertion string into parse info - see bel.lang.parse.parse_info"""
+
+    def __init__(self, assertion_str: str, belspec: CompiledBelSpec):
+
+        self.assertion_str = assertion_str
+        self.belspec = belspec
+        self.pos = 0
+
+        self.quotes: List[Pair] = []
+        self.parens: List[Pair] = []
+        self.commas: List[int] = []
+        self.relations: List[Span] = []
+        self.components: list = []
+
+    def parse(self) -> dict:
+        """start = bel_statement $"""
+
+        self.spaces()
+        self.bel_statement()
+        self.spaces()
+
+        if self.pos != len(self.assertion_str):
+            self.fail("end of Assertion")
+
+        # Nested statements are limited to two relations - bel.lang.parse.check_relations_count
+        if len(self.relations) > 2:
+            self.fail("at most two relations")
+
+        self.components.sort(key=lambda span: span.start)
+        self.quotes.sort(key=lambda pair: pair.start)
+        self.parens.sort(key=lambda pair: pair.start)
+
+        return {
+            "matched_quotes": self.quotes,
+            "matched_parens": self.parens,
+            "commas": self.commas,
+            "components": self.components,
+            "errors": [],
+        }
+
+    def fail(self, expected: str):
+        raise StrictParseError(f"Expected {expected} at index {self.pos}")
+
+    def spaces(self):
+        self.pos = spaces_pattern.match(self.assertion_str, self.pos).end()
+
+    def bel_statement(self):
+        """bel_statement = subject:function [relation:relation object:obj]"""
+
+        self.function(self.belspec.primary_functions)
+
+        match = relation_pattern.match(self.assertion_str, self.pos)
+        if not match:
+            return
+
+        if match.group(1) not in self.belspec.relations:
+            self.fail("relation")
+
+        start, end = match.span(1)
+        relation = Span(start, end, match.group(1), "relation")
+        self.relations.append(relation)
+        self.components.append(relation)
+        self.pos = match.end()
+
+        self.obj()
+
+    def obj(self):
+        """obj = function | enclosed_statement"""
+
+        if self.assertion_str.startswith("(", self.pos):
+            open_idx = self.pos
+            self.pos += 1
+            self.bel_statement()
+
+            if not self.assertion_str.startswith(")", self.pos):
+                self.fail("close parenthesis")
+
+            self.add_parens(open_idx, self.pos)
+            self.pos += 1
+
+        else:
+            self.function(self.belspec.primary_functions)
+
+    def function(self, function_names: frozenset):
+        """function = function:funcs function_open function_args:f_args function_close"""
+
+        match = function_name_pattern.match(self.assertion_str, self.pos)
+        if not match or match.group() not in function_names:
+            self.fail("function")
+
+        start = self.pos
+        open_idx = match.end()
+        self.pos = open_idx + 1
+
+        # Modifier functions can't have modifier function arguments (m_args)
+        modifiers = function_names is self.belspec.primary_functions
+        self.function_args(modifiers)
+
+        if not self.assertion_str.startswith(")", self.pos):
+            self.fail("close parenthesis")
+
+        end = self.pos + 1
+        self.components.append(
+            FunctionSpan(
+                start,
+                end,
+                self.assertion_str[start:end],
+                "function",
+                Span(start, open_idx, match.group(), "function_name"),
+                Span(open_idx, end, self.assertion_str[open_idx:end], "function_args"),
+            )
+        )
+        self.add_parens(open_idx, self.pos)
+        self.pos = end
+
+    def function_args(self, modifiers: bool):
+        """f_args = ','.{(function | modifier_function | namespace_arg | string_arg)}*"""
+
+        self.spaces()
+        if self.assertion_str.startswith(")", self.pos):
+            return
+
+        while True:
+            self.function_arg(modifiers)
+
+            if not self.assertion_str.startswith(",", self.pos):
+                return
+
+            self.commas.append(self.pos)
+            self.pos += 1
+            self.spaces()
+
+    def function_arg(self, modifiers: bool):
+
+        match = function_name_pattern.match(self.assertion_str, self.pos)
+        if match:
+            name = match.group()
+            if name in self.belspec.primary_functions:
+                return self.function(self.belspec.primary_functions)
+            elif modifiers and name in self.belspec.modifier_functions:
+                return self.function(self.belspec.modifier_functions)
+            self.fail("function")
+
+        match = ns_arg_pattern.match(self.assertion_str, self.pos)
+        if match:
+            return self.namespace_arg(match)
+
+        match = string_arg_pattern.match(self.assertion_str, self.pos)
+        if match:
+            start, end = match.span()
+            if match.group().startswith('"'):
+                self.add_quotes(start, end)
+
+            self.components.append(Span(start, end, match.group(), "string_arg"))
+            self.pos = end
+            return
+
+        self.fail("function argument")
+
+    def namespace_arg(self, match):
+        """namespace_arg = ns_arg:(ns:ns_string ':' ns_value:(quoted_string | string) ['!' label])"""
+
+        label = None
+        if match.group("label"):
+            label = self.ns_arg_part(match, "label", "ns_label")
+
+        start, end = match.span()
+        self.components.append(
+            NsArgSpan(
+                start,
+                end,
+                match.group(),
+                "ns_arg",
+                self.ns_arg_part(match, "ns", "namespace"),
+                self.ns_arg_part(match, "id", "ns_id"),
+                label,
+            )
+        )
+        self.pos = end
+
+    def ns_arg_part(self, match, group: str, span_type: str) -> Span:
+
+        start, end = match.span(group)
+        if match.group(group).startswith('"'):
+            self.add_quotes(start, end)
+
+        return Span(start, end, match.group(group), span_type)
+
+    def add_quotes(self, start: int, end: int):
+
+        quoted = self.assertion_str[start + 1 : end - 1].strip()
+        if quoted[:1] and (quoted[0] in right_quote_chars or quoted[-1] in left_quote_chars):
+            self.fail("quoted string")
+
+        self.quotes.append(Pair(start=start, end=end - 1))
+
+    def add_parens(self, start: int, end: int):
+
+        self.parens.append(Pair(start=start, end=end))
+        self.components.append(Span(start, start + 1, "(", "start_paren"))
+        self.components.append(Span(end, end + 1, ")", "end_paren"))
+
+
+def strict_info(assertion_str: str, version: str = "latest") -> Optional[dict]:
+    """Parse info for well-formed Assertions, None if the Assertion isn't strictly valid BEL"""
+
+    try:
+        return StrictParser(assertion_str, get_compiled_belspec(version)).parse()
+    except StrictParseError:
+        return None
@@ -335,7 +335,7 @@ async def async_get_normalized_terms_for_annotations(term_keys):
 
 def get_normalized_terms_for_annotations(term_keys):
 
-    return [bel.terms.terms.get_normalized_terms(term_key) for term_key in term_keys]
+    return list(bel.terms.terms.get_normalized_terms_many(term_keys).values())
 
 
 def add_annotations(pubmed):
@@ -318,15 +318,23 @@ def validate_annotations(annotations: List[dict], validation_level: str):
         annotations = get_cached_annotation_validations(annotations)
 
         if validation_level == "complete":
-            for idx, annotation in enumerate(annotations):
-                if (
-                    not annotation.get("validation", False)
-                    or annotation["validation"].get("status", "") == "Processing"
-                ):
-                    annotations[idx] = validate_annotation(annotation)
+            missing = [
+                idx
+                for idx, annotation in enumerate(annotations)
+                if not annotation.get("validation", False)
+                or annotation["validation"].get("status", "") == "Processing"
+            ]
+
+            # Look up the annotation terms in bulk - validate_annotation uses the cached terms
+            bel.terms.terms.get_terms_many([annotations[idx]["id"] for idx in missing])
+
+            for idx in missing:
+                annotations[idx] = validate_annotation(annotations[idx])
 
     # Force validation of all annotations
     else:
+        bel.terms.terms.get_terms_many([annotation["id"] for annotation in annotations])
+
         for idx, annotation in enumerate(annotations):
             annotations[idx] = validate_annotation(annotation)
 
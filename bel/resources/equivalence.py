@@ -0,0 +1,257 @@
+"""Equivalence clusters
+
+The connected components of the equivalence graph (equivalence_nodes/equivalence_edges) are
+computed when the namespaces are loaded so that term equivalents and canonical/decanonical
+term keys are document lookups instead of graph traversals (see bel.terms.terms.get_equivalents).
+
+Each equivalence node has the cluster_id of its equivalence cluster ("" if it has no
+equivalences). Each equivalence cluster document has the members of the cluster and the primary
+term keys of the cluster by namespace.
+"""
+
+# Standard Library
+from collections import defaultdict
+from typing import Iterable, Iterator, List, Mapping, MutableSet, Tuple
+
+# Third Party
+from loguru import logger
+
+# Local
+from bel.db.arangodb import (
+    equiv_clusters_coll,
+    equiv_clusters_name,
+    equiv_edges_name,
+    equiv_nodes_coll,
+    equiv_nodes_name,
+    resources_db,
+)
+
+Key = str  # namespace:id
+
+batch_size = 10000  # node keys per query
+
+
+class UnionFind(object):
+    """Disjoint sets of node keys - union by size with path halving"""
+
+    def __init__(self):
+        self.parent = {}
+        self.size = {}
+
+    def add(self, node: str):
+        if node not in self.parent:
+            self.parent[node] = node
+            self.size[node] = 1
+
+    def find(self, node: str) -> str:
+        self.add(node)
+        while self.parent[node] != node:
+            self.parent[node] = self.parent[self.parent[node]]
+            node = self.parent[node]
+        return node
+
+    def union(self, node1: str, node2: str):
+        (root1, root2) = (self.find(node1), self.find(node2))
+        if root1 == root2:
+            return
+        if self.size[root1] < self.size[root2]:
+            (root1, root2) = (root2, root1)
+        self.parent[root2] = root1
+        self.size[root1] += self.size[root2]
+
+    def components(self) -> List[List[str]]:
+        components = defaultdict(list)
+        for node in self.parent:
+            components[self.find(node)].append(node)
+        return list(components.values())
+
+
+def equivalence_nodes_iterator(
+    doc_iterator: Iterable[Tuple[str, dict]], node_keys: MutableSet[str]
+) -> Iterator[Tuple[str, dict]]:
+    """Pass through the docs to load - collecting the equivalence node _keys of the docs"""
+
+    for (collection_name, doc) in doc_iterator:
+        if collection_name == equiv_nodes_name:
+            node_keys.add(doc["_key"])
+        elif collection_name == equiv_edges_name:
+            node_keys.add(doc["_from"].split("/", 1)[1])
+            node_keys.add(doc["_to"].split("/", 1)[1])
+
+        yield (collection_name, doc)
+
+
+def batches(items: Iterable[str]) -> Iterator[List[str]]:
+    items = list(items)
+    for idx in range(0, len(items), batch_size):
+        yield items[idx : idx + batch_size]
+
+
+def get_nodes(node_keys: Iterable[str]) -> Mapping[str, dict]:
+    """Equivalence nodes by _key - missing nodes are skipped"""
+
+    query = f"""
+        FOR node_key IN @node_keys
+            LET node = DOCUMENT("{equiv_nodes_name}", node_key)
+            FILTER node != null
+            RETURN {{
+                "_key": node._key,
+                "key": node.key,
+                "namespace": node.namespace,
+                "primary": node.primary,
+                "cluster_id": node.cluster_id
+            }}
+    """
+
+    nodes = {}
+    for batch in batches(node_keys):
+        for node in resources_db.aql.execute(query, bind_vars={"node_keys": batch}):
+            nodes[node["_key"]] = node
+
+    return nodes
+
+
+def get_cluster_node_keys(cluster_ids: Iterable[str]) -> List[str]:
+    """Equivalence node _keys of the clusters"""
+
+    query = f"""
+        FOR node IN {equiv_nodes_name}
+            FILTER node.cluster_id IN @cluster_ids
+            RETURN node._key
+    """
+
+    node_keys = []
+    for batch in batches(cluster_ids):
+        node_keys.extend(resources_db.aql.execute(query, bind_vars={"cluster_ids": batch}))
+
+    return node_keys
+
+
+def get_edges(node_keys: Iterable[str]) -> List[Tuple[str, str]]:
+    """Equivalence edges (node _key pairs) of the nodes"""
+
+    query = f"""
+        FOR node_key IN @node_keys
+            FOR vertex IN 1..1 ANY CONCAT("{equiv_nodes_name}/", node_key) {equiv_edges_name}
+                FILTER vertex != null
+                RETURN [node_key, vertex._key]
+    """
+
+    edges = []
+    for batch in batches(node_keys):
+        edges.extend(
+            [
+                tuple(edge)
+                for edge in resources_db.aql.execute(query, bind_vars={"node_keys": batch})
+            ]
+        )
+
+    return edges
+
+
+def cluster_doc(cluster_id: str, nodes: List[dict]) -> dict:
+    """Equivalence cluster document"""
+
+    members = sorted(
+        [
+            {"term_key": node["key"], "namespace": node["namespace"], "primary": node["primary"]}
+            for node in nodes
+        ],
+        key=lambda member: member["term_key"],
+    )
+
+    primary_keys = defaultdict(list)
+    for member in members:
+        if member["primary"]:
+            primary_keys[member["namespace"]].append(member["term_key"])
+
+    return {"_key": cluster_id, "members": members, "primary_keys": dict(primary_keys)}
+
+
+def update_equivalence_clusters(
+    node_keys: Iterable[str], removed_cluster_ids: Iterable[str] = ()
+) -> List[str]:
+    """Recompute the equivalence clusters of the nodes
+
+    Collects all of the equivalence nodes connected to the given nodes - directly by the
+    equivalence edges or by their prior equivalence clusters - and recomputes their connected
+    components with union-find.
+
+    Args:
+        node_keys: equivalence node _keys, e.g. of the namespace terms just loaded
+        removed_cluster_ids: equivalence clusters of removed equivalence nodes and edges (see
+            bel.resources.namespace.remove_old_db_entries) - recomputed from their remaining nodes
+
+    Returns:
+        List[str]: equivalence node _keys updated
+    """
+
+    nodes = {}
+    region = set()
+    cluster_ids = set(removed_cluster_ids)
+    union_find = UnionFind()
+
+    frontier = set(node_keys) | set(get_cluster_node_keys(cluster_ids))
+    while frontier:
+        region.update(frontier)
+
+        frontier_nodes = get_nodes(frontier)
+        nodes.update(frontier_nodes)
+
+        # Members of the prior clusters of the nodes
+        new_cluster_ids = {
+            node["cluster_id"] for node in frontier_nodes.values() if node["cluster_id"]
+        }
+        new_cluster_ids -= cluster_ids
+        cluster_ids.update(new_cluster_ids)
+        next_frontier = set(get_cluster_node_keys(new_cluster_ids))
+
+        # Nodes connected by the equivalence edges
+        for (node_key, neighbor_key) in get_edges(frontier):
+            union_find.union(node_key, neighbor_key)
+            next_frontier.add(neighbor_key)
+
+        frontier = next_frontier - region
+
+    clusters = []
+    node_updates = []
+    for component in union_find.components():
+        component = [node_key for node_key in component if node_key in nodes]
+        if not component:
+            continue
+
+        cluster_id = min(component)
+        clusters.append(cluster_doc(cluster_id, [nodes[node_key] for node_key in component]))
+        node_updates.extend(
+            [{"_key": node_key, "cluster_id": cluster_id} for node_key in component]
+        )
+
+    # Nodes without equivalences
+    clustered = {node_update["_key"] for node_update in node_updates}
+    node_updates.extend(
+        [{"_key": node_key, "cluster_id": ""} for node_key in nodes if node_key not in clustered]
+    )
+
+    # Replace the prior clusters
+    remove_clusters = f"""
+        FOR cluster_id IN @cluster_ids
+            REMOVE cluster_id IN {equiv_clusters_name} OPTIONS {{ ignoreErrors: true }}
+    """
+    for batch in batches(cluster_ids):
+        resources_db.aql.execute(remove_clusters, bind_vars={"cluster_ids": batch})
+
+    for idx in range(0, len(clusters), batch_size):
+        equiv_clusters_coll.import_bulk(
+            clusters[idx : idx + batch_size], on_duplicate="replace", halt_on_error=False
+        )
+
+    for idx in range(0, len(node_updates), batch_size):
+        equiv_nodes_coll.import_bulk(
+            node_updates[idx : idx + batch_size], on_duplicate="update", halt_on_error=False
+        )
+
+    logger.info(
+        f"Updated {len(clusters)} equivalence clusters of {len(node_updates)} equivalence nodes"
+    )
+
+    return [node_update["_key"] for node_update in node_updates]
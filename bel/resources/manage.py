@@ -14,6 +14,7 @@ import bel.core.utils
 import bel.db.arangodb as arangodb
 import bel.db.elasticsearch as elasticsearch
 import bel.resources.namespace
+import bel.resources.normalization
 import bel.resources.ortholog
 
 
@@ -109,6 +110,9 @@ def update_resources(urls: List[str] = None, force: bool = False, email: str = N
     if urls is None:
         urls = []
 
+    # Normalized terms for changed canonicalization targets - before loading any resources
+    update_normalized_terms()
+
     results = {}
 
     # Load provided url if available
@@ -217,6 +221,12 @@ def load_resource(resource_url: str = None, force: bool = False):
     return result
 
 
+def update_normalized_terms(force: bool = False) -> int:
+    """Recompute the normalized terms if the canonicalization targets have changed"""
+
+    return bel.resources.normalization.check_normalized_terms(force=force)
+
+
 def delete_resource(source: str, resource_type: str = "namespace"):
 
     if resource_type == "namespace":
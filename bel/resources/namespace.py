@@ -1,10 +1,11 @@
 # Standard Library
 import copy
 import gzip
+import hashlib
 import json
 import time
 from collections import defaultdict
-from typing import IO, Optional
+from typing import IO, Optional, Set
 
 # Third Party
 import cachetools
@@ -20,13 +21,19 @@ from bel.db.arangodb import (
     batch_load_docs,
     equiv_edges_name,
     equiv_nodes_name,
+    normalized_terms_name,
     resources_db,
     resources_metadata_coll,
+    term_aliases_name,
     terms_coll,
     terms_coll_name,
 )
 from bel.db.elasticsearch import es
+from bel.resources.equivalence import equivalence_nodes_iterator, update_equivalence_clusters
+from bel.resources.normalization import update_normalized_terms
 from bel.schemas.terms import Namespace
+from bel.terms.completions import completion_index_path, write_completion_index
+from bel.terms.snapshot import snapshot_path, write_snapshot
 
 # key = ns:id
 # main_key = preferred key, e.g. ns:<primary_id> not the alt_key or obsolete key or even an equivalence key which could be an alt_key
@@ -36,15 +43,20 @@ from bel.schemas.terms import Namespace
 
 namespace_metadata_cache = cachetools.TTLCache(maxsize=1, ttl=600)
 bel_resource_metadata_cache = cachetools.TTLCache(maxsize=1, ttl=600)
+resources_version_cache = cachetools.TTLCache(maxsize=1, ttl=600)
 
 
-def remove_old_db_entries(namespace: str, version: str = "", force: bool = False):
+def remove_old_db_entries(namespace: str, version: str = "", force: bool = False) -> Set[str]:
     """Remove old database entries
 
     Args:
         namespace: preferred namespace prefix, e.g. HGNC or DO
         version: version of last namespace loaded - used to remove older entries from arangodb
         force: remove ALL namespace database entries
+
+    Returns:
+        Set[str]: equivalence clusters of the removed equivalence nodes and edges - to recompute
+            (see bel.resources.equivalence.update_equivalence_clusters)
     """
 
     if force or version == "":
@@ -64,7 +76,9 @@ def remove_old_db_entries(namespace: str, version: str = "", force: bool = False
         FOR doc in {equiv_edges_name}
             FILTER doc.source == "{namespace}"
             {filter_version}
+            LET cluster_id = DOCUMENT(doc._from).cluster_id
             REMOVE doc IN {equiv_edges_name}
+            RETURN cluster_id
     """
 
     remove_old_equivalence_nodes = f"""
@@ -72,11 +86,30 @@ def remove_old_db_entries(namespace: str, version: str = "", force: bool = False
             FILTER doc.source == "{namespace}"
             {filter_version}
             REMOVE doc IN {equiv_nodes_name}
+            RETURN OLD.cluster_id
+    """
+
+    remove_old_term_aliases = f"""
+        FOR doc in {term_aliases_name}
+            FILTER doc.source == "{namespace}"
+            {filter_version}
+            REMOVE doc IN {term_aliases_name}
+    """
+
+    remove_old_normalized_terms = f"""
+        FOR doc in {normalized_terms_name}
+            FILTER doc.source == "{namespace}"
+            {filter_version}
+            REMOVE doc IN {normalized_terms_name}
     """
 
     resources_db.aql.execute(remove_old_terms, ttl=7200)
-    resources_db.aql.execute(remove_old_equivalence_edges, ttl=7200)
-    resources_db.aql.execute(remove_old_equivalence_nodes, ttl=7200)
+    resources_db.aql.execute(remove_old_term_aliases, ttl=7200)
+    cluster_ids = set(resources_db.aql.execute(remove_old_equivalence_edges, ttl=7200))
+    cluster_ids.update(resources_db.aql.execute(remove_old_equivalence_nodes, ttl=7200))
+    resources_db.aql.execute(remove_old_normalized_terms, ttl=7200)
+
+    return {cluster_id for cluster_id in cluster_ids if cluster_id}
 
 
 def load_terms(
@@ -167,15 +200,42 @@ def load_terms(
     ################################################################################
     # Arangodb collection loading
     ################################################################################
+    # Equivalence clusters of the removed equivalences - recomputed after the load
+    removed_cluster_ids = set()
+
     if force:
-        remove_old_db_entries(namespace, version=version, force=True)
+        removed_cluster_ids = remove_old_db_entries(namespace, version=version, force=True)
 
     # LOAD Terms and equivalences INTO ArangoDB
     # Uses update on duplicate to allow primary on equivalence_nodes to not be overwritten
-    batch_load_docs(resources_db, terms_iterator_for_arangodb(f, version), on_duplicate="update")
+    equivalence_node_keys = set()
+    batch_load_docs(
+        resources_db,
+        equivalence_nodes_iterator(terms_iterator_for_arangodb(f, version), equivalence_node_keys),
+        on_duplicate="update",
+    )
+
+    # Memory-mapped term snapshot for term lookups without database queries
+    if settings.BEL_TERMS_SNAPSHOT_DIR:
+        try:
+            write_snapshot(
+                terms_iterator_for_snapshot(f), namespace, version, snapshot_path(namespace)
+            )
+            write_completion_index(
+                terms_iterator_for_snapshot(f),
+                namespace,
+                version,
+                completion_index_path(namespace),
+            )
+        except Exception as e:
+            logger.exception(f"Could not write term snapshot for {namespace} - error: {e}")
+            result["messages"].append(
+                f"WARNING: Could not write term snapshot for namespace: {namespace} - error: {e}"
+            )
 
     # Add metadata to resource metadata collection
     metadata["_key"] = metadata_key
+    metadata["term_aliases"] = True  # term lookups can use the term_aliases collection
 
     if resource_download_url is not None:
         metadata["resource_download_url"] = resource_download_url
@@ -184,7 +244,15 @@ def load_terms(
     clear_resource_metadata_cache()
 
     if not force:
-        remove_old_db_entries(namespace, version=version)
+        removed_cluster_ids = remove_old_db_entries(namespace, version=version)
+
+    # Equivalence clusters of the loaded and removed equivalences (see bel.resources.equivalence)
+    updated_node_keys = update_equivalence_clusters(
+        equivalence_node_keys, removed_cluster_ids=removed_cluster_ids
+    )
+
+    # Normalized terms of the updated equivalence clusters (see bel.resources.normalization)
+    update_normalized_terms(updated_node_keys)
 
     logger.info(
         f'Loaded Namespace: {namespace} with {metadata["statistics"]["entities_count"]} terms into elasticsearch: {settings.TERMS_INDEX}.{index_name} and arangodb collection: {terms_coll_name}',
@@ -227,6 +295,31 @@ def terms_iterator_for_arangodb(f: IO, version: str):
         # Add term record to terms collection
         yield (terms_coll_name, term)
 
+        # Add term aliases - lookup of terms by key, alt_key, obsolete_key or synonym
+        aliases = [(term_key, "key")]
+        aliases.extend([(alt_key, "alt_key") for alt_key in term.get("alt_keys", [])])
+        aliases.extend(
+            [(obsolete_key, "obsolete_key") for obsolete_key in term.get("obsolete_keys", [])]
+        )
+        aliases.extend(
+            [
+                (f"{namespace}:{synonym.lower()}", "synonym")
+                for synonym in dict.fromkeys(term.get("synonyms", []))
+            ]
+        )
+        for alias, alias_type in dict.fromkeys(aliases):
+            yield (
+                term_aliases_name,
+                {
+                    "_key": arango_id_to_key(f"{alias_type}>>{alias}>>{term_db_key}"),
+                    "alias": alias,
+                    "type": alias_type,
+                    "term_dbkey": term_db_key,
+                    "source": namespace,
+                    "version": version,
+                },
+            )
+
         # Add primary ID node
         yield (
             equiv_nodes_name,
@@ -317,6 +410,28 @@ def terms_iterator_for_arangodb(f: IO, version: str):
                 yield equiv_edge
 
 
+def terms_iterator_for_snapshot(f: IO):
+    """Generator for writing the namespace term snapshot (see bel.terms.snapshot)"""
+
+    species_list = settings.BEL_FILTER_SPECIES
+
+    f.seek(0)
+
+    for line in f:
+        term = json.loads(line)
+        # skip if not term record (e.g. is a metadata record)
+        if "term" not in term:
+            continue
+        term = term["term"]
+
+        # Skip if species not listed in config species_list - same terms as loaded into arangodb
+        species_key = term.get("species_key", None)
+        if species_list and species_key and species_key not in species_list:
+            continue
+
+        yield term
+
+
 def terms_iterator_for_elasticsearch(f: IO, index_name: str, metadata: dict):
     """Add index_name to term documents for bulk load"""
 
@@ -399,6 +514,7 @@ def clear_resource_metadata_cache():
 
     namespace_metadata_cache.clear()
     bel_resource_metadata_cache.clear()
+    resources_version_cache.clear()
 
 
 # TODO - refactor get_namespace_metadata and get_bel_resource_metadata into one function
@@ -422,6 +538,21 @@ def get_namespace_metadata():
     return namespaces
 
 
+@cachetools.cached(resources_version_cache)
+def get_resources_version() -> str:
+    """Version of the loaded namespaces - changes when a namespace version is loaded
+
+    Used to namespace the shared term cache keys (see bel.terms.terms)
+    """
+
+    versions = sorted(
+        f"{namespace}={metadata.version}"
+        for namespace, metadata in get_namespace_metadata().items()
+    )
+
+    return hashlib.blake2b("|".join(versions).encode("utf-8"), digest_size=8).hexdigest()
+
+
 @cachetools.cached(bel_resource_metadata_cache)
 def get_bel_resource_metadata():
     """Get BEL resource metadata"""
@@ -443,6 +574,10 @@ def delete_namespace(namespace):
     Remove Arangodb terms and equivalences and remove Elasticsearch terms index
     """
 
-    remove_old_db_entries(namespace, force=True)
+    removed_cluster_ids = remove_old_db_entries(namespace, force=True)
+
+    # Equivalence clusters and normalized terms of the remaining equivalent terms
+    updated_node_keys = update_equivalence_clusters([], removed_cluster_ids=removed_cluster_ids)
+    update_normalized_terms(updated_node_keys)
 
     es.indices.delete(index=f"{settings.TERMS_INDEX}_{namespace.lower()}_*", ignore=[400, 404])
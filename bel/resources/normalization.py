@@ -0,0 +1,229 @@
+"""Normalized terms
+
+Materialized term normalizations for the configured canonicalization targets
+(settings.BEL_CANONICALIZE/BEL_DECANONICALIZE) - term _key -> normalized, canonical and
+decanonical term keys, label, entity_types and annotation_types.
+
+The normalized terms are computed from the equivalence clusters (see bel.resources.equivalence)
+after each namespace load and are all recomputed when the canonicalization targets change. Each
+normalized term has the hash of the canonicalization targets it was computed for so normalized
+terms for other targets are never used (see bel.terms.terms.get_normalized_terms).
+"""
+
+# Standard Library
+import hashlib
+import json
+from typing import Any, Iterable, List, Mapping, Optional
+
+# Third Party
+from loguru import logger
+
+# Local
+import bel.core.settings as settings
+from bel.db.arangodb import (
+    equiv_clusters_name,
+    equiv_nodes_name,
+    normalized_terms_coll,
+    normalized_terms_name,
+    resources_db,
+    terms_coll_name,
+)
+from bel.resources.equivalence import batch_size, batches
+
+Key = str  # namespace:id
+
+
+def targets_hash(
+    canonical_targets: Mapping[str, List[str]] = settings.BEL_CANONICALIZE,
+    decanonical_targets: Mapping[str, List[str]] = settings.BEL_DECANONICALIZE,
+) -> str:
+    """Hash of the canonicalization targets"""
+
+    targets = json.dumps([canonical_targets, decanonical_targets], sort_keys=True)
+
+    return hashlib.blake2b(targets.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def primary_equivalent(
+    equivalents: Optional[Mapping[str, Any]], target_namespaces: List[str], term_key: Key
+) -> Optional[Key]:
+    """Primary equivalent term key in the first target namespace with one
+
+    Uses the primary term keys by namespace of the equivalence cluster (first in sort order)
+    if available, else the first matching equivalent.
+    """
+
+    if not target_namespaces:
+        return None
+
+    primary_keys = equivalents.get("primary_keys")
+
+    for target_ns in target_namespaces:
+        if primary_keys is not None:
+            for primary_key in primary_keys.get(target_ns, []):
+                if primary_key != term_key:
+                    return primary_key
+
+        else:
+            for equivalent in equivalents["equivalents"]:
+                if equivalent["primary"] and target_ns == equivalent["namespace"]:
+                    return equivalent["term_key"]
+
+    return None
+
+
+def normalized_term(
+    term: Mapping[str, Any],
+    primary_keys: Mapping[str, List[Key]],
+    canonical_targets: Mapping[str, List[str]] = settings.BEL_CANONICALIZE,
+    decanonical_targets: Mapping[str, List[str]] = settings.BEL_DECANONICALIZE,
+) -> dict:
+    """Normalized term document
+
+    Args:
+        term: term record (see bel.schemas.terms.Term)
+        primary_keys: primary term keys by namespace of the equivalence cluster of the term
+    """
+
+    equivalents = {"equivalents": [], "primary_keys": primary_keys}
+    namespace = term["namespace"]
+
+    canonical_key = primary_equivalent(
+        equivalents, canonical_targets.get(namespace, []), term["key"]
+    )
+    decanonical_key = primary_equivalent(
+        equivalents, decanonical_targets.get(namespace, []), term["key"]
+    )
+
+    return {
+        "_key": term["_key"],
+        "key": term["key"],
+        "normalized": term["key"],
+        "canonical": canonical_key or term["key"],
+        "decanonical": decanonical_key or term["key"],
+        "label": term.get("label") or "",
+        "entity_types": term.get("entity_types") or [],
+        "annotation_types": term.get("annotation_types") or [],
+        "source": namespace,
+        "version": term.get("version", ""),
+        "targets_hash": targets_hash(canonical_targets, decanonical_targets),
+    }
+
+
+def get_terms_for_normalization(term_dbkeys: Iterable[str]) -> Iterable[dict]:
+    """Terms with the primary term keys of their equivalence clusters - missing terms are skipped"""
+
+    query = f"""
+        FOR term_dbkey IN @term_dbkeys
+            LET term = DOCUMENT("{terms_coll_name}", term_dbkey)
+            FILTER term != null
+            LET node = DOCUMENT("{equiv_nodes_name}", term_dbkey)
+            LET cluster = node.cluster_id ? DOCUMENT("{equiv_clusters_name}", node.cluster_id) : null
+            RETURN {{
+                "_key": term._key,
+                "key": term.key,
+                "namespace": term.namespace,
+                "version": term.version,
+                "label": term.label,
+                "entity_types": term.entity_types,
+                "annotation_types": term.annotation_types,
+                "cluster_id": node.cluster_id,
+                "primary_keys": cluster.primary_keys
+            }}
+    """
+
+    for batch in batches(term_dbkeys):
+        yield from resources_db.aql.execute(query, bind_vars={"term_dbkeys": batch}, ttl=7200)
+
+
+def normalized_terms_stale() -> bool:
+    """Are there normalized terms for other canonicalization targets (the targets have changed)"""
+
+    query = f"""
+        FOR doc IN {normalized_terms_name}
+            FILTER doc.targets_hash != @targets_hash
+            LIMIT 1
+            RETURN doc._key
+    """
+    stale = list(resources_db.aql.execute(query, bind_vars={"targets_hash": targets_hash()}))
+
+    return bool(stale)
+
+
+def check_normalized_terms(force: bool = False) -> int:
+    """Recompute all normalized terms if the canonicalization targets have changed
+
+    Run after changing settings.BEL_CANONICALIZE or BEL_DECANONICALIZE - the normalized terms for
+    other targets are not used until they are recomputed (see bel.resources.manage).
+
+    Args:
+        force: recompute the normalized terms even if the targets have not changed
+
+    Returns:
+        int: number of normalized terms updated
+    """
+
+    if not force and not normalized_terms_stale():
+        logger.info("Normalized terms are up to date")
+        return 0
+
+    return update_normalized_terms()
+
+
+def update_normalized_terms(term_dbkeys: Optional[Iterable[str]] = None) -> int:
+    """Recompute the normalized terms
+
+    All normalized terms are recomputed if term_dbkeys is None or if there are normalized terms
+    for other canonicalization targets (the targets have changed).
+
+    Terms in a canonicalization target namespace without an equivalence cluster (loaded before
+    the equivalence clusters) are skipped - they are normalized at request time until their
+    namespace is reloaded.
+
+    Args:
+        term_dbkeys: term _keys, e.g. of the equivalence nodes updated by the namespace load
+
+    Returns:
+        int: number of normalized terms updated
+    """
+
+    current_hash = targets_hash()
+    stale = normalized_terms_stale()
+
+    if term_dbkeys is None or stale:
+        logger.info("Recomputing all normalized terms")
+        term_dbkeys = resources_db.aql.execute(
+            f"FOR term IN {terms_coll_name} RETURN term._key", ttl=7200
+        )
+
+    target_namespaces = set(settings.BEL_CANONICALIZE) | set(settings.BEL_DECANONICALIZE)
+
+    docs = []
+    count = 0
+    for term in get_terms_for_normalization(term_dbkeys):
+        if term["cluster_id"] is None and term["namespace"] in target_namespaces:
+            continue
+
+        docs.append(normalized_term(term, term["primary_keys"] or {}))
+
+        if len(docs) >= batch_size:
+            normalized_terms_coll.import_bulk(docs, on_duplicate="replace", halt_on_error=False)
+            count += len(docs)
+            docs = []
+
+    if docs:
+        normalized_terms_coll.import_bulk(docs, on_duplicate="replace", halt_on_error=False)
+        count += len(docs)
+
+    # Normalized terms for other canonicalization targets
+    if stale:
+        query = f"""
+            FOR doc IN {normalized_terms_name}
+                FILTER doc.targets_hash != @targets_hash
+                REMOVE doc IN {normalized_terms_name}
+        """
+        resources_db.aql.execute(query, bind_vars={"targets_hash": current_hash}, ttl=7200)
+
+    logger.info(f"Updated {count} normalized terms")
+
+    return count
@@ -3,7 +3,7 @@ import copy
 import enum
 import json
 import re
-from typing import Any, List, Mapping, Optional, Tuple, Union
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
 
 # Third Party
 from loguru import logger
@@ -169,7 +169,11 @@ class AssertionStr(BaseModel):
 
 
 class NsVal(object):
-    """Namespaced value"""
+    """Namespaced value
+
+    The label (and key_label) is looked up lazily on first access if not provided - see
+    resolve_labels to fill in the labels of many NsVals in bulk
+    """
 
     def __init__(
         self, key_label: str = "", namespace: str = "", key: str = "", id: str = "", label: str = ""
@@ -190,12 +194,39 @@ class NsVal(object):
         if not self.key:
             self.key = f"{self.namespace}:{self.id}"
 
-        self.label = ""
+        # None until label is provided or looked up
+        self._label: Optional[str] = None
+        self._key_label: Optional[str] = None
         if label:
-            self.label: str = namespace_quoting(label)
+            self._label = namespace_quoting(label)
+
+    @property
+    def label(self) -> str:
+        if self._label is None:
+            self.update_label()
+
+        return self._label
+
+    @label.setter
+    def label(self, label: str):
+        self._label = label
+        self._key_label = None
+
+    @property
+    def key_label(self) -> str:
+        if self._key_label is None:
+            self.update_key_label()
 
-        # Add key_label to NsVal
-        self.update_key_label()
+        return self._key_label
+
+    @key_label.setter
+    def key_label(self, key_label: str):
+        self._key_label = key_label
+
+    def has_label(self) -> bool:
+        """Label is provided or already looked up"""
+
+        return self._label is not None
 
     def add_label(self):
         if not self.label:
@@ -204,9 +235,12 @@ class NsVal(object):
         return self
 
     def update_label(self):
+        self._label = self._label or ""
+        self._key_label = None
+
         term = bel.terms.terms.get_term(self.key)
         if term and term.label:
-            self.label = namespace_quoting(term.label)
+            self._label = namespace_quoting(term.label)
 
         return self
 
@@ -218,14 +252,12 @@ class NsVal(object):
     def update_key_label(self):
         """Return key with label if available"""
 
-        self.add_label()
-
         if self.label:
-            self.key_label = f"{self.namespace}:{self.id}!{self.label}"
+            self._key_label = f"{self.namespace}:{self.id}!{self.label}"
         else:
-            self.key_label = f"{self.namespace}:{self.id}"
+            self._key_label = f"{self.namespace}:{self.id}"
 
-        return self.key_label
+        return self._key_label
 
     def to_string(self):
         return __str__(self)
@@ -245,9 +277,33 @@ class NsVal(object):
     def __len__(self):
         return len(self.__str__())
 
+    def __bool__(self):
+        # NsVals are always true - __len__ would look up the label
+        return True
+
+
+def resolve_labels(nsvals: Iterable[NsVal]) -> List[NsVal]:
+    """Look up the labels of many NsVals in bulk
+
+    NsVals with labels provided or already looked up are skipped
+    """
+
+    nsvals = [nsval for nsval in nsvals if nsval is not None and not nsval.has_label()]
+
+    bel.terms.terms.prefetch_terms([nsval.key for nsval in nsvals])
+
+    for nsval in nsvals:
+        nsval.update_label()
+
+    return nsvals
+
 
 class BelEntity(object):
-    """BEL Term - supports original NsVal ns:id!label plus (de)canonicalization and orthologs"""
+    """BEL Term - supports original NsVal ns:id!label plus (de)canonicalization and orthologs
+
+    The term info (term, species_key and entity_types) is looked up lazily on first access - see
+    add_term, bel.lang.ast.resolve_terms and BELAst.validate to look up the terms in bulk
+    """
 
     def __init__(self, term_key: Key = "", nsval: Optional[NsVal] = None):
         """Create BelEntity via a term_key or a NsVal object
@@ -255,14 +311,15 @@ class BelEntity(object):
         You cannot provide a term_key_label string (e.g. NS:ID:LABEL) as a term_key
         """
 
-        self.term: Optional[Term] = None
+        self._term: Optional[Term] = None
+        self._term_added: bool = False  # see add_term
 
         self.canonical: Optional[NsVal] = None
         self.decanonical: Optional[NsVal] = None
 
-        self.species_key: Key = None
+        self._species_key: Key = None
 
-        self.entity_types = []
+        self._entity_types = []
 
         self.orthologs: Mapping[Key, dict] = {}
         self.orthologized: bool = False
@@ -272,17 +329,17 @@ class BelEntity(object):
 
         if term_key:
             self.original_term_key = term_key
-            self.term = bel.terms.terms.get_term(term_key)
+            self._term = bel.terms.terms.get_term(term_key)
 
-            if self.term:
-                self.species_key = self.term.species_key
-                self.original_species_key = self.species_key
+            if self._term:
+                self._species_key = self._term.species_key
+                self.original_species_key = self._species_key
 
             self.nsval: NsVal = NsVal(
-                namespace=self.term.namespace, id=self.term.id, label=self.term.label
+                namespace=self._term.namespace, id=self._term.id, label=self._term.label
             )
             self.original_nsval = self.nsval
-        elif nsval:
+        elif nsval is not None:
             self.nsval = nsval
             self.original_nsval = nsval
         else:
@@ -290,23 +347,68 @@ class BelEntity(object):
 
         self.namespace_metadata = get_namespace_metadata().get(self.nsval.namespace, None)
         if self.namespace_metadata is not None and self.namespace_metadata.entity_types:
-            self.entity_types = self.namespace_metadata.entity_types
+            self._entity_types = self.namespace_metadata.entity_types
+
+    @property
+    def term(self) -> Optional[Term]:
+        if not self._term_added:
+            self.add_term()
 
-        self.add_term()
+        return self._term
+
+    @term.setter
+    def term(self, term: Optional[Term]):
+        self._term = term
+        self._term_added = True
+
+    @property
+    def species_key(self) -> Key:
+        if not self._term_added:
+            self.add_term()
+
+        return self._species_key
+
+    @species_key.setter
+    def species_key(self, species_key: Key):
+        if not self._term_added:
+            self.add_term()
+
+        self._species_key = species_key
+
+    @property
+    def entity_types(self) -> list:
+        if not self._term_added:
+            self.add_term()
+
+        return self._entity_types
+
+    @entity_types.setter
+    def entity_types(self, entity_types: list):
+        if not self._term_added:
+            self.add_term()
+
+        self._entity_types = entity_types
+
+    def has_term(self) -> bool:
+        """Term info is added or already looked up"""
+
+        return self._term_added
 
     def add_term(self):
         """Add term info"""
 
+        self._term_added = True
+
         if self.namespace_metadata and self.namespace_metadata.namespace_type == "complete":
-            self.term = bel.terms.terms.get_term(self.nsval.key)
-            if self.term and self.nsval.key != self.term.key:
+            self._term = bel.terms.terms.get_term(self.nsval.key)
+            if self._term and self.nsval.key != self._term.key:
                 self.nsval = NsVal(
-                    namespace=self.term.namespace, id=self.term.id, label=self.term.label
+                    namespace=self._term.namespace, id=self._term.id, label=self._term.label
                 )
-            if self.term and self.term.entity_types:
-                self.entity_types = self.term.entity_types
-            if self.term and self.term.species_key:
-                self.species_key = self.term.species_key
+            if self._term and self._term.entity_types:
+                self._entity_types = self._term.entity_types
+            if self._term and self._term.species_key:
+                self._species_key = self._term.species_key
 
         return self
 
@@ -359,10 +461,16 @@ class BelEntity(object):
         self,
         canonical_targets: Mapping[str, List[str]] = settings.BEL_CANONICALIZE,
         decanonical_targets: Mapping[str, List[str]] = settings.BEL_DECANONICALIZE,
+        normalized: Mapping[str, Any] = None,
     ):
-        """Collect (de)canonical forms"""
+        """Collect (de)canonical forms
 
-        if self.canonical and self.decanonical:
+        Args:
+            normalized: get_normalized_terms() result if already retrieved - see
+                bel.lang.ast.resolve_terms
+        """
+
+        if self.canonical is not None and self.decanonical is not None:
             return self
 
         if self.namespace_metadata and self.namespace_metadata.namespace_type != "complete":
@@ -370,12 +478,14 @@ class BelEntity(object):
             self.decanonical = self.nsval
             return self
 
-        normalized = bel.terms.terms.get_normalized_terms(
-            self.nsval.key,
-            canonical_targets=canonical_targets,
-            decanonical_targets=decanonical_targets,
-            term=self.term,
-        )
+        if normalized is None:
+            term = self.term  # the term info can replace the NsVal - see add_term
+            normalized = bel.terms.terms.get_normalized_terms(
+                self.nsval.key,
+                canonical_targets=canonical_targets,
+                decanonical_targets=decanonical_targets,
+                term=term,
+            )
 
         if normalized["original"] != normalized["normalized"]:
             self.nsval = NsVal(key_label=normalized["normalized"])
@@ -439,8 +549,17 @@ class BelEntity(object):
 
         return self
 
-    def collect_orthologs(self, species_keys: List[Key] = settings.BEL_ORTHOLOGIZE_TARGETS):
-        """Get orthologs for BelEntity is orthologizable"""
+    def collect_orthologs(
+        self,
+        species_keys: List[Key] = settings.BEL_ORTHOLOGIZE_TARGETS,
+        orthologs: Mapping[Key, Key] = None,
+    ):
+        """Get orthologs for BelEntity is orthologizable
+
+        Args:
+            orthologs: orthologs of the BEL Entity if already retrieved - see
+                bel.terms.orthologs.get_orthologs_many
+        """
 
         self.add_entity_types()
         self.normalize()
@@ -455,7 +574,10 @@ class BelEntity(object):
         if not list(set(self.entity_types) & set(["Gene", "RNA", "Micro_RNA", "Protein", "all"])):
             return self
 
-        orthologs = bel.terms.orthologs.get_orthologs(self.canonical.key, species_keys=species_keys)
+        if orthologs is None:
+            orthologs = bel.terms.orthologs.get_orthologs(
+                self.canonical.key, species_keys=species_keys
+            )
 
         for ortholog_species_key in orthologs:
 
@@ -542,6 +664,10 @@ class BelEntity(object):
 
     def __str__(self):
 
+        # The term info can replace the NsVal, e.g. with the current term key
+        if not self._term_added:
+            self.add_term()
+
         return str(self.nsval)
 
     __repr__ = __str__
@@ -1,6 +1,6 @@
 # Standard Library
 import enum
-from typing import Any, List, Mapping, Optional, Union
+from typing import Any, List, Mapping, Optional, Tuple, Union
 
 # Third Party
 from pydantic import BaseModel, Field, HttpUrl
@@ -44,17 +44,26 @@ class Term(BaseModel):
     annotation_types: List[AnnotationTypesEnum] = []
 
 
+class TermCompletionSpecies(BaseModel):
+    key: Optional[Key] = None
+    label: Optional[str] = None
+
+
 class TermCompletion(BaseModel):
 
     key: Key
-    id: str
     name: str
-    label: str
-    description: str
-    species_key: Key
-    entity_types: List[EntityTypesEnum] = []
-    annotation_types: List[AnnotationTypesEnum] = []
-    matches: List[str] = []
+    namespace: str
+    id: str
+    label: str = ""
+    description: Optional[str] = None
+    species: TermCompletionSpecies = TermCompletionSpecies()
+    entity_types: Optional[List[str]] = []
+    annotation_types: Optional[List[str]] = []
+    highlight: List[str] = Field([], description="Matched values with <em> highlighting")
+    sort_tuple: Tuple[int, int] = Field(
+        ..., description="Sort order - (0 if starting with the match else 1, match length)"
+    )
 
 
 class TermCompletionResponse(BaseModel):
@@ -62,6 +71,47 @@ class TermCompletionResponse(BaseModel):
     completions: List[TermCompletion]
 
 
+class TermCompletionRequest(BaseModel):
+    completion_text: str = Field(..., description="String to use for completion")
+    size: int = Field(21, description="Number of completions to return")
+    entity_types: List[str] = Field([], description="Entity types for completion request")
+    annotation_types: List[str] = Field(
+        [], description="Annotation types for completion request, e.g. Tissue, Cell"
+    )
+    species: List[Key] = Field(
+        [], description="Species list for completion request, e.g. TAX:9606, TAX:10090"
+    )
+    namespaces: List[str] = Field([], description="Namespaces for completion request, e.g. HGNC")
+
+
+class TermCompletionsBatchRequest(BaseModel):
+    completions: List[TermCompletionRequest] = Field(
+        ..., description="Term completion requests", max_items=100
+    )
+
+
+class TermCompletionsBatchResponse(BaseModel):
+    completions: List[TermCompletionResponse] = Field(
+        ..., description="Term completions in the order of the requests"
+    )
+
+
+class TermsBatchRequest(BaseModel):
+    term_keys: List[Key] = Field(..., description="Term keys to look up, e.g. HGNC:AKT1")
+    normalize: bool = Field(
+        True, description="Add the normalized, canonical and decanonical term keys"
+    )
+
+
+class TermsBatchResponse(BaseModel):
+    terms: Mapping[Key, List[Term]] = Field(
+        ..., description="Matching terms by term key - empty list if not found"
+    )
+    normalized: Optional[Mapping[Key, Mapping[str, Any]]] = Field(
+        None, description="get_normalized_terms() results by term key"
+    )
+
+
 class Orthologs(BaseModel):
     """Ortholog equivalences - subject and object arbitrarily assigned by lexical ordering"""
 
@@ -114,3 +164,8 @@ class Namespace(BaseModel):
         description="Identifiers.org namespace - if True - this is only a namespace definition without term records",
     )
     identifiers_org_namespace: Optional[str] = Field(None)
+
+    term_aliases: bool = Field(
+        False,
+        description="Term keys, alt_keys, obsolete_keys and synonyms are loaded into the term_aliases collection for term lookups",
+    )
@@ -0,0 +1,584 @@
+"""Memory-mapped term completion indexes
+
+A term completion index is a read-only prefix index of the tokens of the term keys, ids,
+labels, names, synonyms, alt_keys and obsolete_keys of one namespace version - written by
+bel.resources.namespace.load_terms next to the term snapshot (see bel.terms.snapshot) and used
+by bel.terms.terms.get_term_completions instead of Elasticsearch
+(settings.BEL_TERM_COMPLETIONS = "local").
+
+The terms are tokenized the same way as the autocomplete field of the Elasticsearch terms index
+(see bel/db/es_mappings_terms.yml - split on spaces and colons, lowercased) and a completion
+matches a term if any of its tokens is a prefix of a term token. The sorted token table is
+binary searched for the range of tokens with the prefix - the postings of each token have the
+snapshot record index and the term fields of the token. The entity types, annotation types and
+species of each term are kept as bitsets/ids so the completion filters don't need the term
+records.
+
+File layout (little-endian):
+
+    header           magic, namespace and version string ids, section counts
+    vocabularies     string ids of the entity types, annotation types and species keys
+    string offsets   (string count + 1) uint64 offsets into the string region
+    tokens           (token string id, first posting) uint32 pairs sorted by token - a final
+                     pair has the posting count
+    postings         (record index, field mask) uint32 pairs
+    record filters   (entity types bitset, annotation types bitset) uint64 and species uint32
+                     (species vocabulary index + 1, 0 for no species) per record
+    strings          interned UTF-8 strings
+"""
+
+# Standard Library
+import heapq
+import math
+import mmap
+import os
+import re
+import struct
+import tempfile
+from collections import defaultdict
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+# Third Party
+from loguru import logger
+
+# Local
+import bel.core.settings as settings
+from bel.terms.snapshot import TermSnapshot
+
+MAGIC = b"BELCMPL1"
+header_struct = struct.Struct("<8sIIIIIIIII")  # magic, namespace, version, counts
+token_struct = struct.Struct("<II")  # token string id, first posting
+posting_struct = struct.Struct("<II")  # record index, field mask
+filter_struct = struct.Struct("<QQI")  # entity types, annotation types, species
+offset_pair_struct = struct.Struct("<QQ")  # start and end offsets
+
+# Term fields of the tokens - as copied to the autocomplete field of the Elasticsearch index
+KEY, ID, LABEL, NAME, SYNONYMS, ALT_KEYS, OBSOLETE_KEYS = (1, 2, 4, 8, 16, 32, 64)
+autocomplete_fields = (
+    ("key", KEY),
+    ("id", ID),
+    ("label", LABEL),
+    ("name", NAME),
+    ("synonyms", SYNONYMS),
+    ("alt_keys", ALT_KEYS),
+    ("obsolete_keys", OBSOLETE_KEYS),
+)
+
+max_gram = 20  # longest completion token prefix matched - edge_ngram max_gram of the ES index
+max_postings = 20000  # postings scanned per completion token and namespace
+max_highlights = 5  # highlight fragments per completion
+
+# Score boosts of the Elasticsearch completion query (see get_term_completions)
+key_boost = 6
+label_boost = 5
+synonym_boost = 1
+namespace_boost = 6
+
+# Open completion indexes by namespace
+completion_indexes: Mapping[str, "CompletionIndex"] = {}
+
+
+def tokenize(value: str) -> List[str]:
+    """Lowercased tokens split on spaces and colons - the ES autocomplete analyzer tokens"""
+
+    return [token for token in re.split("[ :]", value.lower()) if token]
+
+
+def completion_index_path(namespace: str, directory: Optional[str] = None) -> str:
+    """Completion index file path for namespace"""
+
+    if directory is None:
+        directory = settings.BEL_TERMS_SNAPSHOT_DIR
+
+    return os.path.join(directory, f"{namespace}.completions")
+
+
+def write_completion_index(
+    terms: Iterable[Mapping[str, Any]], namespace: str, version: str, path: str
+):
+    """Write term completion index file
+
+    The terms need to be in the same order as written to the term snapshot of the namespace
+    version (see bel.terms.snapshot.write_snapshot) - the postings are snapshot record indexes.
+
+    Args:
+        terms: term records (see bel.schemas.terms.Term)
+        namespace: namespace prefix, e.g. HGNC
+        version: namespace version - the index is only used for this version
+        path: completion index file path
+    """
+
+    strings = {}  # interned string -> string id
+
+    def intern(value: str) -> int:
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    vocabularies = {"entity_types": {}, "annotation_types": {}, "species": {}}
+
+    def bitset(values: Iterable[str], vocabulary: dict) -> int:
+        bits = 0
+        for value in values or []:
+            if value not in vocabulary:
+                if len(vocabulary) == 64:
+                    raise ValueError(f"More than 64 types for term completion bitsets: {value}")
+                vocabulary[value] = len(vocabulary)
+            bits |= 1 << vocabulary[value]
+        return bits
+
+    namespace_id = intern(namespace)
+    version_id = intern(version)
+
+    postings = defaultdict(dict)  # token -> record index -> field mask
+    record_filters = []
+
+    for record_idx, term in enumerate(terms):
+        for field, field_mask in autocomplete_fields:
+            values = term.get(field) or []
+            if isinstance(values, str):
+                values = [values]
+            for value in values:
+                for token in tokenize(value):
+                    postings[token][record_idx] = postings[token].get(record_idx, 0) | field_mask
+
+        species_key = term.get("species_key") or ""
+        species = 0
+        if species_key:
+            species = vocabularies["species"].setdefault(species_key, len(vocabularies["species"]))
+            species += 1
+
+        record_filters.append(
+            (
+                bitset(term.get("entity_types"), vocabularies["entity_types"]),
+                bitset(term.get("annotation_types"), vocabularies["annotation_types"]),
+                species,
+            )
+        )
+
+    vocabulary_ids = [
+        [intern(value) for value in vocabulary] for vocabulary in vocabularies.values()
+    ]
+
+    tokens = []
+    posting_pairs = []
+    for token in sorted(postings):
+        tokens.append((intern(token), len(posting_pairs)))
+        posting_pairs.extend(sorted(postings[token].items()))
+    tokens.append((0, len(posting_pairs)))
+
+    string_offsets = [0]
+    string_region = bytearray()
+    for value in strings:  # insertion order is the string id order
+        string_region.extend(value.encode("utf-8"))
+        string_offsets.append(len(string_region))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    (fd, tmp_path) = tempfile.mkstemp(dir=directory, prefix=f".{namespace}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                header_struct.pack(
+                    MAGIC,
+                    namespace_id,
+                    version_id,
+                    len(strings),
+                    len(tokens) - 1,
+                    len(posting_pairs),
+                    len(record_filters),
+                    *[len(ids) for ids in vocabulary_ids],
+                )
+            )
+            vocabulary_words = [string_id for ids in vocabulary_ids for string_id in ids]
+            f.write(struct.pack(f"<{len(vocabulary_words)}I", *vocabulary_words))
+            if (header_struct.size + 4 * len(vocabulary_words)) % 8:
+                f.write(b"\0" * 4)  # align the uint64 offsets
+            f.write(struct.pack(f"<{len(string_offsets)}Q", *string_offsets))
+            for token in tokens:
+                f.write(token_struct.pack(*token))
+            for posting in posting_pairs:
+                f.write(posting_struct.pack(*posting))
+            for record_filter in record_filters:
+                f.write(filter_struct.pack(*record_filter))
+            f.write(string_region)
+
+        os.replace(tmp_path, path)
+
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+    logger.info(
+        f"Wrote term completion index {path} for {namespace} {version} with {len(tokens) - 1} tokens"
+    )
+
+
+class CompletionIndex(object):
+    """Read-only memory-mapped term completion index"""
+
+    def __init__(self, path: str):
+
+        self.path = path
+
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            namespace_id,
+            version_id,
+            string_count,
+            self.token_count,
+            posting_count,
+            record_count,
+            *vocabulary_counts,
+        ) = header_struct.unpack_from(self.mm, 0)
+
+        if magic != MAGIC:
+            raise ValueError(f"Not a term completion index: {path}")
+
+        offset = header_struct.size
+        vocabulary_ids = []
+        for count in vocabulary_counts:
+            vocabulary_ids.append(struct.unpack_from(f"<{count}I", self.mm, offset))
+            offset += 4 * count
+        offset += -offset % 8
+
+        self.string_offsets_offset = offset
+        offset += 8 * (string_count + 1)
+
+        self.tokens_offset = offset
+        offset += token_struct.size * (self.token_count + 1)
+
+        self.postings_offset = offset
+        offset += posting_struct.size * posting_count
+
+        self.filters_offset = offset
+        offset += filter_struct.size * record_count
+
+        self.strings_offset = offset
+
+        self.namespace = self.string(namespace_id)
+        self.version = self.string(version_id)
+
+        (self.entity_types, self.annotation_types, self.species) = [
+            {self.string(string_id): idx for idx, string_id in enumerate(ids)}
+            for ids in vocabulary_ids
+        ]
+
+    def close(self):
+        self.mm.close()
+
+    def string(self, string_id: int) -> str:
+        (start, end) = offset_pair_struct.unpack_from(
+            self.mm, self.string_offsets_offset + 8 * string_id
+        )
+        return self.mm[self.strings_offset + start : self.strings_offset + end].decode("utf-8")
+
+    def token(self, idx: int) -> Tuple[str, int]:
+        """Token and its first posting"""
+
+        (string_id, posting_idx) = token_struct.unpack_from(
+            self.mm, self.tokens_offset + idx * token_struct.size
+        )
+        return (self.string(string_id), posting_idx)
+
+    def token_range(self, prefix: str) -> Tuple[int, int]:
+        """Range of the token indexes of the tokens starting with prefix"""
+
+        def lower_bound(value: str) -> int:
+            (low, high) = (0, self.token_count)
+            while low < high:
+                middle = (low + high) // 2
+                if self.token(middle)[0] < value:
+                    low = middle + 1
+                else:
+                    high = middle
+            return low
+
+        return (lower_bound(prefix), lower_bound(prefix + "\U0010ffff"))
+
+    def bitset(self, values: Iterable[str], vocabulary: Mapping[str, int]) -> int:
+        bits = 0
+        for value in values:
+            if value in vocabulary:
+                bits |= 1 << vocabulary[value]
+        return bits
+
+    def search(
+        self,
+        completion_tokens: List[str],
+        entity_types: List[str] = None,
+        annotation_types: List[str] = None,
+        species_keys: List[str] = None,
+    ) -> Mapping[int, List[float]]:
+        """Match the terms with a token starting with any of the completion tokens
+
+        Args:
+            completion_tokens: tokenized completion text (see tokenize)
+            entity_types: only terms with any of the entity types
+            annotation_types: only terms with any of the annotation types
+            species_keys: only terms without species or with any of the species
+
+        Returns:
+            Mapping[int, List[float]]: [token score, label match, synonym match] by record index
+        """
+
+        entity_bits = self.bitset(entity_types or [], self.entity_types)
+        annotation_bits = self.bitset(annotation_types or [], self.annotation_types)
+        species = {self.species[key] + 1 for key in species_keys or [] if key in self.species}
+
+        if (entity_types and not entity_bits) or (annotation_types and not annotation_bits):
+            return {}
+
+        def match(record_idx: int) -> bool:
+            (
+                record_entity_bits,
+                record_annotation_bits,
+                record_species,
+            ) = filter_struct.unpack_from(
+                self.mm, self.filters_offset + record_idx * filter_struct.size
+            )
+            if entity_types and not record_entity_bits & entity_bits:
+                return False
+            if annotation_types and not record_annotation_bits & annotation_bits:
+                return False
+            if species_keys and record_species and record_species not in species:
+                return False
+            return True
+
+        matches = {}
+        for completion_token in dict.fromkeys(completion_tokens):
+            if len(completion_token) > max_gram:
+                continue
+
+            (start, end) = self.token_range(completion_token)
+            scanned = 0
+            token_scores = {}
+            for token_idx in range(start, end):
+                (token, first_posting) = self.token(token_idx)
+                last_posting = self.token(token_idx + 1)[1]
+                last_posting = min(last_posting, first_posting + max_postings - scanned)
+
+                postings = self.mm[
+                    self.postings_offset
+                    + first_posting * posting_struct.size : self.postings_offset
+                    + last_posting * posting_struct.size
+                ]
+                for (record_idx, field_mask) in posting_struct.iter_unpack(postings):
+                    if record_idx not in matches and record_idx not in token_scores:
+                        if not match(record_idx):
+                            continue
+
+                    # Closer prefix matches score higher - as the shorter ES ngram field norms
+                    score = token_scores.get(record_idx, [0.0, False, False])
+                    score[0] = max(score[0], len(completion_token) / len(token))
+                    if token == completion_token:
+                        score[1] = score[1] or bool(field_mask & LABEL)
+                        score[2] = score[2] or bool(field_mask & SYNONYMS)
+                    token_scores[record_idx] = score
+
+                scanned += last_posting - first_posting
+                if scanned >= max_postings:
+                    break
+
+            for record_idx, (token_score, label_match, synonym_match) in token_scores.items():
+                score = matches.setdefault(record_idx, [0.0, False, False])
+                score[0] += token_score
+                score[1] = score[1] or label_match
+                score[2] = score[2] or synonym_match
+
+        return matches
+
+
+def open_completion_index(
+    namespace: str, version: Optional[str] = None
+) -> Optional[CompletionIndex]:
+    """Open completion index of namespace
+
+    Returns None if there is no completion index for the namespace version.
+    """
+
+    completion_index = completion_indexes.get(namespace)
+    if completion_index is not None and (version is None or completion_index.version == version):
+        return completion_index
+
+    path = completion_index_path(namespace)
+    if not settings.BEL_TERMS_SNAPSHOT_DIR or not os.path.exists(path):
+        return None
+
+    try:
+        new_completion_index = CompletionIndex(path)
+    except Exception as e:
+        logger.error(f"Could not open term completion index {path} - error: {e}")
+        return None
+
+    if version is not None and new_completion_index.version != version:
+        new_completion_index.close()
+        return None
+
+    completion_indexes[namespace] = new_completion_index
+
+    return new_completion_index
+
+
+def clear_completion_indexes():
+    """Forget the open completion indexes - reopened on the next completion"""
+
+    completion_indexes.clear()
+
+
+def highlight(values: Iterable[str], completion_tokens: List[str]) -> List[str]:
+    """Values with the tokens matching the completion tokens emphasized
+
+    Same as the Elasticsearch plain highlighter of the autocomplete field, e.g. <em>AKT1</em>
+    """
+
+    fragments = []
+    for value in values:
+        matched = False
+        parts = re.split("([ :])", value)
+        for idx, part in enumerate(parts):
+            if part and part not in (" ", ":"):
+                if any(part.lower().startswith(token) for token in completion_tokens):
+                    parts[idx] = f"<em>{part}</em>"
+                    matched = True
+
+        if matched:
+            fragments.append("".join(parts))
+            if len(fragments) == max_highlights:
+                break
+
+    return fragments
+
+
+def autocomplete_values(term: Mapping[str, Any]) -> List[str]:
+    """Term values copied to the autocomplete field of the Elasticsearch index"""
+
+    values = [term.get("key"), term.get("id"), term.get("label"), term.get("name")]
+    for field in ("synonyms", "alt_keys", "obsolete_keys"):
+        values.extend(term.get(field) or [])
+
+    return [value for value in values if value]
+
+
+def highlight_matches(
+    values: Iterable[str], completion_tokens: List[str]
+) -> Tuple[List[str], Tuple[int, int]]:
+    """Deduplicated highlights and the sort_tuple of a completion (see get_term_completions)"""
+
+    # Filter out duplicate matches
+    matches = []
+    matches_lower = []
+    for match in highlight(values, completion_tokens):
+        if match.lower() in matches_lower:
+            continue
+        matches.append(match)
+        matches_lower.append(match.lower())
+
+    # Sorting parameters
+    startswith_sort = 0 if matches and matches[0].startswith("<em>") else 1
+    sort_len = len(matches[0]) if matches else 0
+
+    return (matches, (startswith_sort, sort_len))
+
+
+def search_terms(
+    completion_text: str,
+    size: int,
+    snapshots: Mapping[str, TermSnapshot],
+    indexes: Mapping[str, CompletionIndex],
+    entity_types: List[str] = None,
+    annotation_types: List[str] = None,
+    species_keys: List[str] = None,
+    namespaces: List[str] = None,
+) -> List[Mapping[str, Any]]:
+    """Best matching term records of the completion text in the completion indexes
+
+    Scores the matches like the Elasticsearch completion query - closer token prefix matches,
+    boosted by exact key, label and synonym matches and by the settings.BEL_BOOST_NAMESPACES.
+    """
+
+    completion_tokens = tokenize(completion_text)
+    if not completion_tokens:
+        return []
+
+    scored = []
+    for namespace, completion_index in indexes.items():
+        if namespaces and namespace not in namespaces:
+            continue
+
+        matches = completion_index.search(
+            completion_tokens, entity_types, annotation_types, species_keys
+        )
+
+        boost = namespace_boost if namespace in settings.BEL_BOOST_NAMESPACES else 0
+        for record_idx, (token_score, label_match, synonym_match) in matches.items():
+            score = token_score + label_boost * label_match + synonym_boost * synonym_match + boost
+            scored.append((score, namespace, record_idx))
+
+    # Top completions - the exact key match boost needs the term key
+    candidates = []
+    for score, namespace, record_idx in heapq.nlargest(
+        size + math.ceil(size / 2), scored, key=lambda match: match[0]
+    ):
+        term = snapshots[namespace].record(record_idx)
+        if term["key"] == completion_text:
+            score += key_boost
+        candidates.append((score, term))
+
+    candidates.sort(
+        key=lambda candidate: (-candidate[0], len(candidate[1]["key"]), candidate[1]["key"])
+    )
+
+    return [term for score, term in candidates[:size]]
+
+
+def term_completion(term: Mapping[str, Any], completion_tokens: List[str]) -> Mapping[str, Any]:
+    """Term completion of a term record (see bel.terms.terms.get_term_completions)"""
+
+    (matches, sort_tuple) = highlight_matches(autocomplete_values(term), completion_tokens)
+
+    return {
+        "key": term["key"],
+        "name": term["name"] or "Missing Name",
+        "namespace": term["namespace"],
+        "id": term["id"],
+        "label": term["label"],
+        "description": term["description"] or None,
+        "species": {"key": term["species_key"] or None, "label": term["species_label"] or None},
+        "entity_types": term["entity_types"],
+        "annotation_types": term["annotation_types"],
+        "highlight": matches,
+        "sort_tuple": sort_tuple,
+    }
+
+
+def term_completions(
+    completion_text: str,
+    size: int,
+    snapshots: Mapping[str, TermSnapshot],
+    indexes: Mapping[str, CompletionIndex],
+    entity_types: List[str] = None,
+    annotation_types: List[str] = None,
+    species_keys: List[str] = None,
+    namespaces: List[str] = None,
+) -> List[Mapping[str, Any]]:
+    """Term completions from the completion indexes - see bel.terms.terms.get_term_completions"""
+
+    terms = search_terms(
+        completion_text,
+        size,
+        snapshots,
+        indexes,
+        entity_types=entity_types,
+        annotation_types=annotation_types,
+        species_keys=species_keys,
+        namespaces=namespaces,
+    )
+
+    completion_tokens = tokenize(completion_text)
+
+    return [term_completion(term, completion_tokens) for term in terms]
@@ -6,6 +6,7 @@ import cachetools
 from loguru import logger
 
 # Local
+import bel.core.singleflight as singleflight
 import bel.db.arangodb
 import bel.terms.terms
 from bel.db.arangodb import ortholog_edges_name, ortholog_nodes_name, resources_db
@@ -13,6 +14,10 @@ from bel.db.arangodb import ortholog_edges_name, ortholog_nodes_name, resources_
 Key = str
 
 
+@singleflight.singleflight(
+    "orthologs",
+    key=lambda term_key, species_keys=[]: cachetools.keys.hashkey(term_key, tuple(species_keys)),
+)
 def get_orthologs(term_key: Key, species_keys: List[Key] = []) -> Mapping[Key, Key]:
     """Get orthologs for given gene and species
 
@@ -61,3 +66,67 @@ def get_orthologs(term_key: Key, species_keys: List[Key] = []) -> Mapping[Key, K
         orthologs[ortholog["species_key"]] = ortholog["key"]
 
     return orthologs
+
+
+def get_orthologs_many(
+    term_keys: List[Key], species_keys: List[Key] = []
+) -> Mapping[Key, Mapping[Key, Key]]:
+    """Get orthologs for many genes and given species in bulk
+
+    Same results as get_orthologs() for each term key - the term keys are normalized in bulk
+    and the orthologs of all of them are retrieved in one query.
+
+    Args:
+        term_keys: gene, rna or protein term keys for which to retrieve orthologs
+        species_keys: target species keys for ortholog - e.g. TAX:<number>
+
+    Returns:
+        Mapping[Key, Mapping[Key, Key]]: {"HGNC:AKT1": {"TAX:9606": "EG:207"}}
+    """
+
+    term_keys = list(dict.fromkeys(term_keys))
+    if not term_keys:
+        return {}
+
+    # Normalize first
+    normalized = bel.terms.terms.get_normalized_terms_many(term_keys)
+
+    canonical_dbkeys = {}
+    for term_key in term_keys:
+        canonical_key = normalized[term_key]["canonical"]
+        canonical_dbkeys[term_key] = bel.db.arangodb.arango_id_to_key(canonical_key)
+
+    query = f"""
+        FOR canonical_dbkey IN @canonical_dbkeys
+            LET start = (
+                FOR vertex in {ortholog_nodes_name}
+                    FILTER vertex._key == canonical_dbkey
+                    RETURN {{ "key": vertex.key, "species_key": vertex.species_key }}
+            )
+
+            LET orthologs = (
+                FOR vertex IN 1..3
+                    ANY CONCAT("{ortholog_nodes_name}/", canonical_dbkey) {ortholog_edges_name}
+                    OPTIONS {{ bfs: true, uniqueVertices : 'global' }}
+                    FILTER LENGTH(@species_keys) == 0 OR vertex.species_key IN @species_keys
+                    RETURN DISTINCT {{ "key": vertex.key, "species_key": vertex.species_key }}
+            )
+
+            RETURN {{ "dbkey": canonical_dbkey, "orthologs": FLATTEN(UNION(start, orthologs)) }}
+    """
+
+    bind_vars = {
+        "canonical_dbkeys": list(dict.fromkeys(canonical_dbkeys.values())),
+        "species_keys": list(species_keys),
+    }
+
+    orthologs_by_dbkey = {}
+    for result in resources_db.aql.execute(query, bind_vars=bind_vars, ttl=60, batch_size=20):
+        orthologs_by_dbkey[result["dbkey"]] = {
+            ortholog["species_key"]: ortholog["key"] for ortholog in result["orthologs"]
+        }
+
+    return {
+        term_key: dict(orthologs_by_dbkey.get(canonical_dbkeys[term_key], {}))
+        for term_key in term_keys
+    }
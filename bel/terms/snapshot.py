@@ -0,0 +1,332 @@
+"""Memory-mapped namespace term snapshots
+
+A term snapshot is a read-only file with the term records of one namespace version written by
+bel.resources.namespace.load_terms (settings.BEL_TERMS_SNAPSHOT_DIR). The file is memory-mapped
+so the term lookups need no database queries and all worker processes share one copy of the
+file in the page cache.
+
+File layout (little-endian):
+
+    header           magic, namespace and version string ids, section counts
+    prefixes         string ids of the namespace prefixes of the lookup keys
+    string offsets   (string count + 1) uint64 offsets into the string region
+    record offsets   (record count + 1) uint64 offsets into the record region
+    entries          (lookup key string id, record index, lookup type) uint32 triples sorted
+                     by lookup key
+    strings          interned UTF-8 strings
+    records          uint32 string ids of the term fields - a count precedes list fields
+"""
+
+# Standard Library
+import mmap
+import os
+import struct
+import tempfile
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+# Third Party
+from loguru import logger
+
+# Local
+import bel.core.settings as settings
+
+Key = str  # namespace:id
+
+MAGIC = b"BELTERM1"
+header_struct = struct.Struct("<8sIIIIII")  # magic, namespace, version, counts
+entry_struct = struct.Struct("<III")  # lookup key string id, record index, lookup type
+offset_struct = struct.Struct("<Q")
+offset_pair_struct = struct.Struct("<QQ")  # start and end offsets
+
+# Lookup types of the entries
+KEY, ALT_KEY, OBSOLETE_KEY, SYNONYM, EQUIVALENCE = range(5)
+
+# Term fields stored in the records (see bel.schemas.terms.Term)
+scalar_fields = (
+    "key",
+    "namespace",
+    "id",
+    "label",
+    "name",
+    "description",
+    "species_key",
+    "species_label",
+)
+list_fields = (
+    "synonyms",
+    "alt_keys",
+    "child_keys",
+    "parent_keys",
+    "obsolete_keys",
+    "equivalence_keys",
+    "entity_types",
+    "annotation_types",
+)
+
+# Open snapshots by namespace
+snapshots: Mapping[str, "TermSnapshot"] = {}
+
+
+def snapshot_path(namespace: str, directory: Optional[str] = None) -> str:
+    """Snapshot file path for namespace"""
+
+    if directory is None:
+        directory = settings.BEL_TERMS_SNAPSHOT_DIR
+
+    return os.path.join(directory, f"{namespace}.terms")
+
+
+def write_snapshot(terms: Iterable[Mapping[str, Any]], namespace: str, version: str, path: str):
+    """Write term snapshot file
+
+    The file is written to a temporary file and moved into place so that open snapshots of a
+    prior version stay readable.
+
+    Args:
+        terms: term records (see bel.schemas.terms.Term)
+        namespace: namespace prefix, e.g. HGNC
+        version: namespace version - a snapshot is only used for this version
+        path: snapshot file path
+    """
+
+    strings = {}  # interned string -> string id
+
+    def intern(value) -> int:
+        value = "" if value is None else str(value)
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    namespace_id = intern(namespace)
+    version_id = intern(version)
+
+    record_offsets = [0]
+    records = bytearray()
+    entries = []
+
+    for term in terms:
+        record_idx = len(record_offsets) - 1
+
+        words = [intern(term.get(field, "")) for field in scalar_fields]
+        for field in list_fields:
+            values = term.get(field) or []
+            words.append(len(values))
+            words.extend([intern(value) for value in values])
+
+        records.extend(struct.pack(f"<{len(words)}I", *words))
+        record_offsets.append(len(records))
+
+        lookups = [(term["key"], KEY)]
+        lookups.extend([(alt_key, ALT_KEY) for alt_key in term.get("alt_keys") or []])
+        lookups.extend(
+            [(obsolete_key, OBSOLETE_KEY) for obsolete_key in term.get("obsolete_keys") or []]
+        )
+        lookups.extend(
+            [(f"{term['namespace']}:{synonym}", SYNONYM) for synonym in term.get("synonyms") or []]
+        )
+        lookups.extend([(eqv_key, EQUIVALENCE) for eqv_key in term.get("equivalence_keys") or []])
+
+        for lookup_key, lookup_type in dict.fromkeys(lookups):
+            entries.append((lookup_key, record_idx, lookup_type))
+
+    entries.sort()
+
+    prefixes = sorted({lookup_key.split(":", 1)[0] for lookup_key, _, _ in entries})
+    prefix_ids = [intern(prefix) for prefix in prefixes]
+    entries = [(intern(lookup_key), idx, lookup_type) for lookup_key, idx, lookup_type in entries]
+
+    string_offsets = [0]
+    string_region = bytearray()
+    for value in strings:  # insertion order is the string id order
+        string_region.extend(value.encode("utf-8"))
+        string_offsets.append(len(string_region))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    (fd, tmp_path) = tempfile.mkstemp(dir=directory, prefix=f".{namespace}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                header_struct.pack(
+                    MAGIC,
+                    namespace_id,
+                    version_id,
+                    len(prefix_ids),
+                    len(strings),
+                    len(record_offsets) - 1,
+                    len(entries),
+                )
+            )
+            f.write(struct.pack(f"<{len(prefix_ids)}I", *prefix_ids))
+            if len(prefix_ids) % 2:
+                f.write(b"\0" * 4)  # align the uint64 offsets
+            f.write(struct.pack(f"<{len(string_offsets)}Q", *string_offsets))
+            f.write(struct.pack(f"<{len(record_offsets)}Q", *record_offsets))
+            for entry in entries:
+                f.write(entry_struct.pack(*entry))
+            f.write(string_region)
+            f.write(b"\0" * (-len(string_region) % 4))
+            f.write(records)
+
+        os.replace(tmp_path, path)
+
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+    logger.info(
+        f"Wrote term snapshot {path} for {namespace} {version} with {len(record_offsets) - 1} terms"
+    )
+
+
+class TermSnapshot(object):
+    """Read-only memory-mapped term snapshot"""
+
+    def __init__(self, path: str):
+
+        self.path = path
+
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            namespace_id,
+            version_id,
+            prefix_count,
+            string_count,
+            self.record_count,
+            self.entry_count,
+        ) = header_struct.unpack_from(self.mm, 0)
+
+        if magic != MAGIC:
+            raise ValueError(f"Not a term snapshot: {path}")
+
+        offset = header_struct.size
+        prefix_ids = struct.unpack_from(f"<{prefix_count}I", self.mm, offset)
+        offset += 4 * (prefix_count + prefix_count % 2)
+
+        self.string_offsets_offset = offset
+        offset += 8 * (string_count + 1)
+
+        self.record_offsets_offset = offset
+        offset += 8 * (self.record_count + 1)
+
+        self.entries_offset = offset
+        offset += entry_struct.size * self.entry_count
+
+        self.strings_offset = offset
+        offset += offset_struct.unpack_from(self.mm, self.string_offsets_offset + 8 * string_count)[
+            0
+        ]
+        self.records_offset = offset + (-offset % 4)
+
+        self.namespace = self.string(namespace_id)
+        self.version = self.string(version_id)
+        self.prefixes = frozenset(self.string(prefix_id) for prefix_id in prefix_ids)
+
+    def close(self):
+        self.mm.close()
+
+    def string(self, string_id: int) -> str:
+        (start, end) = offset_pair_struct.unpack_from(
+            self.mm, self.string_offsets_offset + 8 * string_id
+        )
+        return self.mm[self.strings_offset + start : self.strings_offset + end].decode("utf-8")
+
+    def entry(self, idx: int) -> Tuple[str, int, int]:
+        (string_id, record_idx, lookup_type) = entry_struct.unpack_from(
+            self.mm, self.entries_offset + idx * entry_struct.size
+        )
+        return (self.string(string_id), record_idx, lookup_type)
+
+    def record(self, record_idx: int) -> Mapping[str, Any]:
+        """Term record"""
+
+        (start, end) = offset_pair_struct.unpack_from(
+            self.mm, self.record_offsets_offset + 8 * record_idx
+        )
+        words = struct.unpack_from(f"<{(end - start) // 4}I", self.mm, self.records_offset + start)
+
+        term = {field: self.string(words[idx]) for idx, field in enumerate(scalar_fields)}
+
+        idx = len(scalar_fields)
+        for field in list_fields:
+            count = words[idx]
+            term[field] = [self.string(string_id) for string_id in words[idx + 1 : idx + 1 + count]]
+            idx += count + 1
+
+        return term
+
+    def lookup(self, lookup_key: str, lookup_types: Iterable[int]) -> List[int]:
+        """Record indexes matching the lookup key by any of the lookup types - in record order"""
+
+        return sorted(
+            {
+                record_idx
+                for record_idx, lookup_type in self.lookup_entries(lookup_key)
+                if lookup_type in lookup_types
+            }
+        )
+
+    def lookup_entries(self, lookup_key: str) -> List[Tuple[int, int]]:
+        """(record index, lookup type) entries of the lookup key"""
+
+        if lookup_key.split(":", 1)[0] not in self.prefixes:
+            return []
+
+        # Binary search for the first entry of the lookup key
+        (low, high) = (0, self.entry_count)
+        while low < high:
+            middle = (low + high) // 2
+            if self.entry(middle)[0] < lookup_key:
+                low = middle + 1
+            else:
+                high = middle
+
+        entries = []
+        for idx in range(low, self.entry_count):
+            (entry_key, record_idx, lookup_type) = self.entry(idx)
+            if entry_key != lookup_key:
+                break
+            entries.append((record_idx, lookup_type))
+
+        return entries
+
+
+def open_snapshot(namespace: str, version: Optional[str] = None) -> Optional[TermSnapshot]:
+    """Open term snapshot of namespace
+
+    Returns None if there is no snapshot for the namespace version - the snapshot file is
+    reopened if a snapshot of another version is open.
+    """
+
+    snapshot = snapshots.get(namespace)
+    if snapshot is not None and (version is None or snapshot.version == version):
+        return snapshot
+
+    path = snapshot_path(namespace)
+    if not settings.BEL_TERMS_SNAPSHOT_DIR or not os.path.exists(path):
+        return None
+
+    try:
+        new_snapshot = TermSnapshot(path)
+    except Exception as e:
+        logger.error(f"Could not open term snapshot {path} - error: {e}")
+        return None
+
+    if version is not None and new_snapshot.version != version:
+        new_snapshot.close()
+        return None
+
+    # Prior version snapshot is not closed - its terms may still be in use
+    snapshots[namespace] = new_snapshot
+
+    return new_snapshot
+
+
+def clear_snapshots():
+    """Forget the open term snapshots - reopened on the next lookup"""
+
+    snapshots.clear()
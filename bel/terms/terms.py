@@ -1,7 +1,7 @@
 # Standard Library
 import re
 import time
-from typing import Any, List, Mapping, Optional, Union
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
 
 # Third Party
 import cachetools
@@ -10,16 +10,85 @@ from loguru import logger
 
 # Local
 import bel.core.settings as settings
+import bel.core.singleflight as singleflight
 from bel.core.utils import asyncify, namespace_quoting, split_key_label
-from bel.db.arangodb import arango_id_to_key, resources_db, terms_coll_name
-from bel.db.elasticsearch import es
-from bel.resources.namespace import get_namespace_metadata
+from bel.db.arangodb import (
+    arango_id_to_key,
+    equiv_clusters_name,
+    equiv_edges_name,
+    equiv_nodes_name,
+    normalized_terms_name,
+    resources_db,
+    term_aliases_name,
+    terms_coll_name,
+)
+from bel.db.elasticsearch import es, get_alias_index_names
+from bel.db.redis import RedisTieredCache
+from bel.resources.namespace import get_namespace_metadata, get_resources_version
+from bel.resources.normalization import primary_equivalent, targets_hash
 from bel.schemas.terms import Term
+from bel.terms.completions import (
+    CompletionIndex,
+    autocomplete_values,
+    highlight_matches,
+    max_gram,
+    open_completion_index,
+    search_terms,
+    term_completion,
+    tokenize,
+)
+from bel.terms.snapshot import (
+    ALT_KEY,
+    EQUIVALENCE,
+    KEY,
+    OBSOLETE_KEY,
+    SYNONYM,
+    TermSnapshot,
+    open_snapshot,
+)
 
 Key = str  # namespace:id
 
-
-@cachetools.cached(cachetools.TTLCache(maxsize=512, ttl=600))
+# Per-process caches in front of the shared Redis cache tier (settings.REDIS_TERM_CACHE)
+terms_cache = RedisTieredCache(
+    maxsize=512,
+    ttl=600,
+    name="terms",
+    version=get_resources_version,
+    encode=lambda terms: [term.dict() for term in terms],
+    decode=lambda terms: [Term(**term) for term in terms],
+)
+equivalents_cache = RedisTieredCache(
+    maxsize=1024,
+    ttl=600,
+    name="equivalents",
+    version=get_resources_version,
+    negative=lambda equivalents: not equivalents["equivalents"] or "errors" in equivalents,
+)
+normalized_terms_cache = RedisTieredCache(
+    maxsize=5000,
+    ttl=3600,
+    name="normalized_terms",
+    version=get_resources_version,
+)
+# Term completions by (completions version, filters, completion text) - see get_cached_completions
+#   (requested size, search hits, (completion, autocomplete values) results, in search order)
+completions_cache = cachetools.LRUCache(maxsize=5000)
+completions_version_cache = cachetools.TTLCache(maxsize=1, ttl=60)
+
+# Term snapshots by (resources version, snapshot directory) - see get_term_snapshots
+term_snapshots_cache = cachetools.TTLCache(maxsize=4, ttl=60)
+
+term_key_labels_cache = RedisTieredCache(
+    maxsize=5000,
+    ttl=3600,
+    name="term_key_labels",
+    version=get_resources_version,
+    negative=lambda key_label: "!" not in key_label,
+)
+
+
+@singleflight.cached(terms_cache, name="terms")
 def get_terms(term_key: Key) -> List[Term]:
     """Get term(s) using term_key - given term_key may match multiple term records
 
@@ -48,34 +117,263 @@ def get_terms(term_key: Key) -> List[Term]:
         ]
 
     term_key = term_key.replace("'", "")  # Keys can't have single quotes in them-r
-    query = f"""
-        FOR term in {terms_coll_name}
-            FILTER term.key == '{term_key}'  OR '{term_key}' in term.alt_keys OR '{term_key}' in term.obsolete_keys
-            RETURN term
-    """
 
-    # logger.debug("Get terms query", query=query)
+    term_snapshots = get_term_snapshots()
 
-    results = list(resources_db.aql.execute(query))
+    if term_snapshots:
+        results = snapshot_terms(term_key, term_snapshots, (KEY, ALT_KEY, OBSOLETE_KEY))
+    else:
+        results = query_terms([term_key]).get(term_key, [])
 
     if len(results) == 0:
-        if namespace == "EG":
-            return []
-
-        try:
-            (namespace, label) = term_key.split(":", 1)
-        except Exception:
+        if namespace == "EG" or ":" not in term_key:
             return []  # no results - not a valid value
 
+        if term_snapshots:
+            results = snapshot_terms(term_key, term_snapshots, (SYNONYM,))
+        else:
+            results = query_synonym_terms([term_key]).get(term_key, [])
+
+    results = [Term(**term) for term in results]
+
+    return results
+
+
+@cachetools.cached(
+    term_snapshots_cache,
+    key=lambda: cachetools.keys.hashkey(get_resources_version(), settings.BEL_TERMS_SNAPSHOT_DIR),
+)
+def get_term_snapshots() -> Mapping[str, TermSnapshot]:
+    """Term snapshots of the complete namespaces (see bel.terms.snapshot)
+
+    Returns an empty mapping unless there is a snapshot of the loaded version of every complete
+    namespace - the term and equivalence lookups then use the snapshots instead of the database.
+    Cached by resources version - missing snapshots are checked again after the cache ttl.
+    """
+
+    if not settings.BEL_TERMS_SNAPSHOT_DIR:
+        return {}
+
+    term_snapshots = {}
+    for namespace, metadata in get_namespace_metadata().items():
+        if metadata.namespace_type != "complete":
+            continue
+
+        snapshot = open_snapshot(namespace, version=metadata.version)
+        if snapshot is None:
+            return {}
+
+        term_snapshots[namespace] = snapshot
+
+    return term_snapshots
+
+
+def snapshot_terms(
+    term_key: Key, term_snapshots: Mapping[str, TermSnapshot], lookup_types: Iterable[int]
+) -> List[Mapping[str, Any]]:
+    """Term records matching term_key by the lookup types in the term snapshots"""
+
+    return [
+        snapshot.record(record_idx)
+        for snapshot in term_snapshots.values()
+        for record_idx in snapshot.lookup(term_key, lookup_types)
+    ]
+
+
+def snapshot_equivalents(
+    term_key: Key, term_snapshots: Mapping[str, TermSnapshot]
+) -> List[Mapping[str, Any]]:
+    """Equivalents of the term key in the term snapshots - same as get_equivalents()
+
+    Breadth-first search (up to 5 steps) of the equivalences of the term records - primary
+    term keys are equivalent to their alt_keys and equivalence_keys.
+    """
+
+    def equivalent(key: Key) -> Mapping[str, Any]:
+        primary = None
+        neighbors = []
+        for snapshot in term_snapshots.values():
+            for record_idx, lookup_type in snapshot.lookup_entries(key):
+                term = snapshot.record(record_idx)
+                if lookup_type == KEY:
+                    primary = True
+                    neighbors.extend(term["alt_keys"] + term["equivalence_keys"])
+                elif lookup_type in (ALT_KEY, EQUIVALENCE):
+                    neighbors.append(term["key"])
+
+        return {"term_key": key, "namespace": key.split(":", 1)[0], "primary": primary}, neighbors
+
+    equivalents = []
+    visited = {term_key}
+    (_, keys) = equivalent(term_key)
+    for depth in range(5):
+        next_keys = []
+        for key in keys:
+            if key in visited:
+                continue
+            visited.add(key)
+
+            (doc, neighbors) = equivalent(key)
+            equivalents.append(doc)
+            next_keys.extend(neighbors)
+
+        keys = next_keys
+
+    return equivalents
+
+
+def use_term_aliases(term_key: Key) -> bool:
+    """Can the term_aliases collection be used to look up term_key?
+
+    The term aliases are loaded with the namespace terms (see
+    bel.resources.namespace.terms_iterator_for_arangodb) - namespaces loaded before need to be
+    reloaded to use them.
+    """
+
+    namespaces_metadata = get_namespace_metadata()
+
+    namespace = term_key.split(":", 1)[0]
+    if namespace in namespaces_metadata:
+        return namespaces_metadata[namespace].term_aliases
+
+    complete_namespaces = [
+        metadata
+        for metadata in namespaces_metadata.values()
+        if metadata.namespace_type == "complete"
+    ]
+
+    return bool(complete_namespaces) and all(
+        metadata.term_aliases for metadata in complete_namespaces
+    )
+
+
+def query_terms(
+    term_keys: Iterable[Key], aliases: Optional[bool] = None
+) -> Mapping[Key, List[Mapping[str, Any]]]:
+    """Query term records matching the term keys by key, alt_key or obsolete_key
+
+    Args:
+        term_keys: term keys without single quotes
+        aliases: use the term_aliases collection (indexed alias lookup) or match the terms
+            collection directly - defaults to use_term_aliases()
+
+    Returns:
+        Mapping[Key, List[Mapping[str, Any]]]: term records by term key
+    """
+
+    term_keys = list(dict.fromkeys(term_keys))
+    alias_keys = [
+        term_key
+        for term_key in term_keys
+        if aliases or (aliases is None and use_term_aliases(term_key))
+    ]
+    alias_key_set = set(alias_keys)
+    term_keys = [term_key for term_key in term_keys if term_key not in alias_key_set]
+
+    results = {}
+
+    if alias_keys:
         query = f"""
-        for doc in {terms_coll_name}
-            filter doc.namespace == "{namespace}"
-            filter '{label}' in doc.synonyms
-            return doc
+            FOR term_key IN @term_keys
+                LET terms = (
+                    FOR alias IN {term_aliases_name}
+                        FILTER alias.alias == term_key
+                        FILTER alias.type IN ["key", "alt_key", "obsolete_key"]
+                        COLLECT term_dbkey = alias.term_dbkey
+                        LET term = DOCUMENT("{terms_coll_name}", term_dbkey)
+                        FILTER term != null
+                        RETURN term
+                )
+                RETURN {{ "term_key": term_key, "terms": terms }}
         """
-        results = list(resources_db.aql.execute(query))
 
-    results = [Term(**term) for term in results]
+        for doc in resources_db.aql.execute(
+            query, bind_vars={"term_keys": alias_keys}, batch_size=1000
+        ):
+            results[doc["term_key"]] = doc["terms"]
+
+    if term_keys:
+        query = f"""
+            FOR term_key IN @term_keys
+                LET terms = (
+                    FOR term IN {terms_coll_name}
+                        FILTER term.key == term_key OR term_key IN term.alt_keys OR term_key IN term.obsolete_keys
+                        RETURN term
+                )
+                RETURN {{ "term_key": term_key, "terms": terms }}
+        """
+
+        for doc in resources_db.aql.execute(
+            query, bind_vars={"term_keys": term_keys}, batch_size=1000
+        ):
+            results[doc["term_key"]] = doc["terms"]
+
+    return results
+
+
+def query_synonym_terms(
+    term_keys: Iterable[Key], aliases: Optional[bool] = None
+) -> Mapping[Key, List[Mapping[str, Any]]]:
+    """Query term records with the label of term keys (namespace:label) as synonym
+
+    Args:
+        term_keys: term keys without single quotes
+        aliases: use the term_aliases collection (lowercased synonyms) or match the terms
+            collection directly - defaults to use_term_aliases()
+
+    Returns:
+        Mapping[Key, List[Mapping[str, Any]]]: term records by term key
+    """
+
+    alias_synonyms, synonyms = [], []
+    for term_key in dict.fromkeys(term_keys):
+        (namespace, label) = term_key.split(":", 1)
+        synonym = {"term_key": term_key, "namespace": namespace, "label": label}
+        if aliases or (aliases is None and use_term_aliases(term_key)):
+            synonym["alias"] = f"{namespace}:{label.lower()}"
+            alias_synonyms.append(synonym)
+        else:
+            synonyms.append(synonym)
+
+    results = {}
+
+    if alias_synonyms:
+        # Synonym matches stay case-sensitive
+        query = f"""
+            FOR synonym IN @synonyms
+                LET terms = (
+                    FOR alias IN {term_aliases_name}
+                        FILTER alias.alias == synonym.alias
+                        FILTER alias.type == "synonym"
+                        COLLECT term_dbkey = alias.term_dbkey
+                        LET term = DOCUMENT("{terms_coll_name}", term_dbkey)
+                        FILTER term != null AND synonym.label IN term.synonyms
+                        RETURN term
+                )
+                RETURN {{ "term_key": synonym.term_key, "terms": terms }}
+        """
+
+        for doc in resources_db.aql.execute(
+            query, bind_vars={"synonyms": alias_synonyms}, batch_size=1000
+        ):
+            results[doc["term_key"]] = doc["terms"]
+
+    if synonyms:
+        query = f"""
+            FOR synonym IN @synonyms
+                LET terms = (
+                    FOR doc IN {terms_coll_name}
+                        FILTER doc.namespace == synonym.namespace
+                        FILTER synonym.label IN doc.synonyms
+                        RETURN doc
+                )
+                RETURN {{ "term_key": synonym.term_key, "terms": terms }}
+        """
+
+        for doc in resources_db.aql.execute(
+            query, bind_vars={"synonyms": synonyms}, batch_size=1000
+        ):
+            results[doc["term_key"]] = doc["terms"]
 
     return results
 
@@ -113,7 +411,7 @@ def get_term(term_key: Key) -> Optional[Term]:
         return None
 
 
-@cachetools.cached(cachetools.TTLCache(maxsize=5000, ttl=3600))
+@singleflight.cached(term_key_labels_cache, name="term_key_labels")
 def get_term_key_label(term_key: Key) -> str:
     """Get term key_label"""
 
@@ -145,20 +443,13 @@ def get_equivalents(term_key: str) -> Mapping[str, List[Mapping[str, Any]]]:
         else:
             term_dbkey = None
 
-        if term_dbkey:
-            query = f"""
-            FOR vertex, edge IN 1..5
-                ANY 'equivalence_nodes/{term_dbkey}' equivalence_edges
-                OPTIONS {{bfs: true, uniqueVertices : 'global'}}
-                RETURN DISTINCT {{
-                    term_key: vertex.key,
-                    namespace: vertex.namespace,
-                    primary: vertex.primary
-                }}
-            """
-
-            docs = list(resources_db.aql.execute(query))
-            return {"equivalents": docs}
+        term_snapshots = get_term_snapshots()
+
+        if term and term_snapshots:
+            return {"equivalents": snapshot_equivalents(term.key, term_snapshots)}
+
+        elif term_dbkey:
+            return query_equivalents([term.key])[term.key]
         else:
             return {"equivalents": [], "errors": [f"Unexpected error"]}
 
@@ -167,25 +458,290 @@ def get_equivalents(term_key: str) -> Mapping[str, List[Mapping[str, Any]]]:
         return {"equivalents": [], "errors": [f"Unexpected error {e}"]}
 
 
-@cachetools.cached(cachetools.TTLCache(maxsize=1024, ttl=600))
+def query_equivalents(term_keys: Iterable[Key]) -> Mapping[Key, Mapping[str, Any]]:
+    """Query equivalents of (primary) term keys
+
+    Uses the equivalence clusters (see bel.resources.equivalence) - the results then also have
+    the primary term keys of the cluster by namespace. Falls back to a traversal of the
+    equivalence graph for equivalence nodes without an equivalence cluster (loaded before the
+    equivalence clusters).
+
+    Returns:
+        Mapping[Key, Mapping[str, Any]]: {"equivalents": [...], "primary_keys": {...}} by term key
+    """
+
+    term_dbkeys = {arango_id_to_key(term_key): term_key for term_key in term_keys}
+
+    query = f"""
+        FOR term_dbkey IN @term_dbkeys
+            LET node = DOCUMENT("{equiv_nodes_name}", term_dbkey)
+            LET cluster = node.cluster_id ? DOCUMENT("{equiv_clusters_name}", node.cluster_id) : null
+            RETURN {{
+                "term_dbkey": term_dbkey,
+                "cluster_id": node.cluster_id,
+                "members": cluster.members,
+                "primary_keys": cluster.primary_keys
+            }}
+    """
+
+    results = {}
+    traverse_dbkeys = []
+    bind_vars = {"term_dbkeys": list(term_dbkeys)}
+    for doc in resources_db.aql.execute(query, bind_vars=bind_vars, batch_size=1000):
+        term_key = term_dbkeys[doc["term_dbkey"]]
+        if doc["cluster_id"] == "":  # no equivalences
+            results[term_key] = {"equivalents": [], "primary_keys": {}}
+        elif doc["members"] is not None:
+            results[term_key] = {
+                "equivalents": [
+                    member for member in doc["members"] if member["term_key"] != term_key
+                ],
+                "primary_keys": doc["primary_keys"],
+            }
+        else:
+            traverse_dbkeys.append(doc["term_dbkey"])
+
+    if not traverse_dbkeys:
+        return results
+
+    query = f"""
+        FOR term_dbkey IN @term_dbkeys
+            LET equivalents = (
+                FOR vertex, edge IN 1..5
+                    ANY CONCAT('{equiv_nodes_name}/', term_dbkey) {equiv_edges_name}
+                    OPTIONS {{bfs: true, uniqueVertices : 'global'}}
+                    RETURN DISTINCT {{
+                        term_key: vertex.key,
+                        namespace: vertex.namespace,
+                        primary: vertex.primary
+                    }}
+            )
+            RETURN {{ "term_dbkey": term_dbkey, "equivalents": equivalents }}
+    """
+
+    bind_vars = {"term_dbkeys": traverse_dbkeys}
+    for doc in resources_db.aql.execute(query, bind_vars=bind_vars, batch_size=1000):
+        results[term_dbkeys[doc["term_dbkey"]]] = {"equivalents": doc["equivalents"]}
+
+    return results
+
+
+@singleflight.cached(equivalents_cache, name="equivalents")
 def get_cached_equivalents(term_key: Key) -> Mapping[str, List[Mapping[str, Any]]]:
 
     return get_equivalents(term_key)
 
 
+def prefetch_terms(term_keys: Iterable[Key]) -> Mapping[Key, List[Term]]:
+    """Get terms for many term keys in bulk
+
+    Same results as get_terms() for each term key but in bulk queries - for the keys, alt_keys
+    and obsolete_keys and for the synonyms of the term keys not found (see query_terms and
+    query_synonym_terms). The results are added to the get_terms() cache.
+
+    Returns:
+        Mapping[Key, List[Term]]: terms by given term_key
+    """
+
+    if get_term_snapshots():
+        return {term_key: get_terms(term_key) for term_key in term_keys}  # no queries
+
+    namespaces_metadata = get_namespace_metadata()
+
+    term_keys = list(dict.fromkeys(term_keys))
+    cached = terms_cache.get_many([cachetools.keys.hashkey(term_key) for term_key in term_keys])
+
+    results = {}
+    query_keys = {}  # term_key -> term key without single quotes as in get_terms()
+    for term_key in term_keys:
+        terms = cached.get(cachetools.keys.hashkey(term_key))
+        if terms is not None:
+            results[term_key] = terms
+            continue
+
+        namespace = term_key.split(":", 1)[0]
+        if (
+            namespace in namespaces_metadata
+            and namespaces_metadata[namespace].namespace_type != "complete"
+        ):
+            results[term_key] = get_terms(term_key)  # virtual namespace term - no query
+        else:
+            query_keys[term_key] = term_key.replace("'", "")
+
+    if not query_keys:
+        return results
+
+    found = query_terms(set(query_keys.values()))
+
+    # Synonym matches for term keys without a key, alt_key or obsolete_key match
+    synonym_keys = [
+        term_key
+        for term_key in set(query_keys.values())
+        if not found.get(term_key) and not term_key.startswith("EG:") and ":" in term_key
+    ]
+    if synonym_keys:
+        found.update(query_synonym_terms(synonym_keys))
+
+    for term_key, query_key in query_keys.items():
+        results[term_key] = [Term(**term) for term in found.get(query_key, [])]
+
+    terms_cache.set_many(
+        {cachetools.keys.hashkey(term_key): results[term_key] for term_key in query_keys}
+    )
+
+    return results
+
+
+def prefetch_equivalents(term_keys: Iterable[Key]) -> Mapping[Key, Mapping[str, Any]]:
+    """Get equivalents for many term keys in bulk
+
+    Same results as get_cached_equivalents() for each term key but in bulk queries (see
+    query_equivalents) after prefetching the terms. The results are added to the
+    get_cached_equivalents() cache.
+
+    Returns:
+        Mapping[Key, Mapping[str, Any]]: equivalents by given term_key
+    """
+
+    term_keys = list(dict.fromkeys(term_keys))
+    prefetch_terms(term_keys)
+
+    if get_term_snapshots():
+        return {term_key: get_cached_equivalents(term_key) for term_key in term_keys}
+
+    cached = equivalents_cache.get_many(
+        [cachetools.keys.hashkey(term_key) for term_key in term_keys]
+    )
+
+    results = {}
+    primary_keys = {}  # term key -> primary term key
+    for term_key in term_keys:
+        equivalents = cached.get(cachetools.keys.hashkey(term_key))
+        if equivalents is not None:
+            results[term_key] = equivalents
+            continue
+
+        term = get_term(term_key)  # selects the term from the prefetched terms
+        if term:
+            primary_keys[term_key] = term.key
+        else:
+            results[term_key] = {"equivalents": [], "errors": [f"Unexpected error"]}
+            equivalents_cache[cachetools.keys.hashkey(term_key)] = results[term_key]
+
+    if not primary_keys:
+        return results
+
+    try:
+        docs = query_equivalents(set(primary_keys.values()))
+    except Exception as e:
+        logger.exception(f"Problem getting term equivalents for {list(primary_keys)} msg: {e}")
+        for term_key in primary_keys:
+            results[term_key] = {"equivalents": [], "errors": [f"Unexpected error {e}"]}
+        return results
+
+    for term_key, primary_key in primary_keys.items():
+        results[term_key] = docs.get(primary_key, {"equivalents": []})
+
+    equivalents_cache.set_many(
+        {cachetools.keys.hashkey(term_key): results[term_key] for term_key in primary_keys}
+    )
+
+    return results
+
+
+def use_normalized_terms(term_key: Key) -> bool:
+    """Can the normalized_terms collection be used to normalize term_key?
+
+    Term snapshots are used instead if available (no database queries). The normalized terms
+    are looked up by the term aliases (see use_term_aliases) of complete namespaces.
+    """
+
+    if get_term_snapshots():
+        return False
+
+    namespace = term_key.split(":", 1)[0]
+    metadata = get_namespace_metadata().get(namespace)
+
+    return metadata is not None and metadata.namespace_type == "complete" and metadata.term_aliases
+
+
+def query_normalized_terms(
+    term_keys: Iterable[Key], normalized_targets_hash: str
+) -> Mapping[Key, Mapping[str, Any]]:
+    """Query normalized terms (see bel.resources.normalization) of term keys
+
+    Term keys matching more than one term by key, alt_key or obsolete_key or only matching by
+    synonym are skipped - they need get_term() to pick the term.
+
+    Args:
+        term_keys: term keys
+        normalized_targets_hash: hash of the canonicalization targets (see
+            bel.resources.normalization.targets_hash)
+
+    Returns:
+        Mapping[Key, Mapping[str, Any]]: get_normalized_terms() results by term key
+    """
+
+    query_keys = {term_key.replace("'", ""): term_key for term_key in term_keys}
+
+    query = f"""
+        FOR term_key IN @term_keys
+            LET term_dbkeys = (
+                FOR alias IN {term_aliases_name}
+                    FILTER alias.alias == term_key
+                    FILTER alias.type IN ["key", "alt_key", "obsolete_key"]
+                    RETURN DISTINCT alias.term_dbkey
+            )
+            FILTER LENGTH(term_dbkeys) == 1
+            LET doc = DOCUMENT("{normalized_terms_name}", term_dbkeys[0])
+            FILTER doc != null AND doc.targets_hash == @targets_hash
+            RETURN {{
+                "term_key": term_key,
+                "normalized": doc.normalized,
+                "canonical": doc.canonical,
+                "decanonical": doc.decanonical,
+                "label": doc.label,
+                "entity_types": doc.entity_types,
+                "annotation_types": doc.annotation_types
+            }}
+    """
+
+    bind_vars = {"term_keys": list(query_keys), "targets_hash": normalized_targets_hash}
+
+    results = {}
+    for doc in resources_db.aql.execute(query, bind_vars=bind_vars, batch_size=1000):
+        term_key = query_keys[doc.pop("term_key")]
+        results[term_key] = {"original": term_key, **doc}
+
+    return results
+
+
+@singleflight.cached(normalized_terms_cache, name="normalized_terms")
+def get_cached_normalized_term(term_key: Key, normalized_targets_hash: str) -> Mapping[str, Any]:
+    """Normalized term of term_key - empty if there is none"""
+
+    return query_normalized_terms([term_key], normalized_targets_hash).get(term_key, {})
+
+
 def get_normalized_terms(
     term_key: Key,
     canonical_targets: Mapping[str, List[str]] = settings.BEL_CANONICALIZE,
     decanonical_targets: Mapping[str, List[str]] = settings.BEL_DECANONICALIZE,
     term: Optional[Term] = None,
+    equivalents: Optional[Mapping[str, Any]] = None,
+    materialized: bool = True,
 ) -> Mapping[str, str]:
     """Get canonical and decanonical form for term
 
-    This is effectively cached as the get_term and get_cached_equivalents calls
+    Uses the materialized normalized terms (see bel.resources.normalization) if available,
+    else this is effectively cached as the get_term and get_cached_equivalents calls
     are cached.
 
     Inputs:
         term_key: <Namespace>:<ID>
+        term: term for term_key if already retrieved
+        equivalents: equivalents for term_key if already retrieved - see prefetch_equivalents
+        materialized: use the materialized normalized terms if available
 
     Returns: {"canonical": <>, "decanonical": <>, "original": <>}
     """
@@ -197,6 +753,13 @@ def get_normalized_terms(
     #     1. Sort each namespace and take first term_key
     #
 
+    if materialized and term is None and equivalents is None and use_normalized_terms(term_key):
+        normalized = get_cached_normalized_term(
+            term_key, targets_hash(canonical_targets, decanonical_targets)
+        )
+        if normalized:
+            return normalized
+
     # Normalized term is the official term - e.g. HGNC:207 (normalized) vs HGNC:AKT1 (original but not normalized)
     normalized_term_key = term_key
     if not term:
@@ -238,30 +801,102 @@ def get_normalized_terms(
         logger.error(f"Term key is missing namespace {term_key}")
         return normalized
 
-    if ns in canonical_targets or ns in decanonical_targets:
+    if (ns in canonical_targets or ns in decanonical_targets) and equivalents is None:
         equivalents = get_cached_equivalents(term_key)
 
-    for target_ns in canonical_targets.get(ns, []):
-        for equivalent in equivalents["equivalents"]:
-            if equivalent["primary"] and target_ns == equivalent["namespace"]:
-                normalized["canonical"] = equivalent["term_key"]
-                break
-        else:  # If break in inner loop, break outer loop
-            continue
-        break
-
-    for target_ns in decanonical_targets.get(ns, []):
-        for equivalent in equivalents["equivalents"]:
-            if equivalent["primary"] and target_ns == equivalent["namespace"]:
-                normalized["decanonical"] = equivalent["term_key"]
-                break
-        else:  # If break in inner loop, break outer loop
-            continue
-        break
+    canonical_key = primary_equivalent(
+        equivalents, canonical_targets.get(ns, []), normalized["normalized"]
+    )
+    if canonical_key:
+        normalized["canonical"] = canonical_key
+
+    decanonical_key = primary_equivalent(
+        equivalents, decanonical_targets.get(ns, []), normalized["normalized"]
+    )
+    if decanonical_key:
+        normalized["decanonical"] = decanonical_key
 
     return normalized
 
 
+def get_terms_many(term_keys: Iterable[Key]) -> Mapping[Key, List[Term]]:
+    """Get terms for many term keys - see get_terms()
+
+    Resolves the term keys in bulk (see prefetch_terms) and adds them to the get_terms() cache.
+
+    Returns:
+        Mapping[Key, List[Term]]: terms by term_key in the order given
+    """
+
+    term_keys = list(dict.fromkeys(term_keys))
+    terms = prefetch_terms(term_keys)
+
+    return {term_key: terms[term_key] for term_key in term_keys}
+
+
+def get_normalized_terms_many(
+    term_keys: Iterable[Key],
+    canonical_targets: Mapping[str, List[str]] = settings.BEL_CANONICALIZE,
+    decanonical_targets: Mapping[str, List[str]] = settings.BEL_DECANONICALIZE,
+) -> Mapping[Key, Mapping[str, str]]:
+    """Get canonical and decanonical forms for many term keys - see get_normalized_terms()
+
+    The terms and equivalents are resolved in bulk (see prefetch_terms and
+    prefetch_equivalents) and added to the get_terms() and get_cached_equivalents() caches.
+
+    Returns:
+        Mapping[Key, Mapping[str, str]]: get_normalized_terms() results by term_key in the
+            order given
+    """
+
+    term_keys = list(dict.fromkeys(term_keys))
+
+    # Materialized normalized terms - one query for the normalized_terms_cache misses
+    normalized_targets_hash = targets_hash(canonical_targets, decanonical_targets)
+    cache_keys = {
+        term_key: cachetools.keys.hashkey(term_key, normalized_targets_hash)
+        for term_key in term_keys
+        if use_normalized_terms(term_key)
+    }
+    cached = normalized_terms_cache.get_many(cache_keys.values())
+    results = {
+        term_key: cached[cache_key]
+        for term_key, cache_key in cache_keys.items()
+        if cached.get(cache_key)
+    }
+
+    query_keys = [term_key for term_key, cache_key in cache_keys.items() if cache_key not in cached]
+    if query_keys:
+        normalized = query_normalized_terms(query_keys, normalized_targets_hash)
+        results.update(normalized)
+        normalized_terms_cache.set_many(
+            {cache_keys[term_key]: normalized.get(term_key, {}) for term_key in query_keys}
+        )
+
+    missing_keys = [term_key for term_key in term_keys if term_key not in results]
+
+    prefetch_terms(missing_keys)
+    equivalents = prefetch_equivalents(
+        [
+            term_key
+            for term_key in missing_keys
+            if term_key.split(":", 1)[0] in canonical_targets
+            or term_key.split(":", 1)[0] in decanonical_targets
+        ]
+    )
+
+    for term_key in missing_keys:
+        results[term_key] = get_normalized_terms(
+            term_key,
+            canonical_targets=canonical_targets,
+            decanonical_targets=decanonical_targets,
+            equivalents=equivalents.get(term_key),
+            materialized=False,
+        )
+
+    return {term_key: results[term_key] for term_key in term_keys}
+
+
 @asyncify
 def async_get_normalized_terms(
     term_key: Key,
@@ -273,6 +908,28 @@ def async_get_normalized_terms(
     return get_normalized_terms(term_key, canonical_targets, decanonical_targets, term)
 
 
+def get_completion_indexes() -> Mapping[str, CompletionIndex]:
+    """Term completion indexes of the complete namespaces (see bel.terms.completions)
+
+    Returns an empty mapping unless there is a term snapshot and a completion index of the loaded
+    version of every complete namespace - the completions then use Elasticsearch.
+    """
+
+    term_snapshots = get_term_snapshots()
+    if not term_snapshots:
+        return {}
+
+    completion_indexes = {}
+    for namespace, snapshot in term_snapshots.items():
+        completion_index = open_completion_index(namespace, version=snapshot.version)
+        if completion_index is None:
+            return {}
+
+        completion_indexes[namespace] = completion_index
+
+    return completion_indexes
+
+
 def get_term_completions(
     completion_text: str,
     size: int = 10,
@@ -283,6 +940,9 @@ def get_term_completions(
 ):
     """Get Term completions filtered by additional requirements
 
+    Uses the local term completion indexes if settings.BEL_TERM_COMPLETIONS is "local" (see
+    bel.terms.completions), else Elasticsearch.
+
     Args:
         completion_text: text to complete to location NSArgs
         size: how many terms to return
@@ -295,6 +955,130 @@ def get_term_completions(
         list of NSArgs
     """
 
+    request = {
+        "completion_text": completion_text,
+        "size": size,
+        "entity_types": entity_types,
+        "annotation_types": annotation_types,
+        "species_keys": species_keys,
+        "namespaces": namespaces,
+    }
+
+    return get_term_completions_many([request])[0]
+
+
+def get_term_completions_many(requests: Iterable[Mapping[str, Any]]) -> List[List[dict]]:
+    """Get Term completions for many completion requests
+
+    The completions not cached (see get_cached_completions) are searched in one Elasticsearch
+    multi-search request.
+
+    Args:
+        requests: get_term_completions() arguments (completion_text, size, entity_types,
+            annotation_types, species_keys, namespaces) of each completion request
+
+    Returns:
+        List[List[dict]]: get_term_completions() results in the order of the requests
+    """
+
+    requests = list(requests)
+    results = [None] * len(requests)
+
+    completion_indexes = {}
+    if settings.BEL_TERM_COMPLETIONS == "local":
+        completion_indexes = get_completion_indexes()
+
+    searches = []  # (request index, completion text, size, completion filters, search body)
+    for idx, request in enumerate(requests):
+        size = request.get("size", 10)
+        (completion_text, completion_filters, filters) = completion_search_filters(
+            request["completion_text"],
+            entity_types=request.get("entity_types"),
+            annotation_types=request.get("annotation_types"),
+            species_keys=request.get("species_keys"),
+            namespaces=request.get("namespaces"),
+        )
+
+        completions = get_cached_completions(completion_text, size, completion_filters)
+        if completions is not None:
+            results[idx] = completions
+
+        elif completion_indexes:
+            (entity_types, annotation_types, species_keys, namespaces) = [
+                list(values) for values in completion_filters
+            ]
+            completion_tokens = tokenize(completion_text)
+
+            completions = [
+                (term_completion(term, completion_tokens), autocomplete_values(term))
+                for term in search_terms(
+                    completion_text,
+                    size,
+                    get_term_snapshots(),
+                    completion_indexes,
+                    entity_types=entity_types,
+                    annotation_types=annotation_types,
+                    species_keys=species_keys,
+                    namespaces=namespaces,
+                )
+            ]
+
+            cache_completions(completion_text, size, completion_filters, completions)
+            results[idx] = [completion for (completion, values) in completions]
+
+        else:
+            search_body = completion_search_body(completion_text, size, filters)
+            searches.append((idx, completion_text, size, completion_filters, search_body))
+
+    if not searches:
+        return results
+
+    body = []
+    for (idx, completion_text, size, completion_filters, search_body) in searches:
+        body.append({"index": settings.TERMS_INDEX, "type": settings.TERMS_DOCUMENT_TYPE})
+        body.append(search_body)
+
+    responses = es.msearch(body=body)["responses"]
+
+    for (idx, completion_text, size, completion_filters, search_body), response in zip(
+        searches, responses
+    ):
+        if "error" in response:
+            logger.error(
+                f"Problem getting term completions for {completion_text} - error: {response['error']}"
+            )
+            results[idx] = []
+            continue
+
+        completions = search_completions(response)
+
+        cache_completions(
+            completion_text,
+            size,
+            completion_filters,
+            completions,
+            hits=len(response["hits"]["hits"]),
+        )
+        results[idx] = [completion for (completion, values) in completions]
+
+    return results
+
+
+def completion_search_filters(
+    completion_text: str,
+    entity_types: List[str] = None,
+    annotation_types: List[str] = None,
+    species_keys: List[Key] = None,
+    namespaces: List[str] = None,
+) -> Tuple[str, Tuple, List[dict]]:
+    """Completion text and filters of a term completion request
+
+    Returns:
+        Tuple[str, Tuple, List[dict]]: completion text without the namespace prefix, the
+            filters as applied to the completions (completions cache key) and the Elasticsearch
+            query filters
+    """
+
     if entity_types is None or entity_types == [None]:
         entity_types = []
     if annotation_types is None or annotation_types == [None]:
@@ -360,6 +1144,21 @@ def get_term_completions(
 
     # logger.debug(f"Term Filters {filters}")
 
+    # Completion cache key - the filters as applied to the completions
+    completion_filters = (
+        tuple(sorted(entity_types)),
+        tuple(
+            sorted([annotation_types] if isinstance(annotation_types, str) else annotation_types)
+        ),
+        tuple(sorted(species_keys if grp or (not entity_types and not annotation_types) else [])),
+        tuple(sorted([namespaces] if isinstance(namespaces, str) else namespaces)),
+    )
+    return (completion_text, completion_filters, filters)
+
+
+def completion_search_body(completion_text: str, size: int, filters: List[dict]) -> dict:
+    """Elasticsearch term completion query"""
+
     search_body = {
         "_source": [
             "key",
@@ -373,6 +1172,8 @@ def get_term_completions(
             "entity_types",
             "annotation_types",
             "synonyms",
+            "alt_keys",
+            "obsolete_keys",
         ],
         "size": size,
         "query": {
@@ -409,14 +1210,15 @@ def get_term_completions(
         boost_namespaces = {"terms": {"namespace": settings.BEL_BOOST_NAMESPACES, "boost": 6}}
         search_body["query"]["bool"]["should"].append(boost_namespaces)
 
-    results = es.search(
-        index=settings.TERMS_INDEX, doc_type=settings.TERMS_DOCUMENT_TYPE, body=search_body
-    )
+    return search_body
+
 
-    # print("search_body", search_body)
+def search_completions(results: dict) -> List[Tuple[dict, List[str]]]:
+    """Term completions and their autocomplete values from the Elasticsearch search results"""
 
     # highlight matches
     completions = []
+    results_values = []
 
     for result in results["hits"]["hits"]:
         species_key = result["_source"].get("species_key", None)
@@ -456,8 +1258,134 @@ def get_term_completions(
                     "sort_tuple": (startswith_sort, sort_len),
                 }
             )
+            results_values.append(autocomplete_values(result["_source"]))
+
+    return list(zip(completions, results_values))
+
+
+def get_completions_version() -> str:
+    """Version of the completion backend terms - the terms index alias indexes or the loaded
+    namespace versions for the local completion indexes
+    """
+
+    if settings.BEL_TERM_COMPLETIONS == "local" and get_completion_indexes():
+        return get_resources_version()
+
+    return ",".join(get_terms_index_names())
+
+
+@singleflight.cached(completions_version_cache, name="completions_version")
+def get_terms_index_names() -> List[str]:
+    """Elasticsearch indexes of the terms index alias"""
+
+    try:
+        return get_alias_index_names(settings.TERMS_INDEX)
+    except Exception as e:
+        logger.warning(f"Could not get the {settings.TERMS_INDEX} index alias - error: {e}")
+        return []
+
+
+def get_cached_completions(
+    completion_text: str, size: int, completion_filters: Tuple
+) -> Optional[List[Mapping[str, Any]]]:
+    """Term completions from the completions cache
+
+    Completions of a shorter prefix of the completion text (typed before) answer the completion
+    text if they are complete (fewer search hits than the requested size) - the completion text
+    matches a subset of those terms if it only extends the last completion token. The subset is
+    in the search order of the shorter prefix so it is only used if it is not cut to size.
+
+    Returns:
+        Optional[List[Mapping[str, Any]]]: None if the completions are not cached
+    """
+
+    version = get_completions_version()
+    completion_tokens = tokenize(completion_text)
+
+    for idx in range(len(completion_text), 0, -1):
+        prefix = completion_text[:idx]
+        cached = completions_cache.get((version, completion_filters, prefix))
+        if cached is None:
+            continue
+
+        (cached_size, hits, results, ranked) = cached
+        complete = hits < cached_size
+
+        if prefix == completion_text:
+            if not ranked and len(results) > size:
+                return None
+            if complete or cached_size >= size:
+                return [completion for (completion, values) in results[:size]]
+            continue
+
+        if not complete:
+            continue
+
+        prefix_tokens = tokenize(prefix)
+        if (
+            not completion_tokens
+            or len(prefix_tokens) != len(completion_tokens)
+            or prefix_tokens[:-1] != completion_tokens[:-1]
+            or not completion_tokens[-1].startswith(prefix_tokens[-1])
+        ):
+            continue
+
+        # Narrow the completions of the prefix to the completion text
+        narrowed = []
+        for (completion, values) in results:
+            (matches, sort_tuple) = highlight_matches(values, completion_tokens)
+            if not any(
+                token.startswith(completion_token)
+                for value in values
+                for token in tokenize(value)
+                for completion_token in completion_tokens
+                if len(completion_token) <= max_gram
+            ):
+                continue
+
+            narrowed.append(
+                ({**completion, "highlight": matches, "sort_tuple": sort_tuple}, values)
+            )
+
+        # Completions of the shorter prefixes are supersets - cut to size in the wrong order
+        if len(narrowed) > size:
+            return None
+
+        completions_cache[(version, completion_filters, completion_text)] = (
+            cached_size,
+            len(narrowed),
+            narrowed,
+            False,
+        )
+
+        return [completion for (completion, values) in narrowed]
+
+    return None
 
-    return completions
+
+def cache_completions(
+    completion_text: str,
+    size: int,
+    completion_filters: Tuple,
+    results: List[Tuple[Mapping[str, Any], List[str]]],
+    hits: int = None,
+):
+    """Add term completions with their autocomplete values to the completions cache
+
+    Args:
+        hits: number of search hits if more than the results (hits without a term key)
+    """
+
+    if hits is None:
+        hits = len(results)
+
+    version = get_completions_version()
+    completions_cache[(version, completion_filters, completion_text)] = (
+        size,
+        hits,
+        results,
+        True,
+    )
 
 
 ##################################################################################################
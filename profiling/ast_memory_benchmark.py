@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""Benchmark BEL AST node memory
+
+Builds ASTs for long complex() and composite() assertions and checks the size of every AST
+node against bel.lang.ast.node_memory_budget (node object and its own args/siblings lists,
+excluding argument references). Also reports the memory retained per node by the ASTs
+(tracemalloc) including the parse info, spans and BEL Entities - with --intern the ASTs share
+their structurally identical subtrees (BELAst(intern=True)).
+
+Before __slots__ nodes the mean node sizes were Function 380, NSArg 256, StrArg 256 and
+Relation 352 bytes (Python 3.11).
+
+Usage: python profiling/ast_memory_benchmark.py [--members 10 50 200] [--asts 20] [--intern]
+"""
+
+# Standard Library
+import argparse
+import gc
+import sys
+import tracemalloc
+from collections import defaultdict
+
+# Local
+from bel.lang.ast import BELAst, node_memory_budget
+from bel.lang.parse import clear_parse_info_cache
+from bel.schemas.bel import AssertionStr
+from parse_benchmark import long_assertion
+
+
+def node_size(node) -> int:
+    """Size of node object and its own lists without the argument references"""
+
+    size = sys.getsizeof(node)
+    if hasattr(node, "__dict__"):
+        size += sys.getsizeof(node.__dict__)
+    if hasattr(node, "args"):
+        size += sys.getsizeof([])
+    if hasattr(node, "siblings"):
+        size += sys.getsizeof(node.siblings)
+
+    return size
+
+
+def ast_nodes(ast: BELAst) -> list:
+    """All Relation, Function and argument nodes of AST"""
+
+    nodes = []
+    stack = list(ast.args)
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        if node.type == "BELAst":
+            stack.extend(node.args)
+            continue
+
+        nodes.append(node)
+        if node.type == "Function":
+            stack.extend(node.args)
+
+    return nodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--asts", type=int, default=20)
+    parser.add_argument("--intern", action="store_true")
+    args = parser.parse_args()
+
+    over_budget = False
+
+    print(f"{'members':>8} {'nodes':>8} {'type':>10} {'mean':>8} {'max':>8} {'budget':>8}")
+    for members in args.members:
+        assertion_str = long_assertion(members)
+        BELAst(assertion=AssertionStr(entire=assertion_str))  # Warm up BEL Specification caches
+
+        clear_parse_info_cache()
+        gc.collect()
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+
+        # Different Assertion strings so that the ASTs don't share cached parse info
+        asts = [
+            BELAst(assertion=AssertionStr(entire=assertion_str + " " * idx), intern=args.intern)
+            for idx in range(args.asts)
+        ]
+
+        clear_parse_info_cache()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - start
+        tracemalloc.stop()
+
+        sizes = defaultdict(list)
+        for ast in asts:
+            for node in ast_nodes(ast):
+                sizes[node.type].append(node_size(node))
+
+        nodes = sum(len(node_sizes) for node_sizes in sizes.values())
+        for node_type, node_sizes in sorted(sizes.items()):
+            budget = node_memory_budget[node_type]
+            mean = sum(node_sizes) / len(node_sizes)
+            over_budget = over_budget or max(node_sizes) > budget
+            print(
+                f"{members:>8} {len(node_sizes):>8} {node_type:>10} {mean:>8.0f} "
+                f"{max(node_sizes):>8} {budget:>8}"
+            )
+
+        print(f"{members:>8} {nodes:>8} {'retained':>10} {retained / nodes:>8.0f} (bytes/node)")
+
+    if over_budget:
+        print("AST nodes over memory budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
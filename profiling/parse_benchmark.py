@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Benchmark BEL Assertion parser backends
+
+Times bel.lang.parse.parse_info for the lexer and regex backends and the strict grammar
+parser on long complex() and composite() assertions with increasing numbers of quoted members.
+
+Usage: python profiling/parse_benchmark.py [--members 10 50 200] [--repeat 5]
+"""
+
+# Standard Library
+import argparse
+import timeit
+
+# Local
+from bel.lang.parse import parse_info
+from bel.lang.strict import strict_info
+
+
+def long_assertion(members: int) -> str:
+    """Build complex() subject and composite() object with members quoted NSArgs each"""
+
+    complex_args = ", ".join(
+        f'p(HGNC:"{idx}"!"protein {idx}", pmod(Ph, S, {idx}))' for idx in range(members)
+    )
+    composite_args = ", ".join(
+        f'a(CHEBI:"{idx}"!"chemical {idx}", loc(GO:"cell surface"))' for idx in range(members)
+    )
+
+    return f"complex({complex_args}) increases composite({composite_args})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--version", default="latest")
+    args = parser.parse_args()
+
+    print(
+        f"{'members':>8} {'length':>8} {'regex (ms)':>12} {'lexer (ms)':>12} {'speedup':>8} "
+        f"{'strict (ms)':>12}"
+    )
+    for members in args.members:
+        assertion_str = long_assertion(members)
+
+        # Warm up BEL Specification caches
+        parse_info(assertion_str, version=args.version, parser="regex")
+        parse_info(assertion_str, version=args.version, parser="lexer")
+
+        timings = {}
+        for backend in ["regex", "lexer"]:
+            timings[backend] = (
+                min(
+                    timeit.repeat(
+                        lambda: parse_info(assertion_str, version=args.version, parser=backend),
+                        number=1,
+                        repeat=args.repeat,
+                    )
+                )
+                * 1000
+            )
+
+        timings["strict"] = (
+            min(
+                timeit.repeat(
+                    lambda: strict_info(assertion_str, version=args.version),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            * 1000
+        )
+
+        print(
+            f"{members:>8} {len(assertion_str):>8} {timings['regex']:>12.2f} "
+            f"{timings['lexer']:>12.2f} {timings['regex'] / timings['lexer']:>7.1f}x "
+            f"{timings['strict']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
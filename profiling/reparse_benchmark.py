@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""Benchmark incremental re-parsing of BEL Assertions
+
+Times building a BELAst from scratch against bel.lang.incremental.reparse for a single
+character edit inside one complex() member of long complex() and composite() assertions.
+
+Usage: python profiling/reparse_benchmark.py [--members 10 50 200] [--repeat 5]
+"""
+
+# Standard Library
+import argparse
+import timeit
+
+# Local
+from bel.lang.ast import BELAst
+from bel.lang.incremental import reparse
+from bel.lang.parse import clear_parse_info_cache
+from bel.schemas.bel import AssertionStr
+from parse_benchmark import long_assertion
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'members':>8} {'length':>8} {'parse (ms)':>12} {'reparse (ms)':>12} {'speedup':>8}")
+    for members in args.members:
+        assertion_str = long_assertion(members)
+
+        # Append a digit to the modification position of the middle complex() member
+        offset = assertion_str.index(f"S, {members // 2})") + 3
+
+        def parse():
+            clear_parse_info_cache()  # edited Assertions aren't in the parse info cache
+            return BELAst(assertion=AssertionStr(entire=assertion_str))
+
+        def edit():
+            ast = parse()  # reparse moves the prior AST nodes into the new AST
+            start = timeit.default_timer()
+            reparse(ast, offset, 0, "5")
+            return timeit.default_timer() - start
+
+        parse()  # Warm up BEL Specification and term caches
+
+        parse_ms = min(timeit.repeat(parse, number=1, repeat=args.repeat)) * 1000
+        reparse_ms = min(edit() for _ in range(args.repeat)) * 1000
+
+        print(
+            f"{members:>8} {len(assertion_str):>8} {parse_ms:>12.2f} {reparse_ms:>12.2f} "
+            f"{parse_ms / reparse_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""Benchmark term lookups by key, alt_key, obsolete_key and synonym
+
+Samples term keys, alt_keys, obsolete_keys and synonyms from the terms collection of the
+resources database and times looking them up one at a time (as get_terms) and in bulk (as
+prefetch_terms) with the indexed term_aliases collection and directly against the terms
+collection (bel.terms.terms.query_terms and query_synonym_terms).
+
+The direct lookups filter on term.alt_keys/term.obsolete_keys/term.synonyms arrays and scan
+the terms collection - expect them to grow with the number of terms loaded (e.g. ~20M terms
+for the full set of BEL namespaces) while the term_aliases lookups stay flat. The namespaces
+need to be (re)loaded to populate the term_aliases collection.
+
+Usage: python profiling/term_lookup_benchmark.py [--sample 200] [--bulk 1000]
+"""
+
+# Standard Library
+import argparse
+import statistics
+import time
+
+# Local
+from bel.db.arangodb import resources_db, terms_coll_name
+from bel.terms.terms import query_synonym_terms, query_terms
+
+
+def sample_term_keys(sample: int) -> dict:
+    """Sample term keys by lookup type (key, alt_key, obsolete_key, synonym)"""
+
+    query = f"""
+        FOR term IN {terms_coll_name}
+            SORT RAND()
+            LIMIT @sample
+            RETURN {{
+                "key": term.key,
+                "alt_key": FIRST(term.alt_keys || []),
+                "obsolete_key": FIRST(term.obsolete_keys || []),
+                "synonym": CONCAT(term.namespace, ":", FIRST(term.synonyms || []) || ""),
+            }}
+    """
+
+    term_keys = {"key": [], "alt_key": [], "obsolete_key": [], "synonym": []}
+    for doc in resources_db.aql.execute(query, bind_vars={"sample": sample}):
+        for lookup_type, term_key in doc.items():
+            if term_key and not term_key.endswith(":"):
+                term_keys[lookup_type].append(term_key.replace("'", ""))
+
+    return term_keys
+
+
+def percentiles(timings: list) -> tuple:
+    """p50 and p95 in ms"""
+
+    if len(timings) < 2:
+        return (timings[0] * 1000, timings[0] * 1000) if timings else (0.0, 0.0)
+
+    quantiles = statistics.quantiles(timings, n=20)
+
+    return (statistics.median(timings) * 1000, quantiles[-1] * 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sample", type=int, default=200)
+    parser.add_argument("--bulk", type=int, default=1000)
+    args = parser.parse_args()
+
+    term_keys = sample_term_keys(max(args.sample, args.bulk))
+
+    print(
+        f"{'lookup':>13} {'aliases':>8} {'keys':>6} {'p50 (ms)':>9} {'p95 (ms)':>9} {'bulk (ms)':>10}"
+    )
+    for lookup_type, keys in term_keys.items():
+        query = query_synonym_terms if lookup_type == "synonym" else query_terms
+
+        for aliases in (True, False):
+            timings = []
+            for term_key in keys[: args.sample]:
+                start = time.perf_counter()
+                query([term_key], aliases=aliases)
+                timings.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            query(keys[: args.bulk], aliases=aliases)
+            bulk = (time.perf_counter() - start) * 1000
+
+            (p50, p95) = percentiles(timings)
+            print(
+                f"{lookup_type:>13} {str(aliases):>8} {len(timings):>6} {p50:>9.2f} {p95:>9.2f} "
+                f"{bulk:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""Benchmark BEL function validation and canonical argument sorting
+
+Times bel.lang.ast.validate_function and sort_function_args over every Function node of a
+large set of assertions (long complex() and composite() assertions with increasing numbers
+of members). The function signatures are compiled once per BEL Specification version
+(bel.belspec.compiled.CompiledSignature) so both are table lookups per function node.
+
+Also times BELAst.validate of the assertions without and with the validation errors memoized
+per subtree hash (bel.lang.ast.validation_cache) - the assertions share most of their subtrees.
+
+Usage: python profiling/validation_benchmark.py [--members 10 50 200] [--asts 20] [--repeat 5]
+"""
+
+# Standard Library
+import argparse
+import timeit
+
+# Local
+from bel.lang.ast import BELAst, clear_subtree_caches, sort_function_args, validate_function
+from bel.schemas.bel import AssertionStr
+from parse_benchmark import long_assertion
+
+
+def ast_functions(ast: BELAst) -> list:
+    """All Function nodes of AST"""
+
+    functions = []
+    stack = list(ast.args)
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        if node.type == "BELAst":
+            stack.extend(node.args)
+        elif node.type == "Function":
+            functions.append(node)
+            stack.extend(node.args)
+
+    return functions
+
+
+def validate_asts(asts: list, memoized: bool):
+    """Validate assertions - clearing the memoized validation errors first if not memoized"""
+
+    if not memoized:
+        clear_subtree_caches()
+
+    for ast in asts:
+        ast.errors = []
+        ast.validate()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--asts", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'members':>8} {'functions':>10} {'validate (ms)':>14} {'sort (ms)':>10} "
+        f"{'assertions (ms)':>16} {'memoized (ms)':>14}"
+    )
+    for members in args.members:
+        assertion_str = long_assertion(members)
+        asts = [BELAst(assertion=AssertionStr(entire=assertion_str)) for _ in range(args.asts)]
+
+        functions = [function for ast in asts for function in ast_functions(ast)]
+
+        # Warm up BEL Entity term lookups
+        for function in functions:
+            validate_function(function)
+
+        timings = {}
+        for name, method in [("validate", validate_function), ("sort", sort_function_args)]:
+            timings[name] = (
+                min(
+                    timeit.repeat(
+                        lambda: [method(function) for function in functions],
+                        number=1,
+                        repeat=args.repeat,
+                    )
+                )
+                * 1000
+            )
+
+        for name, memoized in [("assertions", False), ("memoized", True)]:
+            timings[name] = (
+                min(
+                    timeit.repeat(
+                        lambda: validate_asts(asts, memoized), number=1, repeat=args.repeat
+                    )
+                )
+                * 1000
+            )
+
+        print(
+            f"{members:>8} {len(functions):>10} {timings['validate']:>14.2f} "
+            f"{timings['sort']:>10.2f} {timings['assertions']:>16.2f} "
+            f"{timings['memoized']:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Local
+import bel.belspec.compiled
+from bel.belspec.compiled import CompiledBelSpec, get_compiled_belspec
+
+
+def test_compiled_belspec_lookups():
+
+    belspec = get_compiled_belspec("latest")
+
+    assert "p" in belspec.functions
+    assert "proteinAbundance" in belspec.functions
+    assert belspec.function_to_long["p"] == "proteinAbundance"
+    assert belspec.function_types["proteinAbundance"] == "Primary"
+
+    assert "->" in belspec.relations
+    assert "hasComponent" in belspec.relations
+    assert belspec.relation_to_long["->"] == "increases"
+
+    matches = [m.group(1) for m in belspec.relations_pattern.finditer("p(X) -| p(Y) -> p(Z)")]
+    assert matches == ["-|", "->"]
+
+    matches = [m.group(1) for m in belspec.functions_pattern.finditer("act(p(X), ma(kin), xp(Y))")]
+    assert matches == ["act", "p", "ma"]
+
+
+def test_compiled_belspec_dump_load(tmp_path):
+
+    belspec = get_compiled_belspec("latest")
+
+    filename = str(tmp_path / f"belspec_{belspec.version}.json")
+    belspec.dump(filename)
+
+    loaded = CompiledBelSpec.load(filename)
+
+    assert loaded.version == belspec.version
+    assert loaded.functions == belspec.functions
+    assert loaded.relations == belspec.relations
+    assert loaded.relations_pattern.pattern == belspec.relations_pattern.pattern
+    assert loaded.signature_tables == belspec.signature_tables
+
+    bel.belspec.compiled.clear_compiled_belspecs()
+    bel.belspec.compiled.load_compiled_belspecs(str(tmp_path))
+
+    assert get_compiled_belspec("latest").version == belspec.version
+    assert get_compiled_belspec(belspec.version).functions == belspec.functions
+
+    bel.belspec.compiled.clear_compiled_belspecs()
+
+
+def test_compiled_signatures():
+    """Function signatures compiled into immutable lookup tables"""
+
+    belspec = get_compiled_belspec("latest")
+
+    signature = belspec.compiled_signatures["molecularActivity"][0]
+    argument = signature.arguments[0]
+
+    assert argument.type == "StrArgNSArg"
+    assert argument.arg_types == frozenset(["NSArg", "StrArg"])
+    assert "kin" in argument.strarg_values
+    assert signature.required == (argument,)
+    assert 0 in signature.positional_indexes
+
+    signature = belspec.compiled_signatures["proteinAbundance"][0]
+
+    assert "location" in signature.opt_args
+    assert "proteinModification" in signature.opt_and_mult_args
+
+    # Validation no longer extends the StrArgNSArg argument types of the shared specification
+    function_signature = belspec.function_signatures["molecularActivity"]
+    assert function_signature["signatures"][0]["arguments"][0]["type"] == "StrArgNSArg"
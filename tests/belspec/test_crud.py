@@ -28,3 +28,92 @@ def test_check_version():
     print("Version Start", version_start, "End:", version)
 
     assert version == expected
+
+
+def test_check_version_registry():
+
+    versions = {
+        "doc_type": "belspec_versions",
+        "latest": "2.1.2",
+        "default": "latest",
+        "versions": ["latest", "2.1.2", "2.0.1"],
+    }
+
+    bel.belspec.crud.clear_belspec_cache()
+
+    assert bel.belspec.crud.check_version(version="2.0.0", versions=versions) == "2.0.1"
+    assert bel.belspec.crud.get_best_match("2.1.0", versions) == "2.1.2"
+
+    assert len(bel.belspec.crud.check_version_cache) == 1
+    assert len(bel.belspec.crud.best_match_cache) == 2
+
+    # Different versions records are cached separately
+    versions = dict(versions, latest="2.0.1", versions=["latest", "2.0.1"])
+    assert bel.belspec.crud.check_version(version="latest", versions=versions) == "2.0.1"
+
+    bel.belspec.crud.clear_belspec_cache()
+
+    assert len(bel.belspec.crud.check_version_cache) == 0
+    assert len(bel.belspec.crud.best_match_cache) == 0
+
+
+def test_belspec_revision(monkeypatch):
+    """The registry is cleared when the BEL Specifications are updated by another process"""
+
+    class BelConfigColl(object):
+        doc = {"_key": "belspec_versions", "revision": "1"}
+
+        def get(self, key):
+            return self.doc
+
+    bel_config_coll = BelConfigColl()
+    monkeypatch.setattr(bel.belspec.crud, "bel_config_coll", bel_config_coll)
+
+    versions = {
+        "doc_type": "belspec_versions",
+        "latest": "2.1.2",
+        "default": "latest",
+        "versions": ["latest", "2.1.2", "2.0.1"],
+    }
+
+    bel.belspec.crud.clear_belspec_cache()
+
+    assert bel.belspec.crud.check_version(version="2.0.0", versions=versions) == "2.0.1"
+    assert len(bel.belspec.crud.check_version_cache) == 1
+
+    bel_config_coll.doc = {"_key": "belspec_versions", "revision": "2"}
+
+    # Revision is only re-read after the ttl
+    assert bel.belspec.crud.check_version(version="2.1.2", versions=versions) == "2.1.2"
+    assert len(bel.belspec.crud.check_version_cache) == 2
+
+    bel.belspec.crud.belspec_revision_cache.clear()
+
+    assert bel.belspec.crud.check_version(version="2.1.2", versions=versions) == "2.1.2"
+    assert len(bel.belspec.crud.check_version_cache) == 1
+    assert bel.belspec.crud.belspec_revision["revision"] == "2"
+
+    bel.belspec.crud.clear_belspec_cache()
+
+
+def test_belspec_revision_offline(monkeypatch):
+    """The loaded registry is kept if the BEL Specifications revision can't be read"""
+
+    class BelConfigColl(object):
+        def get(self, key):
+            raise ConnectionError("database not available")
+
+    versions = {
+        "doc_type": "belspec_versions",
+        "latest": "2.1.2",
+        "default": "latest",
+        "versions": ["latest", "2.1.2", "2.0.1"],
+    }
+
+    bel.belspec.crud.clear_belspec_cache()
+    monkeypatch.setattr(bel.belspec.crud, "bel_config_coll", BelConfigColl())
+
+    assert bel.belspec.crud.check_version(version="2.0.0", versions=versions) == "2.0.1"
+    assert len(bel.belspec.crud.check_version_cache) == 1
+
+    bel.belspec.crud.clear_belspec_cache()
@@ -0,0 +1,67 @@
+# Standard Library
+import threading
+import time
+
+# Third Party
+import cachetools
+
+# Local
+import bel.core.singleflight
+
+
+def test_singleflight_cached():
+    """Concurrent cache misses for the same key run the function once"""
+
+    cache = cachetools.TTLCache(maxsize=10, ttl=60)
+    calls = []
+
+    @bel.core.singleflight.cached(cache, name="test_cached")
+    def lookup(key):
+        calls.append(key)
+        time.sleep(0.2)
+        return f"value_{key}"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(lookup("A"))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["A"]
+    assert results == ["value_A"] * 5
+    assert lookup("A") == "value_A"
+    assert calls == ["A"]
+
+    stats = bel.core.singleflight.get_singleflight_stats()["test_cached"]
+    assert stats["duplicates"] == 4
+    assert stats["in_flight"] == 0
+
+
+def test_singleflight_error():
+    """Waiting callers get the error of the call in flight - errors are not cached"""
+
+    calls = []
+
+    @bel.core.singleflight.singleflight("test_error")
+    def lookup(key):
+        calls.append(key)
+        time.sleep(0.2)
+        raise ValueError(key)
+
+    errors = []
+
+    def call():
+        try:
+            lookup("A")
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["A"]
+    assert errors == ["A"] * 3
@@ -7,6 +7,7 @@ import pytest
 
 # Local
 import bel.lang.ast
+import bel.terms.terms
 from bel.schemas.bel import AssertionStr, ValidationError
 
 # cSpell:disable
@@ -806,6 +807,78 @@ def test_ast_canonicalization(test_input, expected):
     assert ast.to_string() == expected
 
 
+def test_resolve_terms():
+    """BEL Entities of many ASTs resolved in bulk canonicalize the same as one at a time"""
+
+    test_inputs = {
+        "p(HGNC:AKT1)": "p(EG:207)",
+        "complex(p(HGNC:IL12B), p(HGNC:IL12A))": "complex(p(EG:3592), p(EG:3593))",
+        "path(DO:0080600!COVID-19)": "path(DO:0080600)",
+    }
+
+    asts = [
+        bel.lang.ast.BELAst(assertion=AssertionStr(entire=test_input)) for test_input in test_inputs
+    ]
+
+    bel.lang.ast.resolve_terms(asts)
+
+    for ast, expected in zip(asts, test_inputs.values()):
+        for ns_arg in ast.get_ns_args():
+            assert ns_arg.entity.canonical is not None
+
+        assert ast.canonicalize().to_string() == expected
+
+
+def test_resolve_orthologs():
+    """Orthologs of many ASTs collected in bulk orthologize the same as one at a time"""
+
+    test_inputs = {
+        "p(HGNC:AKT1)": "p(EG:11651!Akt1)",
+        "p(HGNC:AKT1) increases p(HGNC:EGF)": "p(EG:11651!Akt1) increases p(EG:13645!Egf)",
+    }
+
+    asts = [
+        bel.lang.ast.BELAst(assertion=AssertionStr(entire=test_input)) for test_input in test_inputs
+    ]
+
+    bel.lang.ast.resolve_orthologs(asts)
+
+    for ast, expected in zip(asts, test_inputs.values()):
+        for ns_arg in ast.get_ns_args():
+            assert "TAX:10090" in ns_arg.entity.orthologs
+
+        assert ast.orthologizable("TAX:10090")
+        assert ast.orthologize("TAX:10090").to_string() == expected
+
+
+def test_interned_asts():
+    """Interned ASTs share structurally identical subtrees"""
+
+    assertions = [
+        "p(HGNC:AKT1) increases bp(GO:apoptosis)",
+        "p(HGNC:AKT1) decreases bp(GO:apoptosis)",
+        "complex(p(HGNC:AKT1), p(HGNC:EGF)) increases bp(GO:apoptosis)",
+    ]
+
+    asts = [
+        bel.lang.ast.BELAst(assertion=AssertionStr(entire=assertion), intern=True)
+        for assertion in assertions
+    ]
+
+    assert asts[0].subject is asts[1].subject
+    assert asts[0].object is asts[2].object
+    assert asts[2].subject.args[0] is asts[0].subject
+
+    expected = bel.lang.ast.BELAst(assertion=AssertionStr(entire=assertions[0]))
+    assert asts[0].to_string() == expected.to_string()
+
+    # Modified ASTs no longer share their subtrees
+    asts[0].canonicalize()
+    assert asts[0].subject is not asts[1].subject
+    assert asts[0].to_string() == expected.canonicalize().to_string()
+    assert asts[1].subject.to_string() == asts[2].subject.args[0].to_string()
+
+
 def test_ast_canonicalization_2():
     """Test AST canonicalization and sorting function arguments
 
@@ -853,3 +926,93 @@ def test_ast_subcomponents_complex():
     pprint.pprint(subcomponents)
 
     assert subcomponents == ["path(DO:0080600!COVID-19)", "DO:0080600!COVID-19", "DO:COVID-19"]
+
+
+def test_ast_nodes_share_belspec():
+    """AST nodes have no instance dict and share the compiled BEL Specification"""
+
+    assertion = AssertionStr(entire="p(HGNC:AKT1, pmod(Ph, S, 473)) increases act(p(HGNC:EGFR))")
+
+    ast = bel.lang.ast.BELAst(assertion=assertion)
+
+    nodes = [ast.relation, ast.subject, ast.object] + ast.subject.args + ast.subject.args[1].args
+    for node in nodes:
+        assert not hasattr(node, "__dict__")
+        assert node.belspec is ast.belspec
+
+    assert ast.subject.name_short == "p"
+    assert ast.subject.function_signature["name"] == "proteinAbundance"
+    assert ast.relation.name_short == "->"
+
+
+def test_subtree_memoization():
+    """Validation errors and canonical strings are memoized by subtree hash"""
+
+    bel.lang.ast.clear_subtree_caches()
+
+    first = bel.lang.ast.BELAst(assertion=AssertionStr(entire="p(missing:AKT1)"))
+    second = bel.lang.ast.BELAst(
+        assertion=AssertionStr(entire="p(HGNC:EGF) increases p(missing:AKT1)")
+    )
+
+    first.validate()
+    second.validate()
+
+    assert first.subject.subtree_hash == second.object.subtree_hash
+    assert first.subject.subtree_hash != second.subject.subtree_hash
+
+    # Memoized validation errors moved to the position of the object
+    assert first.errors
+    for error in first.errors:
+        msg = error.msg.replace("at position 2", "at position 24")
+        assert (msg, error.index + 22) in [(error.msg, error.index) for error in second.errors]
+
+    # Canonical strings don't modify the AST
+    test_input = "path(DO:0080600!COVID-19) increases path(DO:0080600!COVID-19)"
+    ast = bel.lang.ast.BELAst(assertion=AssertionStr(entire=test_input))
+
+    assert ast.canonical_string() == "path(DO:0080600) increases path(DO:0080600)"
+    assert ast.to_string() == test_input
+
+
+def test_subtree_memoization_terms():
+    """BEL Entities get their term info when the validation errors are memoized"""
+
+    bel.lang.ast.clear_subtree_caches()
+
+    first = bel.lang.ast.BELAst(assertion=AssertionStr(entire="p(HGNC:AKT1, pmod(Ph))"))
+    second = bel.lang.ast.BELAst(assertion=AssertionStr(entire="p(HGNC:AKT1, pmod(Ph))"))
+
+    (first_entity, second_entity) = [ast.subject.args[0].entity for ast in (first, second)]
+
+    # Term info not added yet, e.g. namespace metadata not loaded when the AST was created
+    for entity in (first_entity, second_entity):
+        entity.term = None
+
+    first.validate()
+    second.validate()
+
+    assert second_entity.term == first_entity.term
+    assert second_entity.species_key == first_entity.species_key
+    assert second.to_string() == first.to_string()
+
+
+def test_parse_without_term_lookups(monkeypatch):
+    """Parsing doesn't look up terms - BEL Entities get their term info on first access"""
+
+    lookups = []
+    monkeypatch.setattr(bel.terms.terms, "get_term", lambda term_key: lookups.append(term_key))
+    monkeypatch.setattr(
+        bel.terms.terms, "prefetch_terms", lambda term_keys: lookups.extend(term_keys) or {}
+    )
+
+    ast = bel.lang.ast.BELAst(assertion=AssertionStr(entire="p(HGNC:AKT1) increases p(HGNC:EGF)"))
+
+    entities = [ns_arg.entity for ns_arg in ast.get_ns_args()]
+    assert len(entities) == 2
+    assert not any(entity.has_term() for entity in entities)
+    assert lookups == []
+
+    entities[0].species_key
+    assert entities[0].has_term()
+    assert not entities[1].has_term()
@@ -0,0 +1,59 @@
+# Local
+import bel.lang.ast
+from bel.lang.computed_edges import compute_edges
+from bel.schemas.bel import AssertionStr
+
+
+def test_computed_edges():
+    """Computed edges of complex(), act() and pmod() functions"""
+
+    ast = bel.lang.ast.BELAst(
+        assertion=AssertionStr(
+            entire="complex(p(HGNC:AKT1), p(HGNC:EGF)) increases act(p(HGNC:AKT1, pmod(Ph)), ma(kin))"
+        )
+    )
+
+    edges = [edge.to_triple() for edge in compute_edges([ast])]
+
+    complex_ = ast.subject.to_string()
+    activity = ast.object.to_string()
+    modified = ast.object.args[0].to_string()
+    akt1, egf = [arg.to_string() for arg in ast.subject.args]
+
+    assert edges == [
+        {"subject": complex_, "relation": "hasComponent", "object": akt1},
+        {"subject": complex_, "relation": "hasComponent", "object": egf},
+        {"subject": modified, "relation": "hasActivity", "object": activity},
+        {"subject": akt1, "relation": "hasModification", "object": modified},
+    ]
+
+
+def test_computed_edges_named_complex():
+    """Named complexes have no component edges"""
+
+    ast = bel.lang.ast.BELAst(
+        assertion=AssertionStr(entire='complex(SCOMP:"AP-1 Complex") increases bp(GO:apoptosis)')
+    )
+
+    edges = [edge.to_triple() for edge in compute_edges([ast])]
+
+    assert edges == []
+
+
+def test_computed_edges_deduplicated():
+    """Computed edges are only generated once per distinct subtree"""
+
+    assertions = [
+        "complex(p(HGNC:AKT1), p(HGNC:EGF)) increases bp(GO:apoptosis)",
+        "complex(p(HGNC:AKT1),p(HGNC:EGF)) decreases bp(GO:apoptosis)",
+        "p(HGNC:IL6, pmod(Ph)) increases p(HGNC:TP53, pmod(Ph))",
+    ]
+
+    asts = [
+        bel.lang.ast.BELAst(assertion=AssertionStr(entire=assertion)) for assertion in assertions
+    ]
+
+    edges = [edge.to_string() for edge in compute_edges(asts)]
+
+    assert len(edges) == len(set(edges)) == 4
+    assert all(edge.is_computed for edge in compute_edges(asts[2:]))
@@ -0,0 +1,77 @@
+# Third Party
+import pytest
+
+# Local
+import bel.lang.incremental
+from bel.lang.ast import BELAst
+from bel.schemas.bel import AssertionStr
+
+assertion_str = (
+    "complex(p(HGNC:AKT1), p(HGNC:EGF, pmod(Ph, S, 473))) increases act(p(HGNC:EGFR), ma(kin))"
+)
+
+edits = [
+    (assertion_str.index("AKT1"), 4, "AKT2"),  # replace NSArg id
+    (assertion_str.index("473"), 0, "4"),  # insert into modifier argument
+    (assertion_str.index(", ma(kin)"), 9, ""),  # delete function argument
+    (assertion_str.index("HGNC:EGF,") + 8, 0, ', loc(GO:"cell surface")'),  # add function argument
+    (assertion_str.index("increases"), 9, "decreases"),  # replace relation
+    (assertion_str.index("(kin)"), 1, ""),  # unbalanced parentheses
+    (0, 0, '"'),  # unmatched quote
+]
+
+
+@pytest.mark.parametrize("offset,deleted,inserted", edits)
+def test_reparse_matches_parse(offset, deleted, inserted):
+    """Re-parsed AST is the same as parsing the edited Assertion from scratch"""
+
+    ast = BELAst(assertion=AssertionStr(entire=assertion_str))
+
+    new_ast = bel.lang.incremental.reparse(ast, offset, deleted, inserted)
+
+    edited_str = assertion_str[:offset] + inserted + assertion_str[offset + deleted :]
+    expected = BELAst(assertion=AssertionStr(entire=edited_str))
+
+    assert new_ast.assertion.entire == edited_str
+    assert new_ast.to_string() == expected.to_string()
+    assert new_ast.errors == expected.errors
+    assert new_ast.parse_info.components == expected.parse_info.components
+    assert new_ast.parse_info.matched_parens == expected.parse_info.matched_parens
+    assert new_ast.parse_info.matched_quotes == expected.parse_info.matched_quotes
+    assert new_ast.parse_info.commas == expected.parse_info.commas
+
+
+def test_reparse_reuses_unchanged_nodes():
+    """Function subtrees and BEL Entities outside of the edit are moved into the new AST"""
+
+    ast = BELAst(assertion=AssertionStr(entire=assertion_str))
+
+    akt1 = ast.subject.args[0]
+    egf_entity = ast.subject.args[1].args[0].entity
+    obj = ast.object
+
+    offset = assertion_str.index("473")
+    new_ast = bel.lang.incremental.reparse(ast, offset, 3, "308")
+
+    # Sibling function before the edit and the Assertion object after it are reused
+    assert new_ast.subject.args[0] is akt1
+    assert new_ast.object is obj
+    assert new_ast.object.span.start == obj.span.start
+
+    # The edited function is rebuilt but keeps its BEL Entity
+    assert new_ast.subject.args[1].args[0].entity is egf_entity
+    assert new_ast.subject.args[0].parent is new_ast.subject
+
+    # Longer edit before the object shifts its spans
+    new_ast = bel.lang.incremental.reparse(new_ast, assertion_str.index("AKT1"), 4, "AKT1S1")
+    assert new_ast.object is obj
+    assert new_ast.object.span.start == assertion_str.index("act(") + 2
+    assert new_ast.object.span.span_str == "act(p(HGNC:EGFR), ma(kin))"
+
+
+def test_reparse_bad_edit():
+
+    ast = BELAst(assertion=AssertionStr(entire=assertion_str))
+
+    with pytest.raises(ValueError):
+        bel.lang.incremental.reparse(ast, len(assertion_str), 1, "")
@@ -0,0 +1,58 @@
+# Third Party
+import pytest
+
+# Local
+import bel.lang.lexer
+import bel.lang.parse
+from bel.lang.ast import BELAst
+from bel.schemas.bel import AssertionStr
+
+assertions = [
+    'complex(SCOMP:"Test named" complex", p(HGNC:"207"!"AKT1 Test), p(HGNC:207!"Test"), loc(X)) increases p(HGNC:EGF) increases p(hgnc : "here I am" ! X)',
+    'complex(p(HGNC:"EGF"!"EGF test"), p(HGNC:EGFR)) -> p(HGNC:AKT1, pmod(Ph, S, 473))',
+    'p(HGNC:AKT1, var("p.Arg52His")) -| act(p(HGNC:ABL1), ma(kin))',
+    'composite(p(HGNC:IL6), complex(GO:"interleukin-23 complex")) =| bp(GO:"cell death")',
+    'p(HGNC:AKT1, loc(GO:"cell surface")) increases  p(HGNC:EGF)',
+    "p(HGNC:AKT1 increases p(HGNC:EGF))) decreases",
+    'path(DO:"Alzheimer disease") positiveCorrelation "not a function(HGNC:AKT1)"',
+    "test p(HGNC:AKT1) notAFunction(x, y)",
+    "",
+]
+
+
+@pytest.mark.parametrize("assertion_str", assertions)
+def test_lexer_matches_regex_parser(assertion_str):
+    """Lexer and regex backends return the same parse info"""
+
+    regex_result = bel.lang.parse.parse_info(assertion_str, parser="regex")
+    lexer_result = bel.lang.parse.parse_info(assertion_str, parser="lexer")
+
+    assert lexer_result == regex_result
+
+
+def test_outside_quotes():
+
+    quoted = [(5, 10), (20, 25)]
+    positions = [1, 5, 6, 10, 15, 21, 25, 30]
+
+    assert bel.lang.lexer.outside_quotes(positions, quoted) == [1, 5, 10, 15, 25, 30]
+
+
+def test_unknown_parser():
+
+    with pytest.raises(ValueError):
+        bel.lang.parse.parse_info("p(HGNC:AKT1)", parser="unknown")
+
+
+def test_ast_parser_backends():
+    """BELAst is the same for lexer and regex backends"""
+
+    assertion = AssertionStr(
+        entire='complex(p(HGNC:"EGF"!"EGF test"), p(HGNC:EGFR)) -> p(HGNC:AKT1, pmod(Ph, S, 473))'
+    )
+
+    lexer_ast = BELAst(assertion=assertion, parser="lexer")
+    regex_ast = BELAst(assertion=assertion, parser="regex")
+
+    assert lexer_ast.to_string() == regex_ast.to_string()
+    assert lexer_ast.errors == regex_ast.errors
@@ -4,7 +4,7 @@ import pytest
 # Local
 import bel.lang.parse
 from bel.lang.ast import BELAst
-from bel.schemas.bel import Pair
+from bel.schemas.bel import NsArgSpan, Pair
 
 # TODO test reading in a string from a file doesn't remove the escape backslash
 
@@ -232,3 +232,46 @@ def test_find_strings():
     assert string_spans[1].end == 175
     assert string_spans[1].span_str == "stuff here"
     assert string_spans[1].type == "string"
+
+
+def test_parse_info_cache():
+    """Parse info is cached by assertion hash and version and copies are returned"""
+
+    assertion_str = 'p(HGNC:AKT1, loc(GO:"cell surface")) increases p(HGNC:EGF'
+
+    bel.lang.parse.clear_parse_info_cache()
+
+    first = bel.lang.parse.get_cached_parse_info(assertion_str)
+    second = bel.lang.parse.get_cached_parse_info(assertion_str)
+
+    assert first == second
+    assert first == bel.lang.parse.parse_info(assertion_str)
+
+    stats = bel.lang.parse.get_parse_info_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+    # Changes to returned parse info don't change the cached parse info
+    first["components"].pop()
+    first["errors"][0].visual = "changed"
+
+    third = bel.lang.parse.get_cached_parse_info(assertion_str)
+    assert third == second
+
+    bel.lang.parse.clear_parse_info_cache()
+    assert bel.lang.parse.get_parse_info_cache_stats()["size"] == 0
+
+
+def test_spans_to_schema():
+    """Parser spans convert to the pydantic span models"""
+
+    assertion_str = 'p(HGNC:AKT1!"AKT1 kinase")'
+
+    nsarg = bel.lang.parse.find_nsargs(assertion_str)[0]
+    nsarg_schema = nsarg.to_schema()
+
+    assert isinstance(nsarg_schema, NsArgSpan)
+    assert nsarg_schema.span_str == 'HGNC:AKT1!"AKT1 kinase"'
+    assert nsarg_schema.label.span_str == '"AKT1 kinase"'
+    assert nsarg_schema.type == "ns_arg"
@@ -0,0 +1,76 @@
+# Third Party
+import pytest
+
+# Local
+import bel.core.settings as settings
+import bel.lang.lexer
+import bel.lang.parse
+import bel.lang.strict
+from bel.lang.ast import BELAst
+from bel.schemas.bel import AssertionStr
+
+valid_assertions = [
+    "p(HGNC:AKT1)",
+    'complex(p(HGNC:"EGF"!"EGF test"), p(HGNC:EGFR)) -> p(HGNC:AKT1, pmod(Ph, S, 473))',
+    'p(HGNC:AKT1, var("p.Arg52His")) -| act(p(HGNC:ABL1), ma(kin))',
+    'composite(p(HGNC:IL6), complex(GO:"interleukin-23 complex")) =| bp(GO:"cell death")',
+    'tloc(p(HGNC:X), fromLoc(GO:"cytoplasm"), toLoc(GO:nucleus)) increases a(CHEBI:"some, thing")',
+    "p(HGNC:AKT1) increases (p(HGNC:EGF) decreases p(HGNC:EGFR))",
+]
+
+malformed_assertions = [
+    "p(HGNC:AKT1 increases p(HGNC:EGF)",  # missing close parenthesis
+    'p(HGNC:"AKT1) increases p(HGNC:EGF)',  # missing quote
+    "p(hgnc : AKT1 ! X)",  # tolerant NSArg spacing
+    "p(HGNC:AKT1) increases p(HGNC:EGF) decreases p(HGNC:X)",  # too many relations
+    "p(HGNC:AKT1) notARelation p(HGNC:EGF)",
+    "pmod(Ph)",  # modifier function as subject
+    "p(HGNC:AKT1, pmod(Ph, loc(X)))",  # modifier function in modifier function
+    'p(HGNC:AKT1, var("a, b"))',  # comma in quoted string argument
+    "",
+]
+
+
+@pytest.mark.parametrize("assertion_str", valid_assertions)
+def test_strict_matches_tolerant_parser(assertion_str):
+    """Strict parser returns the same parse info as the tolerant parser for valid Assertions"""
+
+    strict_result = bel.lang.strict.strict_info(assertion_str)
+
+    assert strict_result is not None
+    assert strict_result == bel.lang.lexer.lex_info(assertion_str)
+
+
+@pytest.mark.parametrize("assertion_str", malformed_assertions)
+def test_strict_rejects_malformed(assertion_str):
+    """Malformed Assertions are left to the tolerant parser"""
+
+    assert bel.lang.strict.strict_info(assertion_str) is None
+
+    result = bel.lang.parse.parse_info(assertion_str, strict=True)
+    assert result == bel.lang.lexer.lex_info(assertion_str)
+
+
+def test_strict_ast():
+    """BELAst is the same with and without the strict parser"""
+
+    strict_setting = settings.BEL_STRICT_PARSER
+
+    for assertion_str in valid_assertions + malformed_assertions:
+        assertion = AssertionStr(entire=assertion_str)
+
+        try:
+            bel.lang.parse.clear_parse_info_cache()
+            settings.BEL_STRICT_PARSER = True
+            strict_ast = BELAst(assertion=assertion)
+
+            bel.lang.parse.clear_parse_info_cache()
+            settings.BEL_STRICT_PARSER = False
+            tolerant_ast = BELAst(assertion=assertion)
+        finally:
+            settings.BEL_STRICT_PARSER = strict_setting
+            bel.lang.parse.clear_parse_info_cache()
+
+        assert strict_ast.parse_info.components == tolerant_ast.parse_info.components
+        assert strict_ast.to_string() == tolerant_ast.to_string()
+        assert strict_ast.errors == tolerant_ast.errors
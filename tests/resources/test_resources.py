@@ -1,9 +1,13 @@
 # Standard Library
+import io
 import json
 
 # Local
 import bel.db.arangodb as arangodb
+from bel.resources.equivalence import UnionFind, cluster_doc, update_equivalence_clusters
 from bel.resources.manage import delete_resource, update_resources
+from bel.resources.namespace import delete_namespace, terms_iterator_for_arangodb
+from bel.resources.normalization import normalized_term, targets_hash
 
 
 def test_update_namespace():
@@ -18,3 +22,149 @@ def test_update_namespace():
     print("Results", results)
 
     assert False
+
+
+def test_term_aliases():
+    """Term aliases for the key, alt_keys, obsolete_keys and lowercased synonyms"""
+
+    term = {
+        "key": "HGNC:391",
+        "namespace": "HGNC",
+        "alt_keys": ["HGNC:AKT1"],
+        "obsolete_keys": ["HGNC:PKB"],
+        "synonyms": ["AKT1", "PKB", "Akt1"],
+    }
+    f = io.StringIO(json.dumps({"term": term}) + "\n")
+
+    aliases = [
+        (doc["alias"], doc["type"], doc["term_dbkey"])
+        for coll_name, doc in terms_iterator_for_arangodb(f, "20200101")
+        if coll_name == arangodb.term_aliases_name
+    ]
+
+    term_dbkey = arangodb.arango_id_to_key("HGNC:391")
+
+    assert aliases == [
+        ("HGNC:391", "key", term_dbkey),
+        ("HGNC:AKT1", "alt_key", term_dbkey),
+        ("HGNC:PKB", "obsolete_key", term_dbkey),
+        ("HGNC:akt1", "synonym", term_dbkey),
+        ("HGNC:pkb", "synonym", term_dbkey),
+    ]
+
+
+def test_equivalence_clusters():
+    """Union-find equivalence clusters with the primary keys by namespace"""
+
+    union_find = UnionFind()
+    union_find.union("HGNC:391", "EG:207")
+    union_find.union("SP:P31749", "EG:207")
+    union_find.union("HGNC:3236", "EG:1956")
+    union_find.add("HGNC:5")
+
+    components = sorted(sorted(component) for component in union_find.components())
+    assert components == [
+        ["EG:1956", "HGNC:3236"],
+        ["EG:207", "HGNC:391", "SP:P31749"],
+        ["HGNC:5"],
+    ]
+
+    nodes = [
+        {"key": "HGNC:391", "namespace": "HGNC", "primary": True},
+        {"key": "EG:207", "namespace": "EG", "primary": True},
+        {"key": "SP:P31749", "namespace": "SP", "primary": True},
+        {"key": "SP:Q9BWB6", "namespace": "SP", "primary": False},
+    ]
+    cluster = cluster_doc("EG_207", nodes)
+
+    assert cluster["_key"] == "EG_207"
+    assert [member["term_key"] for member in cluster["members"]] == [
+        "EG:207",
+        "HGNC:391",
+        "SP:P31749",
+        "SP:Q9BWB6",
+    ]
+    assert cluster["primary_keys"] == {"EG": ["EG:207"], "HGNC": ["HGNC:391"], "SP": ["SP:P31749"]}
+
+
+def test_delete_namespace_equivalence_clusters():
+    """Equivalence clusters are recomputed from their remaining members after deleting a namespace"""
+
+    def node(term_key: str) -> dict:
+        namespace = term_key.split(":")[0]
+        return {
+            "_key": arangodb.arango_id_to_key(term_key),
+            "key": term_key,
+            "namespace": namespace,
+            "source": namespace,
+            "primary": True,
+            "version": "test",
+        }
+
+    def edge(term_key1: str, term_key2: str, source: str) -> dict:
+        (dbkey1, dbkey2) = (
+            arangodb.arango_id_to_key(term_key1),
+            arangodb.arango_id_to_key(term_key2),
+        )
+        return {
+            "_key": f"{dbkey1}_{dbkey2}",
+            "_from": f"{arangodb.equiv_nodes_name}/{dbkey1}",
+            "_to": f"{arangodb.equiv_nodes_name}/{dbkey2}",
+            "source": source,
+            "version": "test",
+        }
+
+    nodes = [node("TESTA:1"), node("TESTB:1"), node("TESTC:1")]
+    edges = [
+        edge("TESTA:1", "TESTB:1", "TESTB"),
+        edge("TESTB:1", "TESTC:1", "TESTB"),
+        edge("TESTA:1", "TESTC:1", "TESTA"),
+    ]
+    arangodb.equiv_nodes_coll.import_bulk(nodes, on_duplicate="replace")
+    arangodb.equiv_edges_coll.import_bulk(edges, on_duplicate="replace")
+
+    update_equivalence_clusters([node["_key"] for node in nodes])
+
+    (testa, testb, testc) = [node["_key"] for node in nodes]
+    assert arangodb.equiv_nodes_coll.get(testa)["cluster_id"] == testa
+
+    delete_namespace("TESTB")
+
+    cluster = arangodb.equiv_clusters_coll.get(testa)
+    assert [member["term_key"] for member in cluster["members"]] == ["TESTA:1", "TESTC:1"]
+    assert cluster["primary_keys"] == {"TESTA": ["TESTA:1"], "TESTC": ["TESTC:1"]}
+    assert arangodb.equiv_nodes_coll.get(testc)["cluster_id"] == testa
+
+    delete_namespace("TESTA")
+
+    assert arangodb.equiv_clusters_coll.get(testa) is None
+    assert arangodb.equiv_nodes_coll.get(testc)["cluster_id"] == ""
+
+    delete_namespace("TESTC")
+
+
+def test_normalized_term():
+    """Normalized term for the canonicalization targets"""
+
+    term = {
+        "_key": "HGNC_391",
+        "key": "HGNC:391",
+        "namespace": "HGNC",
+        "label": "AKT1",
+        "entity_types": ["Gene", "RNA", "Protein"],
+        "version": "20200101",
+    }
+    primary_keys = {"EG": ["EG:207"], "HGNC": ["HGNC:391"], "SP": ["SP:P31749"]}
+
+    canonical_targets = {"HGNC": ["EG", "SP"]}
+    decanonical_targets = {"EG": ["HGNC"]}
+
+    doc = normalized_term(term, primary_keys, canonical_targets, decanonical_targets)
+
+    assert doc["normalized"] == "HGNC:391"
+    assert doc["canonical"] == "EG:207"
+    assert doc["decanonical"] == "HGNC:391"
+    assert doc["annotation_types"] == []
+    assert doc["source"] == "HGNC"
+    assert doc["targets_hash"] == targets_hash(canonical_targets, decanonical_targets)
+    assert doc["targets_hash"] != targets_hash(canonical_targets, {})
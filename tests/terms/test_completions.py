@@ -0,0 +1,83 @@
+# Local
+from bel.terms.completions import CompletionIndex, term_completions, write_completion_index
+from bel.terms.snapshot import TermSnapshot, write_snapshot
+
+terms = [
+    {
+        "key": "HGNC:391",
+        "namespace": "HGNC",
+        "id": "391",
+        "label": "AKT1",
+        "name": "AKT serine/threonine kinase 1",
+        "synonyms": ["PKB", "RAC"],
+        "alt_keys": ["HGNC:AKT1"],
+        "species_key": "TAX:9606",
+        "species_label": "human",
+        "entity_types": ["Gene", "RNA", "Protein"],
+    },
+    {
+        "key": "HGNC:392",
+        "namespace": "HGNC",
+        "id": "392",
+        "label": "AKT2",
+        "name": "AKT serine/threonine kinase 2",
+        "alt_keys": ["HGNC:AKT2"],
+        "species_key": "TAX:9606",
+        "species_label": "human",
+        "entity_types": ["Gene", "RNA", "Protein"],
+    },
+    {
+        "key": "HGNC:3236",
+        "namespace": "HGNC",
+        "id": "3236",
+        "label": "EGFR",
+        "name": "epidermal growth factor receptor",
+        "synonyms": ["ERBB", "ERBB1"],
+        "alt_keys": ["HGNC:EGFR"],
+        "species_key": "TAX:9606",
+        "species_label": "human",
+        "entity_types": ["Gene", "RNA", "Protein"],
+    },
+]
+
+
+def test_term_completions(tmp_path):
+    """Complete terms from a completion index"""
+
+    snapshot_path = str(tmp_path / "HGNC.terms")
+    index_path = str(tmp_path / "HGNC.completions")
+    write_snapshot(terms, "HGNC", "20200101", snapshot_path)
+    write_completion_index(terms, "HGNC", "20200101", index_path)
+
+    snapshots = {"HGNC": TermSnapshot(snapshot_path)}
+    indexes = {"HGNC": CompletionIndex(index_path)}
+
+    assert indexes["HGNC"].version == "20200101"
+
+    completions = term_completions("akt1", 10, snapshots, indexes)
+    assert [completion["key"] for completion in completions] == ["HGNC:391"]
+    assert completions[0]["highlight"] == ["<em>AKT1</em>", "HGNC:<em>AKT1</em>"]
+    assert completions[0]["sort_tuple"] == (0, len("<em>AKT1</em>"))
+    assert completions[0]["species"] == {"key": "TAX:9606", "label": "human"}
+
+    completions = term_completions("akt", 10, snapshots, indexes)
+    assert [completion["key"] for completion in completions] == ["HGNC:391", "HGNC:392"]
+    assert completions[1]["highlight"] == [
+        "<em>AKT2</em>",
+        "<em>AKT</em> serine/threonine kinase 2",
+        "HGNC:<em>AKT2</em>",
+    ]
+
+    completions = term_completions("erb", 10, snapshots, indexes)
+    assert [completion["key"] for completion in completions] == ["HGNC:3236"]
+    assert completions[0]["highlight"] == ["<em>ERBB</em>", "<em>ERBB1</em>"]
+
+    assert term_completions("akt", 10, snapshots, indexes, entity_types=["Species"]) == []
+    assert term_completions("akt", 10, snapshots, indexes, species_keys=["TAX:10090"]) == []
+    assert term_completions("akt", 10, snapshots, indexes, namespaces=["MGI"]) == []
+    assert len(term_completions("akt", 10, snapshots, indexes, species_keys=["TAX:9606"])) == 2
+
+    for index in indexes.values():
+        index.close()
+    for snapshot in snapshots.values():
+        snapshot.close()
@@ -26,3 +26,18 @@ def test_orthologs():
     print("Orthologs:\n", json.dumps(orthologs, indent=4))
 
     assert orthologs == expected
+
+
+def test_orthologs_many():
+    """Get orthologs for many genes in bulk - same as one at a time"""
+
+    term_keys = ["HGNC:AKT1", "HGNC:EGF", "EG:207"]
+
+    orthologs = bel.terms.orthologs.get_orthologs_many(term_keys, species_keys=["TAX:10090"])
+
+    for term_key in term_keys:
+        assert orthologs[term_key] == bel.terms.orthologs.get_orthologs(
+            term_key, species_keys=["TAX:10090"]
+        )
+
+    assert orthologs["HGNC:AKT1"]["TAX:10090"] == "EG:11651"
@@ -0,0 +1,57 @@
+# Local
+from bel.terms.snapshot import ALT_KEY, KEY, OBSOLETE_KEY, SYNONYM, TermSnapshot, write_snapshot
+
+terms = [
+    {
+        "key": "HGNC:391",
+        "namespace": "HGNC",
+        "id": "391",
+        "label": "AKT1",
+        "synonyms": ["PKB", "RAC"],
+        "alt_keys": ["HGNC:AKT1"],
+        "obsolete_keys": ["HGNC:PKB"],
+        "equivalence_keys": ["EG:207", "SP:P31749"],
+        "species_key": "TAX:9606",
+        "entity_types": ["Gene", "RNA", "Protein"],
+    },
+    {
+        "key": "HGNC:3236",
+        "namespace": "HGNC",
+        "id": "3236",
+        "label": "EGFR",
+        "synonyms": ["ERBB", "ERBB1", "PKB"],
+        "alt_keys": ["HGNC:EGFR"],
+        "species_key": "TAX:9606",
+        "entity_types": ["Gene", "RNA", "Protein"],
+    },
+]
+
+
+def test_term_snapshot(tmp_path):
+    """Write and look up terms in a term snapshot"""
+
+    path = str(tmp_path / "HGNC.terms")
+    write_snapshot(terms, "HGNC", "20200101", path)
+
+    snapshot = TermSnapshot(path)
+
+    assert snapshot.namespace == "HGNC"
+    assert snapshot.version == "20200101"
+    assert snapshot.prefixes == {"EG", "HGNC", "SP"}
+
+    key_types = (KEY, ALT_KEY, OBSOLETE_KEY)
+    assert snapshot.lookup("HGNC:391", key_types) == [0]
+    assert snapshot.lookup("HGNC:AKT1", key_types) == [0]
+    assert snapshot.lookup("HGNC:PKB", key_types) == [0]
+    assert snapshot.lookup("HGNC:PKB", (SYNONYM,)) == [0, 1]
+    assert snapshot.lookup("HGNC:pkb", (SYNONYM,)) == []
+    assert snapshot.lookup("HGNC:MISSING", key_types) == []
+    assert snapshot.lookup("MGI:Akt1", key_types) == []
+
+    term = snapshot.record(1)
+    assert term["key"] == "HGNC:3236"
+    assert term["synonyms"] == ["ERBB", "ERBB1", "PKB"]
+    assert term["obsolete_keys"] == []
+    assert term["description"] == ""
+
+    snapshot.close()
@@ -1,7 +1,9 @@
 # Third Party
+import cachetools
 import pytest
 
 # Local
+import bel.core.settings
 import bel.schemas
 import bel.terms.terms
 
@@ -39,6 +41,71 @@ def test_equivalents():
     assert results == expected
 
 
+def test_prefetch_terms():
+
+    term_keys = ["HGNC:AKT1", "HGNC:FAM46C", "SP:P31749", "EG:207"]
+
+    results = bel.terms.terms.prefetch_terms(term_keys)
+
+    for term_key in term_keys:
+        assert results[term_key] == bel.terms.terms.get_terms(term_key)
+
+
+def test_prefetch_equivalents():
+
+    term_keys = ["HGNC:AKT1", "SP:P31749"]
+
+    results = bel.terms.terms.prefetch_equivalents(term_keys)
+
+    for term_key in term_keys:
+        assert results[term_key] == bel.terms.terms.get_equivalents(term_key)
+
+
+def test_get_terms_many():
+
+    term_keys = ["HGNC:AKT1", "HGNC:FAM46C", "SP:P31749", "EG:207", "HGNC:AKT1"]
+
+    results = bel.terms.terms.get_terms_many(term_keys)
+
+    assert list(results) == ["HGNC:AKT1", "HGNC:FAM46C", "SP:P31749", "EG:207"]
+
+    bel.terms.terms.terms_cache.clear()
+    for term_key in term_keys:
+        assert results[term_key] == bel.terms.terms.get_terms(term_key)
+
+
+def test_get_normalized_terms_many():
+
+    term_keys = ["SP:P31749", "HGNC:AKT1", "EG:207"]
+
+    results = bel.terms.terms.get_normalized_terms_many(term_keys)
+
+    bel.terms.terms.terms_cache.clear()
+    bel.terms.terms.equivalents_cache.clear()
+    for term_key in term_keys:
+        assert results[term_key] == bel.terms.terms.get_normalized_terms(term_key)
+
+
+def test_shared_terms_cache(monkeypatch):
+    """Terms cached in the shared Redis tier by another worker process"""
+
+    monkeypatch.setattr(bel.core.settings, "REDIS_TERM_CACHE", True)
+
+    term_keys = ["HGNC:AKT1", "HGNC:NOT_A_GENE"]
+
+    bel.terms.terms.terms_cache.clear()
+    terms = {term_key: bel.terms.terms.get_terms(term_key) for term_key in term_keys}
+
+    # Another worker process - empty per-process cache
+    bel.terms.terms.terms_cache.clear()
+    cached = bel.terms.terms.terms_cache.get_many(
+        [cachetools.keys.hashkey(term_key) for term_key in term_keys]
+    )
+
+    for term_key in term_keys:
+        assert cached[cachetools.keys.hashkey(term_key)] == terms[term_key]
+
+
 def test_get_normalized_terms():
 
     term_key = "SP:P31749"
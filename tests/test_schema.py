@@ -1,5 +1,5 @@
 # Local
-from bel.schemas.bel import AssertionStr, BelEntity, NsVal
+from bel.schemas.bel import AssertionStr, BelEntity, NsVal, resolve_labels
 
 
 def test_assertion_str():
@@ -38,6 +38,28 @@ def test_nsval():
     assert nsval.db_key() == "TEST:_show_me_hi_"
 
 
+def test_nsval_lazy_label():
+    """Label looked up on first access"""
+
+    nsval = NsVal(key="HGNC:391")
+
+    assert nsval.key == "HGNC:391"
+    assert not nsval.has_label()
+
+    assert str(nsval) == "HGNC:391!AKT1"
+    assert nsval.has_label()
+    assert nsval.to_json() == "HGNC:391!AKT1"
+
+    nsvals = [NsVal(key="HGNC:391"), NsVal(key="EG:207"), NsVal(key="HGNC:391", label="Akt1")]
+    resolve_labels(nsvals)
+
+    assert [nsval.key_label for nsval in nsvals] == [
+        "HGNC:391!AKT1",
+        "EG:207!AKT1",
+        "HGNC:391!Akt1",
+    ]
+
+
 def test_entity():
 
     entity = BelEntity("HGNC:AKT1")